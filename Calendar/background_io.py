@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import Callable
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from core_event import CoreEvent
+from instrumentation import tracer
+from schedule_files import write_schedule
+
+
+class FunctionTask(QRunnable):
+    """QRunnable care apeleaza o functie pe un thread din QThreadPool."""
+
+    def __init__(self, fn: Callable[[], None]):
+        super().__init__()
+        # obiectul Python il tine in viata, nu pool-ul
+        self.setAutoDelete(False)
+        self._fn = fn
+
+    def run(self):
+        self._fn()
+
+
+class BackgroundSaver(QObject):
+    """
+    Salveaza un snapshot al evenimentelor pe un thread din QThreadPool, atomic,
+    in formatul ales dupa extensia fisierului (vezi schedule_files.write_schedule).
+
+    Snapshot-ul este un tuple de CoreEvent; evenimentele din store nu sunt modificate
+    pe loc, deci editarile facute in timpul salvarii nu ajung in fisierul scris.
+    """
+
+    # evenimente scrise, evenimente in total
+    progress = Signal(int, int)
+    # calea fisierului salvat
+    finished = Signal(str)
+    failed = Signal(str)
+
+    def __init__(self, events: tuple[CoreEvent, ...], path: str, parent=None):
+        super().__init__(parent)
+        self.events = events
+        self.path = path
+
+    def start(self, pool: QThreadPool | None = None):
+        """Porneste salvarea pe pool (implicit QThreadPool.globalInstance())."""
+        self._task = FunctionTask(self._write)
+        (pool or QThreadPool.globalInstance()).start(self._task)
+
+    def _write(self):
+        # ruleaza pe thread-ul din pool; semnalele ajung in UI prin conexiuni queued
+        try:
+            with tracer.span("save", "io", events=len(self.events)):
+                write_schedule(self.events, self.path, self.progress.emit)
+        except (OSError, ValueError, TypeError, sqlite3.Error) as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(self.path)
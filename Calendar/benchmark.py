@@ -0,0 +1,329 @@
+"""
+Benchmark pentru caile critice ale calendarului, fara fereastra vizibila.
+
+Ruleaza pe calendare sintetice (implicit 1k, 100k si 1M evenimente, cu serii
+recurente dense), masoara pornirea aplicatiei (primul frame, saptamana afisata)
+si scrie rezultatele intr-un fisier JSON, ca sa poata fi comparate intre commit-uri:
+
+    python benchmark.py --output bench-HEAD.json
+    python benchmark.py --sizes 1000 100000 --view model --store columnar
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional
+
+# trebuie setat inainte de crearea QApplication
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import PySide6
+from PySide6.QtCore import QMimeData, QPointF, Qt
+from PySide6.QtGui import QColor, QDragMoveEvent, QDropEvent
+from PySide6.QtWidgets import QApplication
+
+from conflict_planner import plan_conflicts
+from drag_payload import EventDragPayload
+from time_slots import SLOT_SIZES, row_height, slot_rows
+from week_calendar_widget import WeekCalendarWidget
+
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+
+# saptamana masurata: fixa (si in viitor, deci nicio zi nu e dezactivata),
+# ca rezultatele sa nu depinda de ziua rularii
+BENCH_MONDAY = date(2100, 1, 4)
+
+# orele (randurile) ocupate de evenimentele simple, respectiv de serii; in fiecare
+# saptamana evenimentele nu se suprapun, ca intr-un orar construit din UI
+SINGLE_HOURS = range(8, 20)
+SERIES_HOURS = (6, 7, 20, 21, 22)
+# fractiunea de evenimente care sunt serii
+SERIES_FRACTION = 0.02
+
+
+# ---------------- date sintetice ----------------
+
+def synthetic_calendar(size: int, seed: int = 1) -> dict:
+    """
+    Un calendar in formatul export_all_events cu size evenimente.
+
+    Evenimentele simple umplu saptamanile din jurul lui BENCH_MONDAY (intai saptamana
+    masurata, apoi alternativ inainte si inapoi). Seriile sunt lanturi de serii
+    consecutive pe acelasi slot (zi a saptamanii, ora), incepand cu ani in urma; in
+    fiecare slot, ultima serie e activa in saptamana masurata (jumatate "repeat forever").
+    """
+    rnd = random.Random(seed)
+    series_count = int(size * SERIES_FRACTION)
+    events: List[dict] = []
+
+    week = 0
+    while len(events) < size - series_count:
+        monday = BENCH_MONDAY + timedelta(weeks=(week + 1) // 2 * (1 if week % 2 else -1))
+        week += 1
+        for col in range(7):
+            hour = SINGLE_HOURS.start + rnd.randrange(2)
+            while len(events) < size - series_count:
+                ev = _synthetic_event(rnd, f"Eveniment {len(events) % 500}", monday + timedelta(days=col), hour)
+                if hour + ev["duration"] > SINGLE_HOURS.stop:
+                    break
+                events.append(ev)
+                hour += ev["duration"] + rnd.randrange(2)
+
+    slots = [(col, hour) for col in range(7) for hour in SERIES_HOURS]
+    for i, (col, hour) in enumerate(slots):
+        chain_len = series_count // len(slots) + (1 if i < series_count % len(slots) else 0)
+        # lantul se termina in saptamana masurata; se construieste de la coada spre inceput
+        end = BENCH_MONDAY + timedelta(days=col, weeks=1)
+        for k in range(chain_len):
+            weeks = rnd.randint(1, 20)
+            start = end - timedelta(weeks=weeks)
+            ev = _synthetic_event(rnd, f"Serie {i}", start, hour)
+            ev["duration"] = 1
+            if k == 0 and i % 2:
+                ev["repeat_forever"] = True
+            else:
+                ev["repeat_count"] = weeks
+            events.append(ev)
+            end = start
+
+    rnd.shuffle(events)
+    return {"events": events}
+
+
+def _synthetic_event(rnd: random.Random, title: str, day: date, hour: int) -> dict:
+    return {
+        "title": title,
+        "hour": hour,
+        "duration": rnd.choice((1, 1, 1, 2, 2, 3)),
+        "color": (rnd.randint(100, 255), rnd.randint(100, 255), rnd.randint(100, 255)),
+        "description": "",
+        "locked": False,
+        "repeat_count": 1,
+        "repeat_forever": False,
+        "date": day.isoformat(),
+    }
+
+
+# ---------------- masurare ----------------
+
+def measure(
+    fn: Callable[[], object],
+    repeat: int,
+    setup: Optional[Callable[[], None]] = None,
+    calls: int = 1,
+) -> Dict[str, float]:
+    """
+    Ruleaza fn de repeat ori (setup inainte de fiecare rulare, nemasurat).
+    calls = de cate ori apeleaza fn operatia masurata (timpii sunt raportati pe apel).
+    """
+    samples: List[float] = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000.0 / calls)
+    return {
+        "min_ms": min(samples),
+        "median_ms": statistics.median(samples),
+        "mean_ms": statistics.fmean(samples),
+        "max_ms": max(samples),
+        "repeat": repeat,
+        "calls": calls,
+    }
+
+
+# ---------------- benchmark-uri ----------------
+
+def run_size(
+    app: QApplication, size: int, repeat: int, view_mode: str, store_backend: str, slot_minutes: int = 60
+) -> dict:
+    """Toate masuratorile pentru un calendar de size evenimente."""
+    data = synthetic_calendar(size)
+    widget = WeekCalendarWidget(
+        start_monday=BENCH_MONDAY, view_mode=view_mode, store_backend=store_backend, slot_minutes=slot_minutes
+    )
+    # destul de inalt ca toate randurile sa fie vizibile (dropEvent cauta randul dupa pozitie)
+    widget.resize(920, max(1400, slot_rows(slot_minutes) * row_height(slot_minutes) + 400))
+    widget.show()
+    app.processEvents()
+    table = widget.table
+    # rezolvarea conflictelor se masoara fara dialogul modal de confirmare
+    table._confirm_conflicts = lambda title, conflicts: True
+
+    def reload_week():
+        table.take_changes()
+        widget._load_current_week()
+
+    def mark_week_changed():
+        reload_week()
+        for ev in list(table.events_by_pos.values()):
+            if not ev.is_generated:
+                table._mark_changed(ev)
+
+    def cold_load():
+        widget._layout_cache.clear()
+
+    cells = [(row, col) for col in range(table.columnCount()) for row in range(table.rowCount())]
+
+    def find_overlaps():
+        for row, col in cells:
+            table._find_overlaps(row, 3, col)
+
+    def nearest_blocking():
+        for row, col in cells:
+            table._nearest_blocking_event(row, min(row + 6, table.rowCount() - 1), col, "bottom")
+            table._nearest_blocking_event(max(0, row - 6), row, col, "top")
+
+    # intervalele (start, durata) ale fiecarei coloane, pentru planificatorul de conflicte
+    columns: Dict[int, list] = {}
+
+    def collect_columns():
+        columns.clear()
+        for ev in table.events_by_pos.values():
+            columns.setdefault(ev.day_col, []).append((ev.start_row, ev.duration))
+        for intervals in columns.values():
+            intervals.sort()
+
+    def plan_all_cells():
+        # planificatorul singur (fara Qt): un interval nou de 6 randuri pe fiecare celula
+        for row, col in cells:
+            plan_conflicts(columns.get(col, ()), row, row + 5)
+
+    def drop_point(row: int, col: int) -> QPointF:
+        return QPointF(table.columnViewportPosition(col) + 10, table.rowViewportPosition(row) + 5)
+
+    def drop_with_conflicts():
+        for col in range(table.columnCount()):
+            mime = QMimeData()
+            mime.setText("6|Drop")
+            mime.setColorData(QColor(1, 2, 3))
+            table.dropEvent(QDropEvent(drop_point(10, col), Qt.MoveAction, mime, Qt.LeftButton, Qt.NoModifier))
+
+    hover_mime = EventDragPayload(title="Drop", duration=6, rgb=0x010203).to_mime()
+
+    def drag_hover():
+        # fiecare celula de doua ori: a doua miscare in aceeasi celula foloseste planul calculat
+        table._clear_drop_preview()
+        for row, col in cells:
+            for dy in (0, 1):
+                point = drop_point(row, col) + QPointF(0, dy)
+                table.dragMoveEvent(
+                    QDragMoveEvent(point.toPoint(), Qt.MoveAction, hover_mime, Qt.LeftButton, Qt.NoModifier)
+                )
+        table._clear_drop_preview()
+
+    results: Dict[str, dict] = {}
+    results["load_all_events"] = measure(lambda: widget.load_all_events(data), repeat)
+    widget.load_all_events(data)
+    app.processEvents()
+
+    results["export_all_events"] = measure(widget.export_all_events, repeat)
+    results["_load_current_week"] = measure(widget._load_current_week, repeat, setup=cold_load)
+    results["_load_current_week_cached"] = measure(widget._load_current_week, repeat)
+    results["_store_current_week"] = measure(widget._store_current_week, repeat, setup=mark_week_changed)
+    reload_week()
+    results["_find_overlaps"] = measure(find_overlaps, repeat, calls=len(cells))
+    results["_nearest_blocking_event"] = measure(nearest_blocking, repeat, calls=2 * len(cells))
+    results["reset_table"] = measure(table.reset_table, repeat, setup=reload_week)
+    results["plan_conflicts"] = measure(plan_all_cells, repeat, setup=collect_columns, calls=len(cells))
+    results["dragMoveEvent"] = measure(drag_hover, repeat, calls=2 * len(cells))
+    results["dropEvent_conflicts"] = measure(
+        drop_with_conflicts, repeat, setup=reload_week, calls=table.columnCount()
+    )
+    reload_week()
+
+    results["week_events"] = len(table.events_by_pos)
+    widget.close()
+    widget.deleteLater()
+    app.processEvents()
+    return results
+
+
+def measure_startup(repeat: int) -> Dict[str, dict]:
+    """Timpii de pornire ai aplicatiei (main.py, proces nou la fiecare rulare): primul frame si saptamana afisata."""
+    env = dict(os.environ, CALENDAR_STARTUP_TIME="exit")
+    main_py = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+    samples: Dict[str, List[float]] = {}
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, main_py], env=env, capture_output=True, text=True, check=True, timeout=60
+        )
+        timings = json.loads(out.stdout.strip().splitlines()[-1])
+        for name, value in timings.items():
+            samples.setdefault(name, []).append(value)
+    return {
+        f"{name}_ms": {"min": min(values), "median": statistics.median(values), "max": max(values)}
+        for name, values in samples.items()
+    }
+
+
+def git_revision() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark pentru caile critice ale calendarului.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="numarul de evenimente al calendarelor sintetice")
+    parser.add_argument("--repeat", type=int, default=5, help="rulari pentru fiecare masuratoare")
+    parser.add_argument("--view", default="table", choices=("table", "model", "painted"))
+    parser.add_argument("--store", default="dict", choices=("dict", "columnar", "sqlite"))
+    parser.add_argument("--slot", type=int, default=60, choices=SLOT_SIZES, help="minutele unui rand din tabel")
+    parser.add_argument("--output", default="benchmark-results.json", help="fisierul JSON cu rezultatele")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pyside": PySide6.__version__,
+            "platform": platform.platform(),
+            "qpa": os.environ.get("QT_QPA_PLATFORM"),
+            "view": args.view,
+            "store": args.store,
+            "slot_minutes": args.slot,
+            "repeat": args.repeat,
+        },
+        "results": {},
+    }
+    print("pornire...", flush=True)
+    report["startup"] = measure_startup(args.repeat)
+    for name, stats in report["startup"].items():
+        print(f"  {name:28} {stats['median']:10.3f} ms")
+
+    for size in args.sizes:
+        print(f"{size} evenimente...", flush=True)
+        results = run_size(app, size, args.repeat, args.view, args.store, args.slot)
+        report["results"][str(size)] = results
+        for name, stats in results.items():
+            if isinstance(stats, dict):
+                print(f"  {name:28} {stats['median_ms']:10.3f} ms")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=4)
+    print(f"Rezultate scrise in {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
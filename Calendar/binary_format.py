@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import struct
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional
+
+from core_event import CoreEvent
+
+# Formatul binar al orarului (.calb), versiunea 1, little-endian:
+#
+#   header      HEADER
+#   week index  WEEK_ENTRY * week_count    (doar saptamanile cu evenimente, sortate)
+#   singles     RECORD * single_count      (evenimente fara repetare, sortate dupa zi)
+#   series      RECORD * series_count      (serii finite si "repeat forever")
+#   strings     uint32 * (string_count + 1) offset-uri, apoi textele UTF-8 lipite
+#
+# Titlurile si descrierile sunt id-uri in tabelul de string-uri, deci un titlu
+# repetat de mii de ori apare o singura data in fisier.
+
+MAGIC = b"CALB"
+VERSION = 1
+
+# magic, versiune, rezervat, single_count, series_count, week_count, string_count,
+# offset week index, offset singles, offset series, offset strings
+HEADER = struct.Struct("<4sHHIIIIQQQQ")
+# zi (ordinal), start (minute), durata (minute), culoare 0xRRGGBB, repeat_count, id titlu, id descriere, flags
+RECORD = struct.Struct("<iHHIIIIB")
+# saptamana ((zi - 1) // 7), primul record din singles, numar de record-uri
+WEEK_ENTRY = struct.Struct("<iII")
+
+# cat de des (in evenimente) raporteaza scrierea progresul
+PROGRESS_EVERY = 5000
+
+
+def write_schedule_binary(
+    events: Iterable[CoreEvent],
+    f: BinaryIO,
+    progress: Optional[Callable[[int, int], None]] = None,
+):
+    """Scrie evenimentele in formatul .calb in fisierul (binar) f."""
+    singles: List[CoreEvent] = []
+    series: List[CoreEvent] = []
+    for ev in events:
+        (series if ev.is_repeating else singles).append(ev)
+    singles.sort(key=lambda ev: ev.day)
+    series.sort(key=lambda ev: ev.day)
+    total = len(singles) + len(series)
+
+    string_ids: Dict[str, int] = {}
+    blobs: List[bytes] = []
+
+    def string_id(text: str) -> int:
+        sid = string_ids.get(text)
+        if sid is None:
+            sid = string_ids[text] = len(blobs)
+            blobs.append(text.encode("utf-8"))
+        return sid
+
+    records = bytearray()
+    weeks: List[list] = []
+    for i, ev in enumerate(singles + series):
+        if i < len(singles):
+            week = (ev.day - 1) // 7
+            if weeks and weeks[-1][0] == week:
+                weeks[-1][2] += 1
+            else:
+                weeks.append([week, i, 1])
+        records += RECORD.pack(
+            ev.day, ev.start_minute, ev.duration_minutes, ev.rgb, ev.repeat_count,
+            string_id(ev.title), string_id(ev.description), ev.flags,
+        )
+        if progress is not None and (i + 1) % PROGRESS_EVERY == 0:
+            progress(i + 1, total)
+
+    week_index_offset = HEADER.size
+    singles_offset = week_index_offset + WEEK_ENTRY.size * len(weeks)
+    series_offset = singles_offset + RECORD.size * len(singles)
+    strings_offset = series_offset + RECORD.size * len(series)
+
+    string_offsets = [0]
+    for blob in blobs:
+        string_offsets.append(string_offsets[-1] + len(blob))
+
+    f.write(HEADER.pack(
+        MAGIC, VERSION, 0, len(singles), len(series), len(weeks), len(blobs),
+        week_index_offset, singles_offset, series_offset, strings_offset,
+    ))
+    for week, first, count in weeks:
+        f.write(WEEK_ENTRY.pack(week, first, count))
+    f.write(records)
+    f.write(struct.pack(f"<{len(string_offsets)}I", *string_offsets))
+    f.write(b"".join(blobs))
+
+
+class BinaryScheduleFile:
+    """
+    Vedere peste continutul unui fisier .calb (bytes sau mmap).
+
+    Deschiderea citeste doar header-ul; record-urile si string-urile sunt decodate
+    la cerere, deci o saptamana se poate citi fara sa se decodeze restul fisierului.
+    """
+
+    def __init__(self, data):
+        if len(data) < HEADER.size:
+            raise ValueError("Fisier .calb invalid: prea scurt")
+        (
+            magic, version, _, self.single_count, self.series_count, self.week_count,
+            self.string_count, self._week_index_offset, self._singles_offset,
+            self._series_offset, self._strings_offset,
+        ) = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError("Fisier .calb invalid: lipseste semnatura CALB")
+        if version != VERSION:
+            raise ValueError(f"Versiune .calb necunoscuta: {version}")
+
+        self._data = data
+        self._blobs_offset = self._strings_offset + 4 * (self.string_count + 1)
+        self._strings: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return self.single_count + self.series_count
+
+    def string(self, sid: int) -> str:
+        text = self._strings.get(sid)
+        if text is None:
+            start, end = struct.unpack_from("<2I", self._data, self._strings_offset + 4 * sid)
+            text = str(self._data[self._blobs_offset + start:self._blobs_offset + end], "utf-8")
+            self._strings[sid] = text
+        return text
+
+    def _records(self, offset: int, first: int, count: int) -> Iterator[CoreEvent]:
+        start = offset + RECORD.size * first
+        string = self.string
+        # view-ul e eliberat la final, altfel un mmap nu mai poate fi inchis
+        with memoryview(self._data) as data:
+            records = RECORD.iter_unpack(data[start:start + RECORD.size * count])
+            for day, start_minute, duration_minutes, rgb, repeat_count, title_id, desc_id, flags in records:
+                yield CoreEvent(
+                    title=string(title_id),
+                    day=day,
+                    start_minute=start_minute,
+                    duration_minutes=duration_minutes,
+                    rgb=rgb,
+                    description=string(desc_id),
+                    repeat_count=repeat_count,
+                    flags=flags,
+                )
+
+    def _week_entry(self, i: int) -> tuple:
+        return WEEK_ENTRY.unpack_from(self._data, self._week_index_offset + WEEK_ENTRY.size * i)
+
+    def singles(self) -> Iterator[CoreEvent]:
+        return self._records(self._singles_offset, 0, self.single_count)
+
+    def series(self) -> Iterator[CoreEvent]:
+        return self._records(self._series_offset, 0, self.series_count)
+
+    def events(self) -> Iterator[CoreEvent]:
+        """Toate evenimentele de baza: intai cele simple, apoi seriile."""
+        yield from self.singles()
+        yield from self.series()
+
+    def week_singles(self, week: int) -> Iterator[CoreEvent]:
+        """Evenimentele fara repetare din saptamana week ((zi - 1) // 7), cautate in week index."""
+        lo, hi = 0, self.week_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._week_entry(mid)[0] < week:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == self.week_count:
+            return iter(())
+        entry_week, first, count = self._week_entry(lo)
+        if entry_week != week:
+            return iter(())
+        return self._records(self._singles_offset, first, count)
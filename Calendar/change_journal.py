@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import Dict, Iterable, List
+
+from core_event import CoreEvent
+
+# sufixele fisierelor de jurnal, puse langa fisierul orarului
+JOURNAL_SUFFIX = ".journal"
+COMPACTING_SUFFIX = ".journal.compacting"
+
+
+class ChangeJournal:
+    """
+    Jurnal append-only pentru autosave, langa fisierul orarului (<orar>.journal).
+
+    Fiecare operatie a userului adauga o linie JSON cu starea completa a
+    evenimentelor de baza din datele atinse: {"dates": {"YYYY-MM-DD": [eveniment, ...]}}.
+    Costul unei salvari depinde deci de operatie, nu de marimea calendarului.
+
+    Inregistrarile sunt idempotente (reaplicarea lor da acelasi rezultat), asa ca
+    replay() poate aplica fara grija si inregistrari deja incluse in fisierul
+    principal, de exemplu dupa o oprire in timpul compactarii.
+    """
+
+    def __init__(self, schedule_path: str):
+        self.schedule_path = schedule_path
+        self.path = schedule_path + JOURNAL_SUFFIX
+        self.compacting_path = schedule_path + COMPACTING_SUFFIX
+        self._f = open(self.path, "ab")
+
+    def close(self):
+        self._f.close()
+
+    @property
+    def size(self) -> int:
+        """Marimea jurnalului curent, in octeti."""
+        return self._f.tell()
+
+    def append(self, dates: Dict[str, List[CoreEvent]]):
+        """Adauga o inregistrare (starea noua a datelor atinse) si o scrie pe disc."""
+        record = {
+            "dates": {
+                dstr: [ev.to_dict(include_date=False) for ev in events]
+                for dstr, events in dates.items()
+            }
+        }
+        self._f.write(json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n")
+        self._f.flush()
+        os.fsync(self._f.fileno())
+
+    def start_compaction(self):
+        """
+        Muta inregistrarile curente in <orar>.journal.compacting si incepe un jurnal gol.
+        Apelat exact cand se ia snapshot-ul scris in fisierul principal.
+        """
+        self._f.close()
+        with open(self.path, "rb") as src, open(self.compacting_path, "ab") as dst:
+            dst.write(src.read())
+            dst.flush()
+            os.fsync(dst.fileno())
+        self._f = open(self.path, "wb")
+
+    def finish_compaction(self):
+        """Fisierul principal contine tot ce era in jurnalul compactat; acesta poate fi sters."""
+        if os.path.exists(self.compacting_path):
+            os.remove(self.compacting_path)
+
+    @staticmethod
+    def discard(schedule_path: str):
+        """Sterge jurnalele de langa schedule_path (ex. cand fisierul este suprascris)."""
+        for path in (schedule_path + COMPACTING_SUFFIX, schedule_path + JOURNAL_SUFFIX):
+            if os.path.exists(path):
+                os.remove(path)
+
+    @staticmethod
+    def records(schedule_path: str) -> Iterable[Dict[str, List[CoreEvent]]]:
+        """Inregistrarile ramase langa schedule_path, in ordine (intai cele in curs de compactare)."""
+        for path in (schedule_path + COMPACTING_SUFFIX, schedule_path + JOURNAL_SUFFIX):
+            if not os.path.exists(path):
+                continue
+            with open(path, "rb") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # ultima linie poate fi incompleta daca aplicatia s-a oprit in timpul scrierii
+                        continue
+                    yield {
+                        dstr: [CoreEvent.from_dict(ev, dstr) for ev in events]
+                        for dstr, events in record.get("dates", {}).items()
+                    }
+
+    @classmethod
+    def replay(cls, schedule_path: str, store) -> int:
+        """Aplica in store jurnalele ramase (recuperare dupa oprire); returneaza numarul de inregistrari."""
+        count = 0
+        with store.batch():
+            for dates in cls.records(schedule_path):
+                for dstr, events in dates.items():
+                    store.pop_date(dstr)
+                    store.add_many(events)
+                count += 1
+        return count
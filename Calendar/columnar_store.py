@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import heapq
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from core_event import CoreEvent
+from event_store import ObservableStore
+from occurrences import Occurrence, iter_occurrences
+
+# (nume coloana, typecode array)
+_COLUMNS = (
+    ("day", "i"),
+    ("start_minute", "i"),
+    ("duration_minutes", "i"),
+    ("rgb", "I"),
+    ("flags", "B"),
+    ("repeat_count", "I"),
+    ("title_id", "I"),
+    ("desc_id", "I"),
+)
+
+
+def _typecode_range(typecode: str) -> Tuple[int, int]:
+    bits = 8 * array(typecode).itemsize
+    if typecode.isupper():
+        return 0, 2 ** bits - 1
+    return -(2 ** (bits - 1)), 2 ** (bits - 1) - 1
+
+
+# valorile permise pentru fiecare coloana (verificate inainte de scriere)
+_RANGES = tuple(_typecode_range(typecode) for _, typecode in _COLUMNS)
+
+
+class _StringTable:
+    """Tabel de string-uri internate: fiecare text distinct este tinut o singura data."""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def intern(self, text: str) -> int:
+        string_id = self._ids.get(text)
+        if string_id is None:
+            string_id = len(self.values)
+            self._ids[text] = string_id
+            self.values.append(text)
+        return string_id
+
+    def clear(self):
+        self._ids.clear()
+        self.values.clear()
+
+
+class _EventColumns:
+    """
+    Un tabel de evenimente tinut pe coloane (array-uri paralele), sortat dupa zi.
+
+    Un rand costa 24 de octeti, fata de cateva sute pentru un obiect Python;
+    CoreEvent-urile sunt construite doar pentru randurile cerute de o interogare.
+    """
+
+    def __init__(self, strings: _StringTable):
+        self._strings = strings
+        for name, typecode in _COLUMNS:
+            setattr(self, name, array(typecode))
+
+    def __len__(self) -> int:
+        return len(self.day)
+
+    @staticmethod
+    def _values(ev: CoreEvent, strings: _StringTable) -> tuple:
+        values = (ev.day, ev.start_minute, ev.duration_minutes, ev.rgb, ev.flags, ev.repeat_count)
+        # un rand nu se scrie pe jumatate: toate valorile sunt verificate inainte
+        for (name, _), (lo, hi), value in zip(_COLUMNS, _RANGES, values):
+            if not lo <= value <= hi:
+                raise ValueError(
+                    f"Evenimentul {ev.title!r}: {name} = {value} in afara intervalului [{lo}, {hi}]"
+                )
+        return values + (strings.intern(ev.title), strings.intern(ev.description))
+
+    def insert(self, ev: CoreEvent):
+        """Insereaza evenimentul pastrand ordinea dupa zi."""
+        pos = bisect_right(self.day, ev.day)
+        for (name, _), value in zip(_COLUMNS, self._values(ev, self._strings)):
+            getattr(self, name).insert(pos, value)
+
+    def append(self, ev: CoreEvent):
+        """Adauga evenimentul la final, fara sa pastreze ordinea (vezi sort())."""
+        for (name, _), value in zip(_COLUMNS, self._values(ev, self._strings)):
+            getattr(self, name).append(value)
+
+    def sort(self):
+        """Reface ordinea dupa zi, dupa o serie de append()."""
+        day = self.day
+        if all(day[i] <= day[i + 1] for i in range(len(day) - 1)):
+            return
+        order = sorted(range(len(day)), key=day.__getitem__)
+        for name, typecode in _COLUMNS:
+            column = getattr(self, name)
+            setattr(self, name, array(typecode, [column[i] for i in order]))
+
+    def delete(self, i: int):
+        for name, _ in _COLUMNS:
+            getattr(self, name).pop(i)
+
+    def day_range(self, first_day: int, last_day: int) -> range:
+        """Indicii randurilor cu first_day <= zi <= last_day."""
+        lo = bisect_left(self.day, first_day)
+        return range(lo, bisect_right(self.day, last_day, lo))
+
+    def find(self, ev: CoreEvent) -> int:
+        """Indicele primului rand egal (camp cu camp) cu ev, sau -1."""
+        string_ids = self._strings._ids
+        for i in self.day_range(ev.day, ev.day):
+            if (
+                self.start_minute[i] == ev.start_minute
+                and self.duration_minutes[i] == ev.duration_minutes
+                and self.rgb[i] == ev.rgb
+                and self.flags[i] == ev.flags
+                and self.repeat_count[i] == ev.repeat_count
+                and self.title_id[i] == string_ids.get(ev.title)
+                and self.desc_id[i] == string_ids.get(ev.description)
+            ):
+                return i
+        return -1
+
+    def event(self, i: int) -> CoreEvent:
+        """Construieste CoreEvent-ul pentru randul i."""
+        values = self._strings.values
+        return CoreEvent(
+            title=values[self.title_id[i]],
+            day=self.day[i],
+            start_minute=self.start_minute[i],
+            duration_minutes=self.duration_minutes[i],
+            rgb=self.rgb[i],
+            description=values[self.desc_id[i]],
+            repeat_count=self.repeat_count[i],
+            flags=self.flags[i],
+        )
+
+    def events(self, rows: Iterable[int]) -> Iterator[CoreEvent]:
+        return (self.event(i) for i in rows)
+
+    def clear(self):
+        for name, typecode in _COLUMNS:
+            setattr(self, name, array(typecode))
+
+
+def _span_bucket(repeat_count: int) -> int:
+    """Bucket-ul unei serii finite: b pentru seriile care tin intre 2**b si 2**(b+1) - 1 saptamani."""
+    return (repeat_count - 1).bit_length() - 1
+
+
+def _bucket_span(bucket: int) -> int:
+    """Cea mai lunga serie (in zile) care poate fi in bucket."""
+    return 7 * (2 ** (bucket + 1) - 1)
+
+
+class ColumnarEventStore(ObservableStore):
+    """
+    Alternativa la EventStore pentru calendare foarte mari (sute de mii / milioane
+    de evenimente), cu aceeasi interfata.
+
+    Evenimentele sunt tinute pe coloane (array-uri tipizate: zi, ora, durata, culoare,
+    flag-uri, repetari + id-uri in tabelul de string-uri), in tabele sortate dupa zi:
+    evenimente simple, serii "repeat forever" si serii finite, cate un tabel pentru fiecare
+    ordin de marime al lungimii (1, 2-3, 4-7, ... saptamani). Interogarile pe interval
+    sunt cautari binare pe coloana de zile (o serie lunga nu lungeste cautarea in cele scurte);
+    obiectele CoreEvent se construiesc doar pentru aparitiile cerute, deci nu se pastreaza
+    in memorie cate un obiect pentru fiecare eveniment.
+
+    Evenimentele returnate sunt copii: remove() cauta randul dupa valori, nu dupa identitate.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._strings = _StringTable()
+        self._single = _EventColumns(self._strings)
+        self._forever = _EventColumns(self._strings)
+        # bucket (vezi _span_bucket) -> seriile finite de lungimea respectiva
+        self._finite: Dict[int, _EventColumns] = {}
+
+    def _table(self, ev: CoreEvent) -> _EventColumns:
+        if ev.repeat_forever:
+            return self._forever
+        if ev.repeat_count > 1:
+            bucket = _span_bucket(ev.repeat_count)
+            table = self._finite.get(bucket)
+            if table is None:
+                table = self._finite[bucket] = _EventColumns(self._strings)
+            return table
+        return self._single
+
+    def _tables(self) -> List[_EventColumns]:
+        return [self._single, *(self._finite[bucket] for bucket in sorted(self._finite)), self._forever]
+
+    # ---------------- modificari ----------------
+
+    def add(self, ev: CoreEvent):
+        """Adauga un eveniment de baza (la data lui, ev.day)."""
+        self._table(ev).insert(ev)
+        self._notify(ev)
+
+    def add_many(self, events: Iterable[CoreEvent]):
+        """
+        Adauga multe evenimente deodata (ex. la Load), cu o singura sortare la final;
+        anunta o singura modificare (None).
+        """
+        for ev in events:
+            self._table(ev).append(ev)
+        for table in self._tables():
+            table.sort()
+        self._notify(None)
+
+    def remove(self, ev: CoreEvent):
+        """Scoate primul eveniment de baza egal cu ev."""
+        table = self._table(ev)
+        i = table.find(ev)
+        if i < 0:
+            return
+        table.delete(i)
+        self._notify(ev)
+
+    def pop_date(self, dstr: str) -> List[CoreEvent]:
+        """Scoate si returneaza toate evenimentele de baza de la data dstr."""
+        day = date.fromisoformat(dstr).toordinal()
+        events: List[CoreEvent] = []
+        for table in self._tables():
+            rows = table.day_range(day, day)
+            events.extend(table.events(rows))
+            for i in reversed(rows):
+                table.delete(i)
+        for ev in events:
+            self._notify(ev)
+        return events
+
+    def clear(self):
+        """Sterge toate evenimentele."""
+        self._single.clear()
+        self._forever.clear()
+        self._finite.clear()
+        self._strings.clear()
+        self._notify(None)
+
+    # ---------------- interogari ----------------
+
+    def events_on(self, dstr: str) -> List[CoreEvent]:
+        """Evenimentele de baza de la data dstr."""
+        day = date.fromisoformat(dstr).toordinal()
+        return [
+            ev
+            for table in self._tables()
+            for ev in table.events(table.day_range(day, day))
+        ]
+
+    def week_occurrences(self, monday: date) -> List[Tuple[int, CoreEvent, int]]:
+        """Aparitiile (coloana, eveniment, k) din saptamana care incepe cu monday."""
+        first = monday.toordinal()
+        last = first + 6
+
+        result: List[Tuple[int, CoreEvent, int]] = []
+        single = self._single
+        for i in single.day_range(first, last):
+            result.append((single.day[i] - first, single.event(i), 0))
+
+        # serii: aparitia din saptamana asta e in aceeasi zi a saptamanii ca data de baza;
+        # intr-un bucket se cauta inapoi doar cat tine cea mai lunga serie din el
+        tables = [(self._finite[bucket], first - _bucket_span(bucket)) for bucket in sorted(self._finite)]
+        tables.append((self._forever, None))
+        for table, first_day in tables:
+            day = table.day
+            lo = 0 if first_day is None else bisect_left(day, first_day)
+            hi = bisect_right(day, last, lo)
+            for i in range(lo, hi):
+                col = (day[i] - 1) % 7
+                k = (first + col - day[i]) // 7
+                if first_day is not None and k >= table.repeat_count[i]:
+                    continue
+                result.append((col, table.event(i), k))
+        return result
+
+    def _events_between(self, first_day: int, last_day: int) -> Iterator[CoreEvent]:
+        """Evenimentele de baza care pot avea aparitii intre first_day si last_day."""
+        return chain(
+            self._single.events(self._single.day_range(first_day, last_day)),
+            *(
+                table.events(table.day_range(first_day - _bucket_span(bucket), last_day))
+                for bucket, table in self._finite.items()
+            ),
+            self._forever.events(range(bisect_right(self._forever.day, last_day))),
+        )
+
+    @property
+    def events_by_date(self) -> Dict[str, List[CoreEvent]]:
+        """Vederea dict ("YYYY-MM-DD" -> evenimente), construita la cerere (costisitor)."""
+        result: Dict[str, List[CoreEvent]] = {}
+        for ev in self:
+            result.setdefault(ev.dstr, []).append(ev)
+        return result
+
+    def __len__(self) -> int:
+        return sum(len(table) for table in self._tables())
+
+    def __iter__(self) -> Iterator[CoreEvent]:
+        """Itereaza toate evenimentele de baza, in ordinea datelor."""
+        return heapq.merge(
+            *(table.events(range(len(table))) for table in self._tables()),
+            key=lambda ev: ev.day,
+        )
+
+    def iter_occurrences(self, start_date: date, end_date: date) -> Iterator[Occurrence]:
+        """Aparitiile dintre start_date si end_date, lazy si in ordine cronologica."""
+        events = self._events_between(start_date.toordinal(), end_date.toordinal())
+        return iter_occurrences(events, start_date, end_date)
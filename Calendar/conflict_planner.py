@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import Iterable, List, NamedTuple, Tuple
+
+# tipurile de operatii dintr-un plan
+SHRINK = "shrink"
+SPLIT = "split"
+REMOVE = "remove"
+
+
+class ConflictOp(NamedTuple):
+    """
+    O operatie asupra unui interval din coloana, identificat prin pozitia lui in lista data planificatorului.
+
+      - SHRINK: intervalul devine [start, start + duration)
+      - SPLIT: intervalul devine [start, start + duration), iar restul de jos e un interval
+        nou [tail_start, tail_start + tail_duration)
+      - REMOVE: intervalul dispare
+    """
+    kind: str
+    index: int
+    start: int = 0
+    duration: int = 0
+    tail_start: int = 0
+    tail_duration: int = 0
+
+
+def plan_conflicts(intervals: Iterable[Tuple[int, int]], new_start: int, new_end: int) -> List[ConflictOp]:
+    """
+    Planul care elibereaza randurile [new_start, new_end] pe o coloana.
+
+    intervals = (start_row, duration) pentru evenimentele coloanei (de regula doar cele
+    care se suprapun, ordonate de sus in jos); operatiile sunt intoarse in aceeasi ordine.
+    Intervalele care nu se suprapun cu [new_start, new_end] nu primesc nicio operatie.
+    Fara Qt: se poate rula si masura fara display.
+    """
+    ops: List[ConflictOp] = []
+    for index, (ev_start, duration) in enumerate(intervals):
+        ev_end = ev_start + duration - 1
+        if ev_end < new_start or ev_start > new_end:
+            continue
+
+        if new_start > ev_start and new_end < ev_end:
+            # intervalul nou e in mijloc: ramane partea de sus, iar cea de jos devine un interval nou
+            ops.append(ConflictOp(SPLIT, index, ev_start, new_start - ev_start, new_end + 1, ev_end - new_end))
+        elif new_start <= ev_start and new_end >= ev_end:
+            ops.append(ConflictOp(REMOVE, index))
+        elif ev_start >= new_start:
+            # acoperit sus: incepe dupa intervalul nou
+            ops.append(ConflictOp(SHRINK, index, new_end + 1, ev_end - new_end))
+        else:
+            # acoperit jos: se termina inainte de intervalul nou
+            ops.append(ConflictOp(SHRINK, index, ev_start, new_start - ev_start))
+    return ops
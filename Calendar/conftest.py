@@ -0,0 +1,63 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from datetime import date
+
+import pytest
+from PySide6.QtCore import QCoreApplication, QEvent, QPointF, Qt
+from PySide6.QtGui import QDropEvent
+from PySide6.QtWidgets import QApplication
+
+from drag_payload import EventDragPayload
+from week_calendar_widget import WeekCalendarWidget
+
+# saptamana folosita de teste (in viitor, deci nicio zi nu e dezactivata)
+MONDAY = date(2100, 1, 4)
+
+
+@pytest.fixture(scope="session")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def make_widget(app):
+    """
+    Creeaza un WeekCalendarWidget pe saptamana MONDAY, incarcat cu evenimentele date
+    (dict-uri JSON; fara "date" sunt puse luni). Widget-urile sunt inchise la final.
+    """
+    widgets = []
+
+    def make(events=(), **kwargs):
+        w = WeekCalendarWidget(start_monday=MONDAY, **kwargs)
+        # destul de inalt ca toate randurile sa fie vizibile (drop-ul cauta randul dupa pozitie)
+        w.resize(920, 1400)
+        w.show()
+        app.processEvents()
+        if events:
+            w.load_all_events({"events": [{"date": MONDAY.isoformat(), **ev} for ev in events]})
+        widgets.append(w)
+        return w
+
+    yield make
+    for w in widgets:
+        w.close()
+        w.deleteLater()
+    # sterge widget-urile (si obiectele lor din fundal) inainte de testul urmator
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+
+@pytest.fixture
+def drop():
+    """drop(table, ev, row, col): trage evenimentul ev din tabel si il lasa pe celula (row, col)."""
+
+    def drop_event(table, ev, row, col):
+        table._dragging_src = (ev.start_row, ev.day_col)
+        mime = EventDragPayload.for_event(ev).to_mime()
+        pos = QPointF(table.columnViewportPosition(col) + 10, table.rowViewportPosition(row) + 5)
+        event = QDropEvent(pos, Qt.MoveAction, mime, Qt.LeftButton, Qt.NoModifier)
+        table.dropEvent(event)
+        return event.isAccepted()
+
+    return drop_event
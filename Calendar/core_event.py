@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import sys
+from datetime import date
+from typing import Tuple
+
+# bitii din CoreEvent.flags
+FLAG_LOCKED = 1
+FLAG_REPEAT_FOREVER = 2
+FLAG_GENERATED = 4
+
+DEFAULT_RGB = 0xFFFF00  # galben, culoarea implicita din formatul JSON
+
+MINUTES_PER_HOUR = 60
+MINUTES_PER_DAY = 24 * MINUTES_PER_HOUR
+
+
+def pack_rgb(r: int, g: int, b: int) -> int:
+    """Impacheteaza o culoare (r, g, b) intr-un singur int pe 24 de biti (0xRRGGBB)."""
+    return ((r & 0xFF) << 16) | ((g & 0xFF) << 8) | (b & 0xFF)
+
+
+def unpack_rgb(rgb: int) -> Tuple[int, int, int]:
+    """Inversul lui pack_rgb."""
+    return (rgb >> 16) & 0xFF, (rgb >> 8) & 0xFF, rgb & 0xFF
+
+
+class CoreEvent:
+    """
+    Eveniment de baza din store, compact si fara dependente Qt.
+
+    Foloseste __slots__, culoarea e impachetata intr-un int (0xRRGGBB), iar
+    locked / repeat_forever / is_generated sunt biti in flags. Ziua este
+    ordinalul datei (date.toordinal()), iar ora de start si durata sunt in minute
+    (independent de marimea slot-urilor din tabel). Titlurile sunt internate, deci
+    evenimentele repetate cu acelasi titlu impart acelasi string.
+
+    Instantele din store nu se modifica pe loc: o editare inlocuieste evenimentul.
+    """
+
+    __slots__ = ("title", "description", "day", "start_minute", "duration_minutes", "rgb", "repeat_count", "flags")
+
+    def __init__(
+        self,
+        title: str,
+        day: int,
+        start_minute: int,
+        duration_minutes: int = MINUTES_PER_HOUR,
+        rgb: int = DEFAULT_RGB,
+        description: str = "",
+        repeat_count: int = 1,
+        flags: int = 0,
+    ):
+        self.title = sys.intern(title)
+        self.description = description
+        self.day = day
+        self.start_minute = start_minute
+        self.duration_minutes = duration_minutes
+        self.rgb = rgb
+        self.repeat_count = repeat_count
+        self.flags = flags
+
+    # ---------------- flag-uri ----------------
+
+    @property
+    def locked(self) -> bool:
+        return bool(self.flags & FLAG_LOCKED)
+
+    @property
+    def repeat_forever(self) -> bool:
+        return bool(self.flags & FLAG_REPEAT_FOREVER)
+
+    @property
+    def is_generated(self) -> bool:
+        return bool(self.flags & FLAG_GENERATED)
+
+    @property
+    def is_repeating(self) -> bool:
+        """True pentru serii (repeat forever sau mai mult de o aparitie)."""
+        return self.repeat_forever or self.repeat_count > 1
+
+    def active_between(self, first_day: int, last_day: int) -> bool:
+        """True daca seria poate avea aparitii intre zilele (ordinale) first_day si last_day."""
+        if self.day > last_day:
+            return False
+        if self.repeat_forever:
+            return True
+        return self.day + 7 * (max(1, self.repeat_count) - 1) >= first_day
+
+    @staticmethod
+    def make_flags(locked: bool = False, repeat_forever: bool = False, is_generated: bool = False) -> int:
+        """Construieste campul flags din valorile booleene."""
+        return (
+            (FLAG_LOCKED if locked else 0)
+            | (FLAG_REPEAT_FOREVER if repeat_forever else 0)
+            | (FLAG_GENERATED if is_generated else 0)
+        )
+
+    # ---------------- data / ora / culoare ----------------
+
+    @property
+    def hour(self) -> int:
+        """Ora (intreaga) la care incepe evenimentul."""
+        return self.start_minute // MINUTES_PER_HOUR
+
+    @property
+    def date(self) -> date:
+        return date.fromordinal(self.day)
+
+    @property
+    def dstr(self) -> str:
+        """Data in formatul "YYYY-MM-DD" (cheia din events_by_date)."""
+        return date.fromordinal(self.day).isoformat()
+
+    @property
+    def color(self) -> Tuple[int, int, int]:
+        return unpack_rgb(self.rgb)
+
+    # ---------------- conversii dict (formatul JSON) ----------------
+
+    # "hour" si "duration" sunt in ore (formatul original); evenimentele care nu incep
+    # sau nu se termina la ora fixa au in plus "start_minute" si "duration_minutes"
+    # (ignorate de versiunile vechi, care folosesc valorile rotunjite la ore)
+
+    @classmethod
+    def from_dict(cls, d: dict, dstr: str | None = None) -> "CoreEvent":
+        """Construieste un eveniment din schema dict / JSON (data din dstr sau din cheia "date")."""
+        dstr = dstr or d["date"]
+        start_minute = d.get("start_minute")
+        if start_minute is None:
+            start_minute = d.get("hour", 0) * MINUTES_PER_HOUR
+        duration_minutes = d.get("duration_minutes")
+        if duration_minutes is None:
+            duration_minutes = d.get("duration", 1) * MINUTES_PER_HOUR
+        return cls(
+            title=d.get("title", ""),
+            day=date.fromisoformat(dstr).toordinal(),
+            start_minute=start_minute,
+            duration_minutes=duration_minutes,
+            rgb=pack_rgb(*d.get("color", (255, 255, 0))),
+            description=d.get("description", ""),
+            repeat_count=max(1, d.get("repeat_count", 1)),
+            flags=cls.make_flags(d.get("locked", False), d.get("repeat_forever", False)),
+        )
+
+    def to_dict(self, include_date: bool = True) -> dict:
+        """Converteste inapoi in schema dict / JSON folosita de export_all_events."""
+        d = {
+            "title": self.title,
+            "hour": self.hour,
+            "duration": max(1, -(-self.duration_minutes // MINUTES_PER_HOUR)),
+            "color": self.color,
+            "description": self.description,
+            "locked": self.locked,
+            "repeat_count": self.repeat_count,
+            "repeat_forever": self.repeat_forever,
+        }
+        if self.start_minute % MINUTES_PER_HOUR or self.duration_minutes % MINUTES_PER_HOUR:
+            d["start_minute"] = self.start_minute
+            d["duration_minutes"] = self.duration_minutes
+        if include_date:
+            d["date"] = self.dstr
+        return d
+
+    def __repr__(self) -> str:
+        return (
+            f"CoreEvent({self.title!r}, {self.dstr}, start_minute={self.start_minute},"
+            f" duration_minutes={self.duration_minutes})"
+        )
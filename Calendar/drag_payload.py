@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from PySide6.QtCore import QByteArray, QMimeData
+from PySide6.QtGui import QColor
+
+from models import CalendarEvent
+
+# tipul MIME al payload-ului; text/plain ("span|titlu") si colorData raman pentru alte tinte
+EVENT_MIME_TYPE = "application/x-calendar-event"
+
+
+@dataclass(frozen=True)
+class EventDragPayload:
+    """
+    Continutul unui drag de eveniment: identitatea evenimentului sursa (proces, id(ev),
+    pozitia lui) si ce e nevoie pentru a crea unul nou (titlu, durata, culoare).
+
+    Un payload fara identitate (event_id None) vine din textul vechi "span|titlu".
+    """
+
+    title: str
+    duration: int = 1
+    rgb: Optional[int] = None
+    pid: Optional[int] = None
+    event_id: Optional[int] = None
+    source_row: int = -1
+    source_col: int = -1
+
+    @classmethod
+    def for_event(cls, ev: CalendarEvent) -> "EventDragPayload":
+        return cls(
+            title=ev.title,
+            duration=max(1, ev.duration),
+            rgb=ev.color.rgb() & 0xFFFFFF,
+            pid=os.getpid(),
+            event_id=id(ev),
+            source_row=ev.start_row,
+            source_col=ev.day_col,
+        )
+
+    def to_mime(self) -> QMimeData:
+        mime = QMimeData()
+        mime.setData(EVENT_MIME_TYPE, QByteArray(json.dumps(asdict(self)).encode("utf-8")))
+        mime.setText(f"{self.duration}|{self.title}")
+        if self.rgb is not None:
+            mime.setColorData(self.color)
+        return mime
+
+    @classmethod
+    def from_mime(cls, mime: QMimeData) -> "EventDragPayload":
+        """Citeste payload-ul tipizat sau, daca lipseste, textul "span|titlu" si colorData."""
+        if mime.hasFormat(EVENT_MIME_TYPE):
+            try:
+                return cls(**json.loads(bytes(mime.data(EVENT_MIME_TYPE)).decode("utf-8")))
+            except (ValueError, TypeError):
+                pass
+
+        raw_text = mime.text() or ""
+        title, duration = raw_text, 1
+        if "|" in raw_text:
+            span_str, text = raw_text.split("|", 1)
+            try:
+                title, duration = text, max(1, int(span_str))
+            except ValueError:
+                pass
+        color = mime.colorData()
+        rgb = color.rgb() & 0xFFFFFF if isinstance(color, QColor) and color.isValid() else None
+        return cls(title=title, duration=duration, rgb=rgb)
+
+    @property
+    def color(self) -> Optional[QColor]:
+        return QColor(self.rgb) if self.rgb is not None else None
+
+    def source_event(self, events_by_pos) -> Optional[CalendarEvent]:
+        """Evenimentul sursa, daca drag-ul a pornit din acest proces si din acest tabel."""
+        if self.event_id is None or self.pid != os.getpid():
+            return None
+        ev = events_by_pos.get((self.source_row, self.source_col))
+        return ev if ev is not None and id(ev) == self.event_id else None
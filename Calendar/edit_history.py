@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import sys
+from collections import deque
+from typing import Deque, Hashable, List, Optional, Sequence, Tuple
+
+# tipurile de delta; o delta e un tuplu mic, fara referinte la evenimentele din tabel:
+#   (DELTA_ADD, col, row, fields)       evenimentul fields a aparut la (row, col)
+#   (DELTA_REMOVE, col, row, fields)    evenimentul fields de la (row, col) a disparut
+#   (DELTA_MOVE, col, old_geometry, new_geometry)
+#   (DELTA_EDIT, col, row, old_attrs, new_attrs)
+# geometry = (start_row, duration, start_offset, end_offset)
+# fields = (title, duration, rgb, description, locked, repeat_count, repeat_forever, is_generated,
+#           start_offset, end_offset)
+# attrs = (title, description, locked, repeat_count, repeat_forever)
+DELTA_ADD = 0
+DELTA_REMOVE = 1
+DELTA_MOVE = 2
+DELTA_EDIT = 3
+
+Delta = Tuple
+
+
+def invert(delta: Delta) -> Delta:
+    """Delta care anuleaza delta data."""
+    kind = delta[0]
+    if kind == DELTA_ADD:
+        return (DELTA_REMOVE,) + delta[1:]
+    if kind == DELTA_REMOVE:
+        return (DELTA_ADD,) + delta[1:]
+    if kind == DELTA_MOVE:
+        _, col, old_geometry, new_geometry = delta
+        return (DELTA_MOVE, col, new_geometry, old_geometry)
+    _, col, row, old_attrs, new_attrs = delta
+    return (DELTA_EDIT, col, row, new_attrs, old_attrs)
+
+
+def append_delta(deltas: List[Delta], delta: Delta):
+    """
+    Adauga delta la o comanda in curs. Mutarile succesive ale aceluiasi eveniment
+    (ex. un resize fara preview, rand cu rand) sunt comasate intr-o singura delta de mutare.
+    """
+    if delta[0] == DELTA_MOVE and deltas:
+        last = deltas[-1]
+        if last[0] == DELTA_MOVE and last[1] == delta[1] and last[3] == delta[2]:
+            merged = (DELTA_MOVE, last[1], last[2], delta[3])
+            if merged[2] == merged[3]:
+                deltas.pop()
+            else:
+                deltas[-1] = merged
+            return
+    deltas.append(delta)
+
+
+def _size_of(value) -> int:
+    size = sys.getsizeof(value)
+    if isinstance(value, tuple):
+        size += sum(_size_of(item) for item in value)
+    return size
+
+
+class EditCommand:
+    """
+    O operatie a userului (drop, resize, editare, creare) = lista ordonata de delte.
+    key identifica saptamana pe care se aplica (history_key al tabelului).
+    """
+
+    __slots__ = ("label", "key", "deltas", "size")
+
+    def __init__(self, label: str, key: Hashable, deltas: Sequence[Delta]):
+        self.label = label
+        self.key = key
+        self.deltas = tuple(deltas)
+        self.size = _size_of(self.deltas) + sys.getsizeof(label) + 64
+
+    def undo_deltas(self) -> List[Delta]:
+        """Deltele care anuleaza comanda, in ordinea aplicarii."""
+        return [invert(delta) for delta in reversed(self.deltas)]
+
+
+class EditHistory:
+    """
+    Stivele de undo / redo, marginite la max_bytes (estimat din dimensiunea deltelor):
+    cand se depaseste, sunt uitate cele mai vechi comenzi. Comenzile nu pastreaza
+    evenimente sau copii ale store-ului, deci memoria nu creste cu calendarul.
+    """
+
+    def __init__(self, max_bytes: int = 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._undo: Deque[EditCommand] = deque()
+        self._redo: List[EditCommand] = []
+        self._bytes = 0
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._undo)
+
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def next_undo(self) -> Optional[EditCommand]:
+        return self._undo[-1] if self._undo else None
+
+    def next_redo(self) -> Optional[EditCommand]:
+        return self._redo[-1] if self._redo else None
+
+    def push(self, command: EditCommand):
+        """Adauga o comanda noua (redo-ul existent devine invalid)."""
+        for old in self._redo:
+            self._bytes -= old.size
+        self._redo.clear()
+        self._undo.append(command)
+        self._bytes += command.size
+        self._evict()
+
+    def pop_undo(self) -> Optional[EditCommand]:
+        """Scoate ultima comanda (care va fi anulata) si o muta pe stiva de redo."""
+        if not self._undo:
+            return None
+        command = self._undo.pop()
+        self._redo.append(command)
+        return command
+
+    def pop_redo(self) -> Optional[EditCommand]:
+        """Scoate ultima comanda anulata (care va fi refacuta) si o muta inapoi pe stiva de undo."""
+        if not self._redo:
+            return None
+        command = self._redo.pop()
+        self._undo.append(command)
+        return command
+
+    def clear(self):
+        self._undo.clear()
+        self._redo.clear()
+        self._bytes = 0
+
+    def _evict(self):
+        # cele mai vechi comenzi primele; ultima comanda ramane chiar daca depaseste singura limita
+        while self._bytes > self.max_bytes and len(self._undo) > 1:
+            self._bytes -= self._undo.popleft().size
@@ -21,77 +21,15 @@ class EventEditDialog(QDialog):
         self.setWindowTitle("Event details")
         self.setMinimumWidth(420)
 
-        # Stilizare generala (poti ajusta culorile dupa gust)
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #222831;
-                color: #f5f5f5;
-            }
-            QDialog QWidget {
-                background-color: #393e46;
-                color: #f5f5f5;
-            }
-            QLabel {
-                font-size: 13px;
-            }
-            QLabel#TimeLabel {
-                font-weight: bold;
-                color: #00adb5;
-                font-size: 14px;
-            }
-            QLabel#SectionTitle {
-                font-weight: bold;
-                margin-top: 8px;
-                font-size: 13px;
-            }
-            QLineEdit, QTextEdit {
-                background-color: #393e46;
-                border: 1px solid #4b4f57;
-                border-radius: 6px;
-                padding: 6px;
-                font-size: 13px;
-                color: #f5f5f5;
-            }
-            QLineEdit:focus, QTextEdit:focus {
-                border: 1px solid #00adb5;
-            }
-            QCheckBox {
-                font-size: 12px;
-                margin-top: 6px;
-            }
-            QDialogButtonBox QPushButton {
-                background-color: #00adb5;
-                color: #ffffff;
-                border-radius: 6px;
-                padding: 6px 14px;
-                font-size: 13px;
-            }
-            QDialogButtonBox QPushButton:hover {
-                background-color: #01c3cd;
-            }
-            QDialogButtonBox QPushButton:disabled {
-                background-color: #444;
-            }
-            QFrame {
-                background-color: #393e46;
-                color: #393e46;
-            }
-            QFrame[frameShape="4"] {  /* 4 = HLine */
-                background-color: #393e46;
-                max-height: 1px;
-            }
-            
-        """)
-
-        self.title_edit = QLineEdit(title)
+        # stilul vine din tema aplicatiei (theme.APP_DARK_STYLE, regulile EventEditDialog),
+        # parsata o singura data; dialogul e refolosit (vezi reset)
+        self.title_edit = QLineEdit()
         self.title_edit.setPlaceholderText("Event title…")
 
         self.desc_edit = QTextEdit()
-        self.desc_edit.setPlainText(description)
         self.desc_edit.setPlaceholderText("Description, notes, attendees…")
 
         self.lock_check = QCheckBox("Locked (cannot be moved or overlapped)")
-        self.lock_check.setChecked(locked)
 
         self.repeat_spin = QSpinBox()
         self.repeat_spin.setRange(1, 100)
@@ -116,17 +54,16 @@ class EventEditDialog(QDialog):
         main_layout.addLayout(repeat_layout)
 
         # ===== Header cu info de timp =====
-        if time_info:
-            header_layout = QHBoxLayout()
-            header_layout.setSpacing(6)
+        header_layout = QHBoxLayout()
+        header_layout.setSpacing(6)
 
-            time_label = QLabel(time_info)
-            time_label.setObjectName("TimeLabel")
+        self.time_label = QLabel()
+        self.time_label.setObjectName("TimeLabel")
 
-            header_layout.addWidget(time_label)
-            header_layout.addStretch()
+        header_layout.addWidget(self.time_label)
+        header_layout.addStretch()
 
-            main_layout.addLayout(header_layout)
+        main_layout.addLayout(header_layout)
 
         # Linie separator
         line_top = QFrame()
@@ -172,6 +109,27 @@ class EventEditDialog(QDialog):
         main_layout.addWidget(buttons, alignment=Qt.AlignRight)
 
         self.setLayout(main_layout)
+        self.reset(title, description, locked, time_info)
+
+    def reset(
+        self,
+        title: str = "",
+        description: str = "",
+        locked: bool = False,
+        time_info: str | None = None,
+        repeat_count: int = 1,
+        repeat_forever: bool = False,
+    ):
+        """Reincarca dialogul cu valorile unui eveniment (sau goale, pentru unul nou)."""
+        self.title_edit.setText(title)
+        self.desc_edit.setPlainText(description)
+        self.lock_check.setChecked(locked)
+        self.repeat_spin.setValue(repeat_count or 1)
+        self.repeat_forever_check.setChecked(repeat_forever)
+        self.repeat_spin.setEnabled(not repeat_forever)
+        self.time_label.setText(time_info or "")
+        self.time_label.setVisible(bool(time_info))
+        self.title_edit.setFocus()
 
     def _validate_title(self):
         """Nu permite OK daca titlul este gol."""
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from models import CalendarEvent
+
+
+class ColumnIntervalIndex:
+    """
+    Index pe coloane (zile) pentru intervalele de randuri ocupate de evenimente.
+
+    Pentru fiecare coloana pastram lista sortata a randurilor de start si durata
+    fiecarui eveniment. Interogarile folosesc bisect, deci costa O(log n + k).
+    """
+
+    def __init__(self):
+        self._starts: Dict[int, List[int]] = {}
+        self._durations: Dict[int, Dict[int, int]] = {}
+        self._duration_counts: Dict[int, Counter] = {}
+        self._max_duration: Dict[int, int] = {}
+
+    def add(self, start_row: int, col: int, duration: int):
+        """Adauga intervalul [start_row, start_row + duration - 1] pe coloana col."""
+        duration = max(1, duration)
+        durations = self._durations.setdefault(col, {})
+        if start_row in durations:
+            self.remove(start_row, col)
+            durations = self._durations.setdefault(col, {})
+
+        insort(self._starts.setdefault(col, []), start_row)
+        durations[start_row] = duration
+        self._duration_counts.setdefault(col, Counter())[duration] += 1
+        if duration > self._max_duration.get(col, 0):
+            self._max_duration[col] = duration
+
+    def remove(self, start_row: int, col: int):
+        """Scoate intervalul care incepe la start_row pe coloana col (daca exista)."""
+        durations = self._durations.get(col)
+        if not durations or start_row not in durations:
+            return
+        duration = durations.pop(start_row)
+
+        starts = self._starts[col]
+        del starts[bisect_left(starts, start_row)]
+
+        counts = self._duration_counts[col]
+        counts[duration] -= 1
+        if counts[duration] <= 0:
+            del counts[duration]
+            if duration == self._max_duration.get(col):
+                self._max_duration[col] = max(counts) if counts else 0
+
+    def clear(self):
+        """Goleste indexul pentru toate coloanele."""
+        self._starts.clear()
+        self._durations.clear()
+        self._duration_counts.clear()
+        self._max_duration.clear()
+
+    def overlapping(self, col: int, start_row: int, end_row: int) -> Iterator[Tuple[int, int]]:
+        """
+        Returneaza (start, durata) pentru intervalele de pe coloana col care se
+        suprapun cu [start_row, end_row], ordonate dupa start.
+        """
+        starts = self._starts.get(col)
+        if not starts:
+            return
+        durations = self._durations[col]
+        # un interval care incepe mai sus de start_row - max_duration + 1 nu poate ajunge la start_row
+        lo = bisect_left(starts, start_row - self._max_duration[col] + 1)
+        hi = bisect_right(starts, end_row)
+        for i in range(lo, hi):
+            s = starts[i]
+            d = durations[s]
+            if s + d - 1 >= start_row:
+                yield s, d
+
+    def first_start_after(self, col: int, row: int) -> Optional[int]:
+        """Primul rand de start strict mai mare decat row pe coloana col."""
+        starts = self._starts.get(col)
+        if not starts:
+            return None
+        i = bisect_right(starts, row)
+        return starts[i] if i < len(starts) else None
+
+
+class EventPositionMap(dict):
+    """
+    Dictionar (row, col) -> CalendarEvent care tine la zi un ColumnIntervalIndex.
+
+    Orice inserare, mutare (pop + set), micsorare sau stergere trece prin
+    metodele de mai jos, deci indexul ramane sincronizat cu continutul.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.index = ColumnIntervalIndex()
+
+    def __setitem__(self, key: Tuple[int, int], ev: CalendarEvent):
+        row, col = key
+        self.index.add(row, col, ev.duration)
+        super().__setitem__(key, ev)
+
+    def __delitem__(self, key: Tuple[int, int]):
+        super().__delitem__(key)
+        self.index.remove(*key)
+
+    def pop(self, key, *default):
+        if key in self:
+            self.index.remove(*key)
+        return super().pop(key, *default)
+
+    def clear(self):
+        super().clear()
+        self.index.clear()
+
+    def update(self, *args, **kwargs):
+        for key, ev in dict(*args, **kwargs).items():
+            self[key] = ev
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def popitem(self):
+        key, ev = super().popitem()
+        self.index.remove(*key)
+        return key, ev
+
+    # ---------------- interogari ----------------
+
+    def overlapping(self, col: int, start_row: int, end_row: int) -> List[CalendarEvent]:
+        """Evenimentele de pe coloana col care se suprapun cu [start_row, end_row], de sus in jos."""
+        return [self[(s, col)] for s, _ in self.index.overlapping(col, start_row, end_row)]
+
+    def event_covering(self, row: int, col: int) -> Optional[CalendarEvent]:
+        """Evenimentul care acopera celula (row, col), chiar daca nu incepe acolo."""
+        ev = self.get((row, col))
+        if ev is not None:
+            return ev
+        for s, _ in self.index.overlapping(col, row, row):
+            return self[(s, col)]
+        return None
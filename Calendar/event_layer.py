@@ -0,0 +1,57 @@
+from PySide6.QtCore import Qt, QRect
+from PySide6.QtGui import QPainter, QPalette
+
+from models import CalendarEvent
+
+
+class EventLayer:
+    """
+    Deseneaza blocurile de evenimente direct pe viewport-ul unui ScheduleView,
+    pe baza geometriei din model (start_row, duration, day_col), fara setSpan.
+
+    Se deseneaza doar evenimentele care intersecteaza zona de repaint, gasite
+    prin indexul pe coloane din events_by_pos.
+    """
+
+    def __init__(self, view, margin: int = 2, radius: int = 4):
+        self._view = view
+        self.margin = margin
+        self.radius = radius
+
+    def event_rect(self, ev: CalendarEvent) -> QRect:
+        """Dreptunghiul unui eveniment in viewport (zona care trebuie redesenata)."""
+        return self._view._event_rect(ev)
+
+    def paint(self, painter: QPainter, clip: QRect):
+        """Deseneaza evenimentele vizibile in zona clip."""
+        view = self._view
+        rows = view.rowCount()
+        cols = view.columnCount()
+        if rows <= 0 or cols <= 0:
+            return
+
+        first_col = view.columnAt(clip.left())
+        last_col = view.columnAt(clip.right())
+        first_row = view.rowAt(clip.top())
+        last_row = view.rowAt(clip.bottom())
+        first_col = 0 if first_col < 0 else first_col
+        last_col = cols - 1 if last_col < 0 else last_col
+        first_row = 0 if first_row < 0 else first_row
+        last_row = rows - 1 if last_row < 0 else last_row
+
+        text_color = view.palette().color(QPalette.Text)
+        m = self.margin
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        for col in range(first_col, last_col + 1):
+            for ev in view.events_by_pos.overlapping(col, first_row, last_row):
+                rect = self.event_rect(ev).adjusted(m, m, -m, -m)
+                painter.setPen(ev.color.darker(130))
+                painter.setBrush(ev.color)
+                painter.drawRoundedRect(rect, self.radius, self.radius)
+
+                painter.setPen(text_color)
+                title = painter.fontMetrics().elidedText(ev.title, Qt.ElideRight, rect.width() - 2 * m)
+                painter.drawText(rect, Qt.AlignCenter, title)
+        painter.restore()
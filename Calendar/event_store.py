@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import contextlib
+from datetime import date
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core_event import CoreEvent
+from occurrences import Occurrence, iter_occurrences
+from recurrence_index import RecurrenceIndex
+
+
+class ObservableStore:
+    """
+    Baza comuna a store-urilor: abonarea la modificari si batch().
+
+    Cine tine date derivate (ex. cache-uri de layout) se poate abona cu subscribe();
+    callback-ul primeste evenimentul adaugat / scos, sau None cand s-au schimbat
+    multe evenimente deodata (store golit / incarcat cu add_many).
+    """
+
+    def __init__(self):
+        self._listeners: List[Callable[[Optional[CoreEvent]], None]] = []
+
+    def subscribe(self, callback: Callable[[Optional[CoreEvent]], None]):
+        """Inregistreaza un callback apelat la fiecare modificare a store-ului."""
+        self._listeners.append(callback)
+
+    def _notify(self, ev: Optional[CoreEvent]):
+        for callback in self._listeners:
+            callback(ev)
+
+    def batch(self):
+        """Grupeaza mai multe modificari (aici nu e nimic de facut; SqliteEventStore o suprascrie)."""
+        return contextlib.nullcontext(self)
+
+
+class EventStore(ObservableStore):
+    """
+    Store-ul global de evenimente: cheie = "YYYY-MM-DD", valoare = lista de CoreEvent.
+
+    Toate modificarile trec prin metodele de aici, ca indexul de recurente
+    sa ramana sincronizat cu events_by_date. Evenimentele din store nu se modifica
+    pe loc: un eveniment editat este scos si adaugat din nou.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.events_by_date: Dict[str, List[CoreEvent]] = {}
+        self._recurrence = RecurrenceIndex()
+
+    def add(self, ev: CoreEvent):
+        """Adauga un eveniment de baza (la data lui, ev.day)."""
+        self.events_by_date.setdefault(ev.dstr, []).append(ev)
+        self._recurrence.add(ev)
+        self._notify(ev)
+
+    def add_many(self, events: Iterable[CoreEvent]):
+        """Adauga multe evenimente deodata (ex. la Load); anunta o singura modificare (None)."""
+        for ev in events:
+            self.events_by_date.setdefault(ev.dstr, []).append(ev)
+            self._recurrence.add(ev)
+        self._notify(None)
+
+    def remove(self, ev: CoreEvent):
+        """Scoate un eveniment de baza (comparat dupa identitate)."""
+        dstr = ev.dstr
+        events = self.events_by_date.get(dstr)
+        if not events:
+            return
+        for i, existing in enumerate(events):
+            if existing is ev:
+                del events[i]
+                break
+        else:
+            return
+        if not events:
+            del self.events_by_date[dstr]
+        self._recurrence.remove(ev)
+        self._notify(ev)
+
+    def pop_date(self, dstr: str) -> List[CoreEvent]:
+        """Scoate si returneaza toate evenimentele de baza de la data dstr."""
+        events = self.events_by_date.pop(dstr, [])
+        for ev in events:
+            self._recurrence.remove(ev)
+            self._notify(ev)
+        return events
+
+    def clear(self):
+        """Sterge toate evenimentele."""
+        self.events_by_date.clear()
+        self._recurrence.clear()
+        self._notify(None)
+
+    def events_on(self, dstr: str) -> List[CoreEvent]:
+        """Evenimentele de baza de la data dstr."""
+        return list(self.events_by_date.get(dstr, ()))
+
+    def week_occurrences(self, monday: date) -> List[Tuple[int, CoreEvent, int]]:
+        """Aparitiile (coloana, eveniment, k) din saptamana care incepe cu monday."""
+        return self._recurrence.week_occurrences(monday)
+
+    def __len__(self) -> int:
+        return sum(len(events) for events in self.events_by_date.values())
+
+    def __iter__(self) -> Iterator[CoreEvent]:
+        """Itereaza toate evenimentele de baza, grupate pe date."""
+        for events in self.events_by_date.values():
+            yield from events
+
+    def iter_occurrences(self, start_date: date, end_date: date) -> Iterator[Occurrence]:
+        """Aparitiile dintre start_date si end_date, lazy si in ordine cronologica."""
+        return iter_occurrences(iter(self), start_date, end_date)
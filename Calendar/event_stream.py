@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import BinaryIO, Iterator
+
+_WHITESPACE = re.compile(r"\s*")
+
+
+class JsonEventReader:
+    """
+    Citeste incremental evenimentele dintr-un document {"events": [...]}.
+
+    Fisierul este citit in bucati de buffer_size octeti, iar fiecare eveniment este
+    decodat separat (JSONDecoder.raw_decode), deci memoria folosita depinde de
+    marimea unui eveniment, nu de marimea fisierului. Celelalte chei de la nivelul
+    de sus sunt citite si ignorate.
+    """
+
+    def __init__(self, f: BinaryIO, buffer_size: int = 64 * 1024):
+        self._f = f
+        self.buffer_size = buffer_size
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        # octeti cititi din fisier pana acum (pentru progres)
+        self.bytes_read = 0
+
+    def _fill(self) -> bool:
+        """Adauga urmatoarea bucata din fisier in buffer; False la sfarsitul fisierului."""
+        if self._eof:
+            return False
+        data = self._f.read(self.buffer_size)
+        self.bytes_read += len(data)
+        if not data:
+            self._eof = True
+        self._buf = self._buf[self._pos:] + self._decoder.decode(data, final=not data)
+        self._pos = 0
+        return bool(data)
+
+    def _peek(self) -> str:
+        """Urmatorul caracter diferit de spatiu (fara sa-l consume), sau "" la final."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf) or not self._fill():
+                return self._buf[self._pos:self._pos + 1]
+
+    def _expect(self, chars: str) -> str:
+        ch = self._peek()
+        if not ch or ch not in chars:
+            raise ValueError(f"JSON invalid: se astepta unul din {chars!r}, gasit {ch!r}")
+        self._pos += 1
+        return ch
+
+    def _value(self):
+        """Decodeaza urmatoarea valoare JSON, citind din fisier cat este nevoie."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # un numar terminat exact la capatul buffer-ului poate continua in bucata urmatoare
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def __iter__(self) -> Iterator[dict]:
+        self._expect("{")
+        if self._peek() == "}":
+            return
+        while True:
+            key = self._value()
+            self._expect(":")
+            if key == "events":
+                self._expect("[")
+                if self._peek() == "]":
+                    self._pos += 1
+                else:
+                    while True:
+                        yield self._value()
+                        if self._expect(",]") == "]":
+                            break
+            else:
+                self._value()
+            if self._expect(",}") == "}":
+                return
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+# limitele (in ms) ale intervalelor din histograma; 16 ms ~ un frame la 60 Hz
+HISTOGRAM_BOUNDS_MS = (0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 33, 50, 100, 250, 500, 1000)
+
+
+class Span:
+    """
+    O masuratoare in curs: porneste la creare, se incheie la end() (sau la iesirea din with).
+    count() ataseaza contoare (ex. evenimente scanate, celule atinse).
+    """
+
+    __slots__ = ("_tracer", "name", "category", "args", "_start", "_ended")
+
+    def __init__(self, tracer: "Tracer", name: str, category: str, args: dict):
+        self._tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self._ended = False
+        self._start = time.perf_counter_ns()
+
+    def __enter__(self) -> "Span":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end()
+
+    def __bool__(self) -> bool:
+        return True
+
+    def count(self, **counts):
+        self.args.update(counts)
+
+    def end(self):
+        """Incheie masuratoarea (apelurile repetate sunt ignorate)."""
+        if self._ended:
+            return
+        self._ended = True
+        self._tracer._record(self, time.perf_counter_ns())
+
+
+class _NullSpan:
+    """Span-ul intors cand instrumentarea e oprita: nu masoara nimic."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        pass
+
+    def __bool__(self) -> bool:
+        return False
+
+    def count(self, **counts):
+        pass
+
+    def end(self):
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """
+    Colecteaza masuratorile caii critice (navigare, redesenare, drop, resize, dialog,
+    save/load) si le exporta ca trace Chrome (chrome://tracing, Perfetto) si ca histograma.
+
+    Cand enabled e False, span() intoarce NULL_SPAN: costul e un apel de functie.
+    Pastreaza cel mult MAX_RECORDS masuratori (cele mai vechi sunt uitate).
+    """
+
+    MAX_RECORDS = 200_000
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._origin = time.perf_counter_ns()
+        # (nume, categorie, start_ns, durata_ns, thread, contoare)
+        self._records: Deque[Tuple[str, str, int, int, int, dict]] = deque(maxlen=self.MAX_RECORDS)
+
+    def span(self, name: str, category: str = "ui", **counts):
+        """Porneste o masuratoare (folosita cu with sau incheiata cu end())."""
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name, category, counts)
+
+    def _record(self, span: Span, end_ns: int):
+        # deque.append e atomic, deci se poate apela si de pe thread-urile din pool
+        self._records.append(
+            (span.name, span.category, span._start, end_ns - span._start, threading.get_ident(), span.args)
+        )
+
+    def clear(self):
+        self._records.clear()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    # ---------------- export ----------------
+
+    def chrome_trace(self) -> dict:
+        """Masuratorile in formatul Chrome trace-event (evenimente complete, "ph": "X")."""
+        pid = os.getpid()
+        thread_ids: Dict[int, int] = {}
+        events = []
+        for name, category, start, duration, thread, args in list(self._records):
+            events.append({
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self._origin) / 1000.0,
+                "dur": duration / 1000.0,
+                "pid": pid,
+                "tid": thread_ids.setdefault(thread, len(thread_ids)),
+                "args": args,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str):
+        import json
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+
+    def summary(self) -> Dict[str, dict]:
+        """Pentru fiecare masuratoare: numar, percentile, histograma duratelor si totalul contoarelor."""
+        import statistics
+
+        durations: Dict[str, List[float]] = {}
+        counters: Dict[str, Dict[str, float]] = {}
+        for name, _category, _start, duration, _thread, args in list(self._records):
+            durations.setdefault(name, []).append(duration / 1e6)
+            totals = counters.setdefault(name, {})
+            for key, value in args.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    totals[key] = totals.get(key, 0) + value
+
+        result: Dict[str, dict] = {}
+        for name, values in sorted(durations.items()):
+            values.sort()
+            histogram = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+            for value in values:
+                i = 0
+                while i < len(HISTOGRAM_BOUNDS_MS) and value > HISTOGRAM_BOUNDS_MS[i]:
+                    i += 1
+                histogram[i] += 1
+            result[name] = {
+                "count": len(values),
+                "total_ms": sum(values),
+                "mean_ms": statistics.fmean(values),
+                "p50_ms": _percentile(values, 0.50),
+                "p90_ms": _percentile(values, 0.90),
+                "p99_ms": _percentile(values, 0.99),
+                "max_ms": values[-1],
+                "histogram": histogram,
+                "counters": counters[name],
+            }
+        return result
+
+    def format_summary(self) -> str:
+        """Rezumatul ca text: percentile si histograma duratelor pentru fiecare masuratoare."""
+        labels = [f"<= {bound:g} ms" for bound in HISTOGRAM_BOUNDS_MS] + [f"> {HISTOGRAM_BOUNDS_MS[-1]:g} ms"]
+        lines: List[str] = []
+        for name, stats in self.summary().items():
+            lines.append(
+                f"{name}: {stats['count']} x, p50 {stats['p50_ms']:.3f} ms, p90 {stats['p90_ms']:.3f} ms,"
+                f" p99 {stats['p99_ms']:.3f} ms, max {stats['max_ms']:.3f} ms"
+            )
+            if stats["counters"]:
+                lines.append("  " + ", ".join(f"{key}={value:g}" for key, value in stats["counters"].items()))
+            widest = max(stats["histogram"])
+            for label, n in zip(labels, stats["histogram"]):
+                if n:
+                    lines.append(f"  {label:>12} {n:8d} {'#' * max(1, 40 * n // widest)}")
+            lines.append("")
+        return "\n".join(lines)
+
+    def export_summary(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.format_summary())
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def summary_path(trace_path: str) -> str:
+    """Fisierul cu histograma exportat langa trace (orar.json -> orar.summary.txt)."""
+    return os.path.splitext(trace_path)[0] + ".summary.txt"
+
+
+# CALENDAR_TRACE=1 porneste instrumentarea de la inceput; CALENDAR_TRACE=<fisier.json>
+# exporta in plus trace-ul (si histograma) la inchiderea aplicatiei
+TRACE_ENV = os.environ.get("CALENDAR_TRACE", "")
+TRACE_EXPORT_PATH: Optional[str] = TRACE_ENV if TRACE_ENV.endswith(".json") else None
+
+tracer = Tracer(enabled=bool(TRACE_ENV))
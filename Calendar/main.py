@@ -1,3 +1,10 @@
+import time
+
+# inainte de importurile Qt, ca timpul de pornire sa includa si incarcarea PySide6
+STARTED = time.perf_counter()
+
+import json
+import os
 import sys
 from PySide6.QtWidgets import QApplication
 from main_window import MainWindow
@@ -5,7 +12,16 @@ from main_window import MainWindow
 
 def main():
     app = QApplication(sys.argv)
-    window = MainWindow()
+    window = MainWindow(started=STARTED)
+
+    # CALENDAR_STARTUP_TIME=1 afiseaza timpii de pornire (JSON, in ms);
+    # =exit inchide apoi aplicatia (pentru masuratori repetate, vezi benchmark.py)
+    startup_time = os.environ.get("CALENDAR_STARTUP_TIME")
+    if startup_time:
+        window.startup_finished.connect(lambda timings: print(json.dumps(timings), flush=True))
+        if startup_time == "exit":
+            window.startup_finished.connect(lambda _timings: app.quit())
+
     window.show()
     sys.exit(app.exec())
 
@@ -1,4 +1,5 @@
-import json
+import os
+import time
 
 from PySide6.QtWidgets import (
     QMainWindow,
@@ -7,28 +8,49 @@ from PySide6.QtWidgets import (
     QToolBar,
     QFileDialog,
 )
-from PySide6.QtGui import QAction
-from schedule_table import ScheduleTable
-from week_calendar_widget import WeekCalendarWidget
+from PySide6.QtCore import QTimer, Signal
+from PySide6.QtGui import QAction, QKeySequence
 from theme import APP_DARK_STYLE
+from instrumentation import TRACE_EXPORT_PATH, summary_path, tracer
+
+# formatul e ales dupa extensie: .json (JSON indentat), .calb (binar compact)
+# sau .sqlite / .db (baza de date, deschisa direct ca store)
+SCHEDULE_FILE_FILTERS = "JSON Files (*.json);;Orar binar (*.calb);;Baza de date SQLite (*.sqlite *.db)"
 
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    """
+    Fereastra principala. La pornire se deseneaza intai cadrul (toolbar, fundal);
+    WeekCalendarWidget este construit si populat imediat dupa primul frame
+    (vezi _build_week_calendar), iar startup_ms retine cand s-au intamplat ambele.
+    """
+
+    # emis cand saptamana curenta este afisata; argument: startup_ms
+    startup_finished = Signal(dict)
+
+    def __init__(self, started: float | None = None):
         super().__init__()
+        # momentul pornirii (time.perf_counter()); main.py il ia inainte de importurile Qt
+        self._started = time.perf_counter() if started is None else started
+        # ms de la pornire: "first_paint" (primul frame), "week_ready" (saptamana afisata)
+        self.startup_ms: dict[str, float] = {}
+
         self.setWindowTitle("Calendar")
         self.setFixedSize(920, 700)
         self.setStyleSheet(APP_DARK_STYLE)
 
         central_widget = QWidget()
-        layout = QHBoxLayout(central_widget)
-
-        self.week_calendar = WeekCalendarWidget(self)
-        layout.addWidget(self.week_calendar)
-
+        self._central_layout = QHBoxLayout(central_widget)
         self.setCentralWidget(central_widget)
+        # construit dupa primul frame
+        self.week_calendar = None
+
+        # fisierul orarului salvat / incarcat ultima data
+        self.current_file: str | None = None
 
-        toolbar = QToolBar("File")
+        # actiunile au nevoie de calendar: toolbar-ul e activat dupa construirea lui
+        self._toolbar = toolbar = QToolBar("File")
+        toolbar.setEnabled(False)
         self.addToolBar(toolbar)
 
         save_action = QAction("Save", self)
@@ -39,20 +61,181 @@ class MainWindow(QMainWindow):
         load_action.triggered.connect(self.load_schedule)
         toolbar.addAction(load_action)
 
+        undo_action = QAction("Undo", self)
+        undo_action.setShortcut(QKeySequence.StandardKey.Undo)
+        undo_action.triggered.connect(lambda: self.week_calendar.undo())
+        toolbar.addAction(undo_action)
+
+        redo_action = QAction("Redo", self)
+        redo_action.setShortcut(QKeySequence.StandardKey.Redo)
+        redo_action.triggered.connect(lambda: self.week_calendar.redo())
+        toolbar.addAction(redo_action)
+
+        # autosave: fiecare operatie este adaugata in jurnalul de langa fisierul curent
+        self.autosave_action = QAction("Autosave", self)
+        self.autosave_action.setCheckable(True)
+        self.autosave_action.toggled.connect(self._toggle_autosave)
+        toolbar.addAction(self.autosave_action)
+
+        # instrumentare: masuratori pentru caile critice (si CALENDAR_TRACE=1 sau =<fisier.json>)
+        self.trace_action = QAction("Trace", self)
+        self.trace_action.setCheckable(True)
+        self.trace_action.setChecked(tracer.enabled)
+        self.trace_action.toggled.connect(self._toggle_trace)
+        toolbar.addAction(self.trace_action)
+
+        export_trace_action = QAction("Export trace", self)
+        export_trace_action.triggered.connect(self.export_trace)
+        toolbar.addAction(export_trace_action)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if "first_paint" not in self.startup_ms:
+            self.startup_ms["first_paint"] = self._elapsed_ms()
+            # saptamana se construieste dupa ce primul frame a ajuns pe ecran
+            QTimer.singleShot(0, self._build_week_calendar)
+
+    def _elapsed_ms(self) -> float:
+        return (time.perf_counter() - self._started) * 1000.0
+
+    def _build_week_calendar(self):
+        """Construieste WeekCalendarWidget si afiseaza saptamana curenta (o singura data)."""
+        if self.week_calendar is not None:
+            return
+        from week_calendar_widget import WeekCalendarWidget
+
+        # CALENDAR_VIEW = table (implicit) | model | painted
+        # CALENDAR_STORE = dict (implicit) | columnar | sqlite (baza de date din CALENDAR_DB)
+        # CALENDAR_SLOT = minutele unui rand: 60 (implicit) | 30 | 15 | 5
+        view_mode = os.environ.get("CALENDAR_VIEW", "table")
+        store_backend = os.environ.get("CALENDAR_STORE", "dict")
+        self.week_calendar = WeekCalendarWidget(
+            self,
+            view_mode=view_mode,
+            store_backend=store_backend,
+            db_path=os.environ.get("CALENDAR_DB", ":memory:"),
+            slot_minutes=int(os.environ.get("CALENDAR_SLOT", "60")),
+        )
+        self._central_layout.addWidget(self.week_calendar)
+        self._toolbar.setEnabled(True)
+
+        self.startup_ms["week_ready"] = self._elapsed_ms()
+        self.startup_finished.emit(dict(self.startup_ms))
+
+    def closeEvent(self, event):
+        # modificarile din saptamana curenta ajung in store (si in jurnal / baza de date)
+        if self.week_calendar is not None:
+            self.week_calendar.flush()
+        if TRACE_EXPORT_PATH and len(tracer):
+            self._write_trace(TRACE_EXPORT_PATH)
+        super().closeEvent(event)
+
+    def _toggle_trace(self, enabled: bool):
+        tracer.enabled = enabled
+
+    def export_trace(self):
+        """Scrie masuratorile ca trace Chrome (JSON) si histograma lor langa el (.summary.txt)."""
+        file_path, _ = QFileDialog.getSaveFileName(self, "Exporta trace-ul", "", "Chrome trace (*.json)")
+        if not file_path:
+            return
+        if "." not in os.path.basename(file_path):
+            file_path += ".json"
+        self._write_trace(file_path)
+
+    def _write_trace(self, path: str):
+        try:
+            tracer.export_chrome_trace(path)
+            tracer.export_summary(summary_path(path))
+        except OSError as error:
+            self.statusBar().showMessage(f"Eroare la exportul trace-ului: {error}")
+            return
+        self.statusBar().showMessage(f"Trace exportat: {path} ({len(tracer)} masuratori)", 5000)
+
+    def _watch_saver(self, saver):
+        """Afiseaza in status bar progresul si rezultatul unei salvari (None = nicio salvare pornita)."""
+        if saver is None:
+            return
+        saver.progress.connect(
+            lambda done, total: self.statusBar().showMessage(f"Se salveaza orarul... {done}/{total}")
+        )
+        saver.finished.connect(lambda path: self.statusBar().showMessage(f"Salvat: {path}", 5000))
+        saver.failed.connect(
+            lambda error: self.statusBar().showMessage(f"Eroare la salvare: {error}")
+        )
+
+    def _toggle_autosave(self, enabled: bool):
+        from schedule_files import is_sqlite_schedule
+
+        if not enabled:
+            self.week_calendar.disable_autosave()
+        elif self.current_file is None:
+            # autosave are nevoie de un fisier; save_schedule il porneste dupa alegere
+            self.save_schedule()
+        elif not is_sqlite_schedule(self.current_file):
+            # (intr-o baza de date SQLite fiecare operatie este scrisa oricum)
+            self._watch_saver(self.week_calendar.enable_autosave(self.current_file))
+
     def save_schedule(self):
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, "Salveaza orarul", "", "JSON Files (*.json)"
+        from schedule_files import BINARY_SUFFIX, SQLITE_SUFFIXES, is_sqlite_schedule
+
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self, "Salveaza orarul", "", SCHEDULE_FILE_FILTERS
         )
-        if file_path:
-            state = self.week_calendar.export_all_events()
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(state, f, indent=4)
+        if not file_path:
+            if self.current_file is None:
+                self.autosave_action.setChecked(False)
+            return
+        if "." not in os.path.basename(file_path):
+            if BINARY_SUFFIX in selected_filter:
+                file_path += BINARY_SUFFIX
+            elif SQLITE_SUFFIXES[0] in selected_filter:
+                file_path += SQLITE_SUFFIXES[0]
+
+        self.current_file = file_path
+        # scrierea ruleaza in fundal, pe un snapshot; editarea ramane posibila
+        if self.autosave_action.isChecked() and not is_sqlite_schedule(file_path):
+            saver = self.week_calendar.enable_autosave(file_path)
+        else:
+            saver = self.week_calendar.save_file_in_background(file_path)
+        if saver is None:
+            # baza de date deschisa (sau o compactare in curs): nu porneste o scriere noua
+            self.statusBar().showMessage(f"Salvat: {file_path}", 5000)
+        self._watch_saver(saver)
 
     def load_schedule(self):
+        from schedule_files import is_binary_schedule, is_sqlite_schedule
+
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Incarca orarul", "", "JSON Files (*.json)"
+            self, "Incarca orarul", "", SCHEDULE_FILE_FILTERS
         )
-        if file_path:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            self.week_calendar.load_all_events(data)
+        if not file_path:
+            return
+        self.current_file = file_path
+        if is_sqlite_schedule(file_path):
+            # baza de date devine store-ul: se citeste doar saptamana afisata
+            self.week_calendar.open_database(file_path)
+            return
+        if is_binary_schedule(file_path):
+            # fisierul .calb este mapat in memorie: se decodeaza doar saptamana afisata
+            try:
+                self.week_calendar.open_mapped(file_path)
+            except (OSError, ValueError) as error:
+                self.statusBar().showMessage(f"Eroare la incarcare: {error}")
+                return
+            self._toggle_autosave(self.autosave_action.isChecked())
+            return
+
+        # fisierul e citit incremental; saptamana curenta apare inainte de final
+        loader = self.week_calendar.load_file_incrementally(file_path)
+        loader.progress.connect(self._show_load_progress)
+        loader.finished.connect(
+            lambda count: self.statusBar().showMessage(f"Incarcat: {count} evenimente", 5000)
+        )
+        loader.finished.connect(lambda _count: self._toggle_autosave(self.autosave_action.isChecked()))
+        loader.failed.connect(
+            lambda error: self.statusBar().showMessage(f"Eroare la incarcare: {error}")
+        )
+
+    def _show_load_progress(self, done: int, total: int):
+        percent = 100 * done // total if total else 100
+        self.statusBar().showMessage(f"Se incarca orarul... {percent}%")
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import mmap
+from collections import Counter
+from datetime import date
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from binary_format import BinaryScheduleFile
+from core_event import CoreEvent
+from event_store import EventStore, ObservableStore
+from occurrences import Occurrence, iter_occurrences
+
+
+def _key(ev: CoreEvent) -> tuple:
+    return (ev.day, ev.start_minute, ev.duration_minutes, ev.rgb, ev.flags, ev.repeat_count, ev.title, ev.description)
+
+
+class MappedEventStore(ObservableStore):
+    """
+    Store pentru arhive mari in format .calb, deschise cu mmap, fara parsare la deschidere.
+
+    Evenimentele simple raman in fisier si sunt decodate doar pentru saptamanile
+    cerute (cautare in week index); seriile (sectiunea mica de la finalul
+    record-urilor) sunt incarcate la deschidere intr-un EventStore din memorie.
+    Deschiderea si prima saptamana au deci un cost constant, oricat de mare e fisierul.
+
+    Fisierul nu este modificat: evenimentele adaugate ajung in EventStore-ul din memorie,
+    iar cele simple sterse din fisier sunt doar marcate (dupa valori) ca sterse.
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._file: Optional[BinaryScheduleFile] = BinaryScheduleFile(self._mmap)
+        self._memory = EventStore()
+        self._memory.add_many(self._file.series())
+        # evenimente simple din fisier sterse de user (cheie = valorile evenimentului)
+        self._deleted: Counter = Counter()
+
+    def close(self):
+        self._file = None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # un iterator neterminat inca citeste din fisier; mmap-ul se inchide odata cu el
+                pass
+            self._mmap = None
+
+    # ---------------- evenimentele simple din fisier ----------------
+
+    def _file_singles(self, first_day: int, last_day: int) -> Iterator[CoreEvent]:
+        """Evenimentele simple din fisier intre first_day si last_day, fara cele sterse."""
+        if self._file is None:
+            return
+        skipped: Counter = Counter()
+        for week in range((first_day - 1) // 7, (last_day - 1) // 7 + 1):
+            for ev in self._file.week_singles(week):
+                if not first_day <= ev.day <= last_day:
+                    continue
+                if self._deleted:
+                    key = _key(ev)
+                    if skipped[key] < self._deleted[key]:
+                        skipped[key] += 1
+                        continue
+                yield ev
+
+    def _all_file_singles(self) -> Iterator[CoreEvent]:
+        if self._file is None:
+            return iter(())
+        if not self._deleted:
+            return self._file.singles()
+        skipped: Counter = Counter()
+
+        def not_deleted(ev: CoreEvent) -> bool:
+            key = _key(ev)
+            if skipped[key] < self._deleted[key]:
+                skipped[key] += 1
+                return False
+            return True
+
+        return filter(not_deleted, self._file.singles())
+
+    # ---------------- modificari ----------------
+
+    def add(self, ev: CoreEvent):
+        """Adauga un eveniment de baza (in memorie; fisierul nu se modifica)."""
+        self._memory.add(ev)
+        self._notify(ev)
+
+    def add_many(self, events: Iterable[CoreEvent]):
+        """Adauga multe evenimente deodata; anunta o singura modificare (None)."""
+        self._memory.add_many(events)
+        self._notify(None)
+
+    def remove(self, ev: CoreEvent):
+        """Scoate un eveniment de baza: din memorie (dupa identitate) sau, daca vine din fisier, dupa valori."""
+        if any(existing is ev for existing in self._memory.events_on(ev.dstr)):
+            self._memory.remove(ev)
+        elif not ev.is_repeating and any(_key(e) == _key(ev) for e in self._file_singles(ev.day, ev.day)):
+            self._deleted[_key(ev)] += 1
+        else:
+            return
+        self._notify(ev)
+
+    def pop_date(self, dstr: str) -> List[CoreEvent]:
+        """Scoate si returneaza toate evenimentele de baza de la data dstr."""
+        day = date.fromisoformat(dstr).toordinal()
+        events = list(self._file_singles(day, day))
+        for ev in events:
+            self._deleted[_key(ev)] += 1
+        events += self._memory.pop_date(dstr)
+        for ev in events:
+            self._notify(ev)
+        return events
+
+    def clear(self):
+        """Sterge toate evenimentele (fisierul ramane neschimbat pe disc)."""
+        self.close()
+        self._memory.clear()
+        self._deleted.clear()
+        self._notify(None)
+
+    # ---------------- interogari ----------------
+
+    def events_on(self, dstr: str) -> List[CoreEvent]:
+        """Evenimentele de baza de la data dstr."""
+        day = date.fromisoformat(dstr).toordinal()
+        return list(self._file_singles(day, day)) + self._memory.events_on(dstr)
+
+    def week_occurrences(self, monday: date) -> List[Tuple[int, CoreEvent, int]]:
+        """Aparitiile (coloana, eveniment, k) din saptamana care incepe cu monday."""
+        first = monday.toordinal()
+        result = [(ev.day - first, ev, 0) for ev in self._file_singles(first, first + 6)]
+        result += self._memory.week_occurrences(monday)
+        return result
+
+    @property
+    def events_by_date(self) -> Dict[str, List[CoreEvent]]:
+        """Vederea dict ("YYYY-MM-DD" -> evenimente), construita la cerere (costisitor)."""
+        result: Dict[str, List[CoreEvent]] = {}
+        for ev in self:
+            result.setdefault(ev.dstr, []).append(ev)
+        return result
+
+    def __len__(self) -> int:
+        single_count = self._file.single_count if self._file is not None else 0
+        return single_count - sum(self._deleted.values()) + len(self._memory)
+
+    def __iter__(self) -> Iterator[CoreEvent]:
+        """Itereaza toate evenimentele de baza: intai cele simple din fisier, apoi cele din memorie."""
+        return chain(self._all_file_singles(), self._memory)
+
+    def iter_occurrences(self, start_date: date, end_date: date) -> Iterator[Occurrence]:
+        """Aparitiile dintre start_date si end_date, lazy si in ordine cronologica."""
+        singles = self._file_singles(start_date.toordinal(), end_date.toordinal())
+        return iter_occurrences(chain(singles, self._memory), start_date, end_date)
@@ -1,5 +1,8 @@
 from PySide6.QtGui import QColor
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional
+
+from core_event import MINUTES_PER_HOUR, CoreEvent
 
 @dataclass
 class CalendarEvent:
@@ -7,23 +10,66 @@ class CalendarEvent:
     title: str
     start_row: int
     day_col: int
-    duration: int  # în ore (număr de rânduri)
+    duration: int  # în număr de rânduri (slot-uri)
     color: QColor
     description: str = ""
     locked: bool = False
     repeat_count: int = 1
     repeat_forever: bool = False
     is_generated: bool = False
+    # minutele din primul / ultimul rand pe care evenimentul nu le ocupa (cand nu e aliniat la slot-uri)
+    start_offset: int = 0
+    end_offset: int = 0
+    # evenimentul din store din care provine (None pentru evenimente noi)
+    source: Optional[CoreEvent] = field(default=None, repr=False, compare=False)
 
-    @property
-    def start_hour(self) -> int:
-        """Ora de start (egala cu start_row)."""
-        return self.start_row
+    @classmethod
+    def from_core(
+        cls,
+        core: CoreEvent,
+        day_col: int,
+        is_generated: bool = False,
+        slot_minutes: int = MINUTES_PER_HOUR,
+    ) -> "CalendarEvent":
+        """
+        Construieste evenimentul afisat in tabel dintr-un CoreEvent din store.
+        Randurile au slot_minutes minute; un eveniment care nu se aliniaza la slot-uri
+        ocupa toate randurile pe care le atinge, iar minutele in plus raman in offset-uri.
+        """
+        end_minute = core.start_minute + core.duration_minutes
+        start_row = core.start_minute // slot_minutes
+        end_row = -(-end_minute // slot_minutes)
+        return cls(
+            title=core.title,
+            start_row=start_row,
+            day_col=day_col,
+            duration=max(1, end_row - start_row),
+            color=QColor(core.rgb),
+            description=core.description,
+            locked=core.locked,
+            repeat_count=core.repeat_count,
+            repeat_forever=core.repeat_forever,
+            is_generated=is_generated,
+            start_offset=core.start_minute - start_row * slot_minutes,
+            end_offset=end_row * slot_minutes - end_minute,
+            source=core,
+        )
 
-    @property
-    def end_hour(self) -> int:
-        """Ora de final (start_row + duration)."""
-        return self.start_row + self.duration
+    def to_core(self, day: int, slot_minutes: int = MINUTES_PER_HOUR) -> CoreEvent:
+        """
+        Converteste evenimentul intr-un CoreEvent pentru store (day = ordinalul datei).
+        Offset-urile pastreaza minutele exacte pe marginile pe care userul nu le-a mutat.
+        """
+        return CoreEvent(
+            title=self.title,
+            day=day,
+            start_minute=self.start_row * slot_minutes + self.start_offset,
+            duration_minutes=self.duration * slot_minutes - self.start_offset - self.end_offset,
+            rgb=self.color.rgb() & 0xFFFFFF,
+            description=self.description,
+            repeat_count=self.repeat_count,
+            flags=CoreEvent.make_flags(self.locked, self.repeat_forever),
+        )
 
     @property
     def day_index(self) -> int:
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import heapq
+from datetime import date, timedelta
+from typing import Dict, Iterable, Iterator, List, NamedTuple
+
+from core_event import CoreEvent
+
+
+class Occurrence(NamedTuple):
+    """O aparitie concreta a unui eveniment de baza dintr-o serie saptamanala."""
+    date: date
+    event: CoreEvent
+    index: int  # a cata aparitie din serie (0 = evenimentul de baza)
+
+    @property
+    def is_generated(self) -> bool:
+        """True pentru aparitiile generate de recurenta (nu evenimentul de baza)."""
+        return self.index > 0
+
+    @property
+    def hour(self) -> int:
+        return self.event.hour
+
+    @property
+    def start_minute(self) -> int:
+        return self.event.start_minute
+
+
+def _series(base_date: date, ev: CoreEvent, start_date: date, end_date: date) -> Iterator[Occurrence]:
+    """Genereaza lazy aparitiile unei serii intre start_date si end_date (inclusiv)."""
+    repeat_forever = ev.repeat_forever
+    repeat_count = max(1, ev.repeat_count)
+
+    k = 0
+    if start_date > base_date:
+        k = -(-(start_date - base_date).days // 7)  # rotunjire in sus
+
+    current = base_date + timedelta(weeks=k)
+    step = timedelta(weeks=1)
+    while current <= end_date and (repeat_forever or k < repeat_count):
+        yield Occurrence(current, ev, k)
+        current += step
+        k += 1
+
+
+def iter_occurrences(
+    events: Dict[str, List[CoreEvent]] | Iterable[CoreEvent],
+    start_date: date,
+    end_date: date,
+) -> Iterator[Occurrence]:
+    """
+    Itereaza lazy, in ordine cronologica (data, ora), toate aparitiile dintre
+    start_date si end_date (inclusiv), inclusiv recurentele.
+
+    Seriile sunt combinate printr-un k-way merge (heapq.merge), deci nu se
+    construieste in memorie lista tuturor aparitiilor din interval; merge si
+    pentru intervale de ani sau serii "repeat forever".
+    """
+    if isinstance(events, dict):
+        events = (ev for day_events in events.values() for ev in day_events)
+
+    start_day = start_date.toordinal()
+    end_day = end_date.toordinal()
+
+    series = []
+    for ev in events:
+        if ev.day > end_day:
+            continue
+        if not ev.repeat_forever and ev.day + 7 * (max(1, ev.repeat_count) - 1) < start_day:
+            continue
+        series.append(_series(ev.date, ev, start_date, end_date))
+
+    return heapq.merge(*series, key=lambda occ: (occ.date, occ.start_minute))
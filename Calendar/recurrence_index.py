@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import date
+from typing import Dict, List, Tuple
+
+from core_event import CoreEvent
+
+
+def week_number(d: date) -> int:
+    """Numarul saptamanii (ISO, luni-duminica) calculat din ordinal; luni are ordinal = 1 (mod 7)."""
+    return (d.toordinal() - 1) // 7
+
+
+class RecurrenceIndex:
+    """
+    Index al aparitiilor pe saptamani, pentru evenimentele din EventStore.
+
+    - evenimentele fara repetare sunt puse intr-un bucket per saptamana ISO;
+    - seriile "repeat forever" sunt tinute pe zile ale saptamanii, sortate dupa
+      saptamana de start (toate cele care au inceput deja sunt active);
+    - seriile cu repeat_count sunt grupate pe zile ale saptamanii si pe blocuri
+      de BLOCK_WEEKS saptamani, cu limitele [start, end] in saptamani.
+
+    week_occurrences() costa deci proportional cu numarul de aparitii gasite,
+    nu cu numarul total de evenimente din calendar.
+    """
+
+    BLOCK_WEEKS = 16
+
+    def __init__(self):
+        # week -> [(weekday, ev)]
+        self._single: Dict[int, List[Tuple[int, CoreEvent]]] = {}
+        # weekday -> lista sortata de start_week + lista paralela de evenimente
+        self._forever_starts: List[List[int]] = [[] for _ in range(7)]
+        self._forever_events: List[List[CoreEvent]] = [[] for _ in range(7)]
+        # weekday -> bloc -> [(start_week, end_week, ev)]
+        self._finite: List[Dict[int, List[Tuple[int, int, CoreEvent]]]] = [{} for _ in range(7)]
+
+    def add(self, ev: CoreEvent):
+        """Inregistreaza evenimentul de baza ev."""
+        weekday = (ev.day - 1) % 7
+        start_week = (ev.day - 1) // 7
+
+        if ev.repeat_forever:
+            starts = self._forever_starts[weekday]
+            i = bisect_right(starts, start_week)
+            starts.insert(i, start_week)
+            self._forever_events[weekday].insert(i, ev)
+            return
+
+        repeat_count = max(1, ev.repeat_count)
+        if repeat_count == 1:
+            self._single.setdefault(start_week, []).append((weekday, ev))
+            return
+
+        end_week = start_week + repeat_count - 1
+        blocks = self._finite[weekday]
+        for block in range(start_week // self.BLOCK_WEEKS, end_week // self.BLOCK_WEEKS + 1):
+            blocks.setdefault(block, []).append((start_week, end_week, ev))
+
+    def remove(self, ev: CoreEvent):
+        """Scoate evenimentul ev (comparat dupa identitate) din index."""
+        weekday = (ev.day - 1) % 7
+        start_week = (ev.day - 1) // 7
+
+        if ev.repeat_forever:
+            starts = self._forever_starts[weekday]
+            events = self._forever_events[weekday]
+            for i in range(bisect_left(starts, start_week), bisect_right(starts, start_week)):
+                if events[i] is ev:
+                    del starts[i]
+                    del events[i]
+                    return
+            return
+
+        repeat_count = max(1, ev.repeat_count)
+        if repeat_count == 1:
+            bucket = self._single.get(start_week, [])
+            self._single[start_week] = [entry for entry in bucket if entry[1] is not ev]
+            if not self._single[start_week]:
+                del self._single[start_week]
+            return
+
+        end_week = start_week + repeat_count - 1
+        blocks = self._finite[weekday]
+        for block in range(start_week // self.BLOCK_WEEKS, end_week // self.BLOCK_WEEKS + 1):
+            entries = [entry for entry in blocks.get(block, []) if entry[2] is not ev]
+            if entries:
+                blocks[block] = entries
+            else:
+                blocks.pop(block, None)
+
+    def clear(self):
+        """Goleste indexul."""
+        self._single.clear()
+        for weekday in range(7):
+            self._forever_starts[weekday].clear()
+            self._forever_events[weekday].clear()
+            self._finite[weekday].clear()
+
+    def week_occurrences(self, monday: date) -> List[Tuple[int, CoreEvent, int]]:
+        """
+        Returneaza aparitiile din saptamana care incepe cu monday, ca tupluri
+        (coloana zilei, eveniment, k), unde k = a cata aparitie din serie (0 = baza).
+        """
+        week = week_number(monday)
+        result: List[Tuple[int, CoreEvent, int]] = []
+
+        for weekday, ev in self._single.get(week, ()):
+            result.append((weekday, ev, 0))
+
+        block = week // self.BLOCK_WEEKS
+        for weekday in range(7):
+            for start_week, end_week, ev in self._finite[weekday].get(block, ()):
+                if start_week <= week <= end_week:
+                    result.append((weekday, ev, week - start_week))
+
+            starts = self._forever_starts[weekday]
+            events = self._forever_events[weekday]
+            for i in range(bisect_right(starts, week)):
+                result.append((weekday, events[i], week - starts[i]))
+
+        return result
@@ -0,0 +1,998 @@
+import random
+from contextlib import contextmanager
+from typing import Dict, NamedTuple, Tuple, Optional
+
+from PySide6.QtWidgets import QMessageBox, QApplication, QDialog, QRubberBand, QWidget
+from PySide6.QtCore import Qt, QRect, QTimer
+from PySide6.QtGui import QDrag, QMouseEvent, QColor, QPainter, QPen
+
+from models import CalendarEvent
+from conflict_planner import REMOVE, SPLIT, ConflictOp, plan_conflicts
+from drag_payload import EventDragPayload
+from edit_history import (
+    DELTA_ADD, DELTA_EDIT, DELTA_MOVE, DELTA_REMOVE, EditCommand, EditHistory, append_delta, invert,
+)
+from instrumentation import tracer
+from time_slots import slot_time
+
+
+class _DropPlan(NamedTuple):
+    """Rezultatul calculat pentru un drop pe o celula (refolosit de dropEvent)."""
+    key: tuple
+    original: Optional[CalendarEvent]
+    col: int
+    start_row: int
+    duration: int
+    conflicts: list
+    title: str
+    color: Optional[QColor]
+
+    @property
+    def blocked(self) -> bool:
+        """True daca drop-ul ar acoperi un eveniment locked."""
+        return any(ev.locked for ev in self.conflicts)
+
+
+class _DropPreview(QWidget):
+    """Stratul peste viewport care arata, in timpul drag-ului, tinta drop-ului si conflictele ei."""
+
+    TARGET_COLOR = QColor("#00adb5")
+    CONFLICT_COLOR = QColor(220, 60, 60, 90)
+    LOCKED_COLOR = QColor(220, 60, 60, 200)
+
+    def __init__(self, parent: QWidget):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self._target = QRect()
+        self._conflicts: list[Tuple[QRect, bool]] = []
+
+    def show_plan(self, target: QRect, conflicts: list[Tuple[QRect, bool]]):
+        self._target = target
+        self._conflicts = conflicts
+        self.setGeometry(self.parentWidget().rect())
+        self.show()
+        self.raise_()
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        for rect, locked in self._conflicts:
+            painter.fillRect(rect, self.LOCKED_COLOR if locked else self.CONFLICT_COLOR)
+        painter.setPen(QPen(self.TARGET_COLOR, 2))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRect(self._target.adjusted(1, 1, -1, -1))
+
+
+class ScheduleEditingMixin:
+    """
+    Logica de editare comuna pentru ScheduleTable (QTableWidget) si ScheduleView (QTableView):
+    drag & drop, resize, dialogul de editare, constrangeri si rezolvarea conflictelor.
+
+    Clasa concreta trebuie sa ofere:
+      - events_by_pos (EventPositionMap), rowCount(), columnCount()
+      - slot_minutes: cate minute are un rand (vezi time_slots)
+      - semnalul changed, emis dupa fiecare operatie a userului (creare, mutare,
+        resize, impartire, stergere, editare)
+      - _show_event(ev): deseneaza evenimentul la (start_row, day_col) cu span = duration
+      - _hide_event(row, col): sterge desenul evenimentului care incepe la (row, col)
+        (apelat inainte ca evenimentul sa fie scos din events_by_pos)
+      - _refresh_event(ev): actualizeaza textul / culoarea unui eveniment deja desenat
+    """
+
+    events_by_pos: Dict[Tuple[int, int], CalendarEvent]
+    slot_minutes: int
+
+    def _init_editing_state(self):
+        """Initializeaza starea interna pentru drag si resize."""
+        self.dragStartPosition = None
+        self.setAcceptDrops(True)
+        self.setEditTriggers(self.EditTrigger.NoEditTriggers)
+        self.setSelectionMode(self.SelectionMode.SingleSelection)
+        self.setDragDropMode(self.DragDropMode.InternalMove)
+        self.setDropIndicatorShown(True)
+        self.setDragEnabled(True)
+
+        self.setMouseTracking(True)
+        self._resize_active = False
+        self._resize_edge = None
+        self._resize_anchor_row = None
+        self._resize_col = None
+        self._resize_margin_px = 6
+        self._span_top_row = None
+        self._span_len = 1
+        self._resize_event: Optional[CalendarEvent] = None
+        self._resize_last_row: Optional[int] = None
+        # True -> in timpul resize-ului se deseneaza doar un preview (QRubberBand), iar
+        # evenimentul e mutat o singura data, la eliberarea mouse-ului (_end_resize);
+        # False -> evenimentul e mutat in model si in tabel la fiecare rand (comparatii)
+        self.resize_preview = True
+        self._rubber_band: Optional[QRubberBand] = None
+        self._last_drop_target = None
+        self.disabled_cols: set[int] = set()
+        self._dragging_src: Optional[Tuple[int, int]] = None
+        # drop-ul calculat pentru celula de sub cursor (dragMoveEvent) si stratul care il arata
+        self._drop_plan_cache: Optional[_DropPlan] = None
+        self._drop_preview: Optional[_DropPreview] = None
+        # dialogul de editare, refolosit intre deschideri
+        self._editor_dialog = None
+
+        # dirty tracking: evenimentele create / mutate / redimensionate / editate
+        # si cele sterse de la ultima sincronizare cu store-ul (cheie = id(ev))
+        self._changed_events: Dict[int, CalendarEvent] = {}
+        self._removed_events: Dict[int, CalendarEvent] = {}
+        # > 0 in interiorul unui _batched_update (fara redesenari si fara changed la fiecare pas)
+        self._batch_depth = 0
+        self._batch_dirty = False
+
+        # undo / redo: operatiile userului sunt inregistrate ca delte (vezi edit_history);
+        # history_key = saptamana afisata (setata de WeekCalendarWidget)
+        self.history = EditHistory()
+        self.history_key = None
+        self._edit_deltas: Optional[list] = None
+        self._edit_label = ""
+        self._edit_depth = 0
+
+    # ===================== Dirty tracking =====================
+
+    def _mark_changed(self, ev: CalendarEvent):
+        """Noteaza un eveniment creat sau modificat de user."""
+        self._changed_events[id(ev)] = ev
+        self._emit_changed()
+
+    def _mark_removed(self, ev: CalendarEvent):
+        """Noteaza un eveniment sters de user."""
+        self._changed_events.pop(id(ev), None)
+        self._removed_events[id(ev)] = ev
+        self._emit_changed()
+
+    def _emit_changed(self):
+        # un resize emite o singura data, la final (vezi _end_resize), nu la fiecare pas;
+        # la fel un batch (vezi _batched_update)
+        if self._batch_depth:
+            self._batch_dirty = True
+        elif not self._resize_active:
+            self.changed.emit()
+
+    @contextmanager
+    def _batched_update(self):
+        """
+        Grupeaza mai multe modificari intr-o singura actualizare a UI-ului: redesenarea e
+        suspendata pana la final, iar changed e emis o singura data (daca s-a modificat ceva).
+        """
+        if self._batch_depth == 0:
+            self._batch_dirty = False
+            self.setUpdatesEnabled(False)
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.setUpdatesEnabled(True)
+                if self._batch_dirty:
+                    self._batch_dirty = False
+                    self._emit_changed()
+
+    def is_dirty(self) -> bool:
+        """True daca exista modificari nesincronizate cu store-ul."""
+        return bool(self._changed_events or self._removed_events)
+
+    def take_changes(self) -> Tuple[list[CalendarEvent], list[CalendarEvent]]:
+        """Returneaza (modificate, sterse) de la ultima sincronizare si reseteaza evidenta."""
+        changed = list(self._changed_events.values())
+        removed = list(self._removed_events.values())
+        self._changed_events.clear()
+        self._removed_events.clear()
+        return changed, removed
+
+    # ===================== Undo / redo =====================
+
+    def _begin_edit(self, label: str):
+        """Deschide o comanda de undo: modificarile pana la _end_edit sunt anulate impreuna."""
+        if self._edit_depth == 0:
+            self._edit_deltas = []
+            self._edit_label = label
+        self._edit_depth += 1
+
+    def _end_edit(self):
+        """Inchide comanda deschisa de _begin_edit si o adauga in istoric (daca a modificat ceva)."""
+        self._edit_depth -= 1
+        if self._edit_depth > 0:
+            return
+        deltas, self._edit_deltas = self._edit_deltas, None
+        if deltas:
+            self.history.push(EditCommand(self._edit_label, self.history_key, deltas))
+
+    @contextmanager
+    def _edit_command(self, label: str):
+        self._begin_edit(label)
+        try:
+            yield
+        finally:
+            self._end_edit()
+
+    def _record(self, delta: tuple):
+        append_delta(self._edit_deltas, delta)
+
+    @staticmethod
+    def _event_fields(ev: CalendarEvent) -> tuple:
+        return (
+            ev.title, ev.duration, ev.color.rgb() & 0xFFFFFF, ev.description,
+            ev.locked, ev.repeat_count, ev.repeat_forever, ev.is_generated,
+            ev.start_offset, ev.end_offset,
+        )
+
+    @staticmethod
+    def _event_geometry(ev: CalendarEvent) -> tuple:
+        return ev.start_row, ev.duration, ev.start_offset, ev.end_offset
+
+    @staticmethod
+    def _event_attrs(ev: CalendarEvent) -> tuple:
+        return ev.title, ev.description, ev.locked, ev.repeat_count, ev.repeat_forever
+
+    def undo(self) -> bool:
+        """Anuleaza ultima operatie a userului. Intoarce False daca nu exista sau nu se mai poate aplica."""
+        command = self.history.pop_undo()
+        if command is None:
+            return False
+        return self._apply_deltas(command.undo_deltas())
+
+    def redo(self) -> bool:
+        """Reface ultima operatie anulata. Intoarce False daca nu exista sau nu se mai poate aplica."""
+        command = self.history.pop_redo()
+        if command is None:
+            return False
+        return self._apply_deltas(command.deltas)
+
+    def _apply_deltas(self, deltas) -> bool:
+        """
+        Aplica deltele unei comenzi: toate sau niciuna. Daca tabelul nu mai corespunde
+        istoricului (ex. calendar reincarcat), deltele deja aplicate sunt anulate in ordine
+        inversa si istoricul e sters.
+        """
+        with tracer.span("undo_apply", deltas=len(deltas)), self._batched_update():
+            for applied, delta in enumerate(deltas):
+                if not self._apply_delta(delta):
+                    for done in reversed(deltas[:applied]):
+                        self._apply_delta(invert(done))
+                    self.history.clear()
+                    return False
+        return True
+
+    def _apply_delta(self, delta: tuple) -> bool:
+        """Aplica o delta; False daca tabelul nu contine ce asteapta delta (nu se modifica nimic)."""
+        kind, col, row = delta[:3]
+        if kind == DELTA_MOVE:
+            row = row[0]
+        ev = self.events_by_pos.get((row, col))
+        if kind == DELTA_ADD:
+            if ev is not None:
+                return False
+            (title, duration, rgb, description, locked, repeat_count,
+             repeat_forever, is_generated, start_offset, end_offset) = delta[3]
+            ev = CalendarEvent(
+                title=title,
+                start_row=row,
+                day_col=col,
+                duration=duration,
+                color=QColor(rgb),
+                description=description,
+                locked=locked,
+                repeat_count=repeat_count,
+                repeat_forever=repeat_forever,
+                is_generated=is_generated,
+                start_offset=start_offset,
+                end_offset=end_offset,
+            )
+            self._place_event(ev)
+            self._mark_changed(ev)
+            return True
+
+        if ev is None:
+            return False
+        if kind == DELTA_REMOVE:
+            if self._event_fields(ev) != delta[3]:
+                return False
+            self._remove_event(ev)
+            self._mark_removed(ev)
+        elif kind == DELTA_MOVE:
+            if self._event_geometry(ev) != delta[2]:
+                return False
+            start_row, duration, start_offset, end_offset = delta[3]
+            self._move_event(ev, start_row, duration, (start_offset, end_offset))
+            self._mark_changed(ev)
+        else:
+            if self._event_attrs(ev) != delta[3]:
+                return False
+            ev.title, ev.description, ev.locked, ev.repeat_count, ev.repeat_forever = delta[4]
+            self._refresh_event(ev)
+            self._mark_changed(ev)
+        return True
+
+    # ===================== Operatii pe model + desen =====================
+
+    def _place_event(self, ev: CalendarEvent):
+        """Adauga un eveniment in model si il deseneaza."""
+        if self._edit_deltas is not None:
+            self._record((DELTA_ADD, ev.day_col, ev.start_row, self._event_fields(ev)))
+        self.events_by_pos[(ev.start_row, ev.day_col)] = ev
+        self._show_event(ev)
+
+    def _remove_event(self, ev: CalendarEvent):
+        """Scoate un eveniment din model si din tabel."""
+        if self._edit_deltas is not None:
+            self._record((DELTA_REMOVE, ev.day_col, ev.start_row, self._event_fields(ev)))
+        key = (ev.start_row, ev.day_col)
+        self._hide_event(*key)
+        self.events_by_pos.pop(key, None)
+
+    def _move_event(self, ev: CalendarEvent, start_row: int, duration: int, offsets: Optional[Tuple[int, int]] = None):
+        """
+        Muta / redimensioneaza un eveniment pe coloana lui, in model si in tabel.
+        Fara offsets, marginea mutata se aliniaza la slot, iar cealalta isi pastreaza minutele.
+        """
+        if offsets is None:
+            offsets = (
+                ev.start_offset if start_row == ev.start_row else 0,
+                ev.end_offset if start_row + duration == ev.start_row + ev.duration else 0,
+            )
+        if self._edit_deltas is not None:
+            self._record((DELTA_MOVE, ev.day_col, self._event_geometry(ev), (start_row, duration) + offsets))
+        old_key = (ev.start_row, ev.day_col)
+        self._hide_event(*old_key)
+        self.events_by_pos.pop(old_key, None)
+
+        ev.start_row = start_row
+        ev.duration = duration
+        ev.start_offset, ev.end_offset = offsets
+        self.events_by_pos[(start_row, ev.day_col)] = ev
+        self._show_event(ev)
+
+    def apply_week_layout(self, events: list[CalendarEvent]) -> int:
+        """
+        Aplica incremental layout-ul unei saptamani: compara cu evenimentele afisate
+        si atinge doar celulele / span-urile care difera (seriile care raman pe
+        aceleasi celule nu sunt redesenate). Intoarce numarul de blocuri atinse.
+        """
+        incoming = {(ev.start_row, ev.day_col): ev for ev in events}
+        touched = 0
+
+        for key, current in list(self.events_by_pos.items()):
+            new_ev = incoming.get(key)
+            if new_ev is None or not self._same_block(current, new_ev):
+                self._remove_event(current)
+                touched += 1
+
+        for key, ev in incoming.items():
+            if key in self.events_by_pos:
+                # acelasi bloc vizual: inlocuim doar obiectul din model (flag-uri, descriere)
+                self.events_by_pos[key] = ev
+            else:
+                self._place_event(ev)
+                touched += 1
+
+        return touched
+
+    @staticmethod
+    def _same_block(a: CalendarEvent, b: CalendarEvent) -> bool:
+        """True daca doua evenimente (de la aceeasi pozitie) arata identic in tabel."""
+        return a.duration == b.duration and a.title == b.title and a.color.rgb() == b.color.rgb()
+
+    def _event_at(self, p) -> Optional[CalendarEvent]:
+        """Evenimentul care acopera punctul p (coordonate viewport), daca exista."""
+        row = self.rowAt(p.y())
+        col = self.columnAt(p.x())
+        if row < 0 or col < 0:
+            return None
+        return self.events_by_pos.event_covering(row, col)
+
+    def _event_rect(self, ev: CalendarEvent) -> QRect:
+        """Dreptunghiul (in viewport) ocupat de un eveniment, pe toata durata lui."""
+        return self._rows_rect(ev.day_col, ev.start_row, ev.duration)
+
+    def _rows_rect(self, col: int, start_row: int, span_len: int) -> QRect:
+        """Dreptunghiul (in viewport) al randurilor [start_row, start_row + span_len) din coloana col."""
+        last_row = min(start_row + span_len, self.rowCount()) - 1
+        top = self.rowViewportPosition(start_row)
+        bottom = self.rowViewportPosition(last_row) + self.rowHeight(last_row)
+        return QRect(self.columnViewportPosition(col), top, self.columnWidth(col), bottom - top)
+
+    # ===================== Interactiuni mouse / drag =====================
+
+    def mousePressEvent(self, event: QMouseEvent):
+        """Gestioneaza apasarea mouse-ului: pregateste resize sau drag pentru un eveniment."""
+        if event.button() == Qt.MouseButton.LeftButton:
+            posf = event.position()
+            p = posf.toPoint()
+            ev = self._event_at(p)
+            if ev is not None:
+                if ev.day_col in self.disabled_cols:
+                    return
+                near_top, near_bottom = self._is_near_vertical_edge(ev, posf.y())
+                if near_top or near_bottom:
+                    self._begin_resize(ev, 'top' if near_top else 'bottom')
+                    return
+            self.dragStartPosition = p
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event: QMouseEvent):
+        """Gestioneaza miscarea mouse-ului: actualizeaza resize sau porneste drag-ul unui eveniment."""
+        if self._resize_active:
+            row = self.rowAt(event.position().toPoint().y())
+            # miscarile in acelasi rand nu schimba nimic
+            if row != self._resize_last_row:
+                self._resize_last_row = row
+                self._update_resize(row)
+            return
+
+        posf = event.position()
+        p = posf.toPoint()
+        ev = self._event_at(p)
+        if ev is not None:
+            self._update_edge_cursor(ev, posf.y())
+        else:
+            self.viewport().unsetCursor()
+
+        if not (event.buttons() & Qt.LeftButton):
+            return
+        if not self.dragStartPosition:
+            return
+        if (p - self.dragStartPosition).manhattanLength() < QApplication.startDragDistance():
+            return
+
+        ev = self._event_at(self.dragStartPosition)
+        if ev is None:
+            return
+        if ev.locked:
+            # evenimentul este locked -> nu permitem drag
+            return
+
+        self._dragging_src = (ev.start_row, ev.day_col)
+
+        drag = QDrag(self)
+        drag.setMimeData(EventDragPayload.for_event(ev).to_mime())
+
+        # dropEvent muta deja evenimentul in model si in tabel
+        drag.exec(Qt.MoveAction)
+        self._last_drop_target = None
+        self._dragging_src = None
+
+    def mouseReleaseEvent(self, event: QMouseEvent):
+        """incheie operatiunile de resize la eliberarea butonului de mouse."""
+        if event.button() == Qt.MouseButton.LeftButton and self._resize_active:
+            self._end_resize()
+            return
+        super().mouseReleaseEvent(event)
+
+    def mouseDoubleClickEvent(self, event: QMouseEvent):
+        """Deschide un dialog pentru a crea sau edita un eveniment (nume + descriere + locked)."""
+        posf = event.position()
+        p = posf.toPoint()
+
+        row = self.rowAt(p.y())
+        col = self.columnAt(p.x())
+        if row < 0 or col < 0:
+            return
+
+        if col in self.disabled_cols:
+            return
+
+        # Gasim evenimentul care acopera (row, col), chiar daca userul a dat click pe mijlocul span-ului
+        existing_ev = self.events_by_pos.event_covering(row, col)
+
+        # numele zilelor, in aceeasi ordine ca header-ul tabelului
+        day_names = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+        if existing_ev is not None:
+            # EDITARE eveniment existent
+            day_name = day_names[existing_ev.day_index] if 0 <= existing_ev.day_index < len(
+                day_names) else f"Day {existing_ev.day_index}"
+            time_info = self._time_info(day_name, existing_ev.start_row, existing_ev.duration)
+
+            span = tracer.span("dialog_open")
+            dlg = self._event_dialog()
+            dlg.reset(
+                title=existing_ev.title,
+                description=existing_ev.description,
+                locked=existing_ev.locked,
+                time_info=time_info,
+                repeat_count=existing_ev.repeat_count,
+                repeat_forever=existing_ev.repeat_forever,
+            )
+            self._end_when_shown(span)
+            if dlg.exec() == QDialog.Accepted:
+                new_title, new_desc, new_locked, repeat_count, repeat_forever = dlg.get_values()
+                if new_title:
+                    old_attrs = self._event_attrs(existing_ev)
+                    existing_ev.title = new_title
+                    existing_ev.description = new_desc
+                    existing_ev.locked = new_locked
+                    existing_ev.repeat_count = repeat_count
+                    existing_ev.repeat_forever = repeat_forever
+                    new_attrs = self._event_attrs(existing_ev)
+                    if new_attrs != old_attrs:
+                        with self._edit_command("Edit"):
+                            self._record((DELTA_EDIT, existing_ev.day_col, existing_ev.start_row, old_attrs, new_attrs))
+                    self._refresh_event(existing_ev)
+                    self._mark_changed(existing_ev)
+            return
+
+        # CREARE eveniment nou
+        day_name = day_names[col] if 0 <= col < len(day_names) else f"Day {col}"
+        time_info = self._time_info(day_name, row, 1)
+
+        span = tracer.span("dialog_open")
+        dlg = self._event_dialog()
+        dlg.reset(time_info=time_info)
+        self._end_when_shown(span)
+        if dlg.exec() == QDialog.Accepted:
+            new_title, new_desc, new_locked, repeat_count, repeat_forever = dlg.get_values()
+            if not new_title:
+                return
+
+            random_color = QColor(
+                random.randint(100, 255),
+                random.randint(100, 255),
+                random.randint(100, 255)
+            )
+            new_ev = CalendarEvent(
+                title=new_title,
+                start_row=row,
+                day_col=col,
+                duration=1,
+                color=random_color,
+                description=new_desc,
+                locked=new_locked,
+                repeat_count=repeat_count,
+                repeat_forever=repeat_forever,
+            )
+            with self._edit_command("Create"):
+                self._place_event(new_ev)
+            self._mark_changed(new_ev)
+
+    def _time_info(self, day_name: str, start_row: int, span_len: int) -> str:
+        """Textul cu ziua si intervalul orar afisat in dialog (ex. "Monday, 09:15 - 10:00")."""
+        end = slot_time(start_row + span_len, self.slot_minutes)
+        return f"{day_name}, {slot_time(start_row, self.slot_minutes)} - {end}"
+
+    def _event_dialog(self):
+        """Dialogul de editare, creat la primul dublu-click si refolosit apoi (vezi EventEditDialog.reset)."""
+        if self._editor_dialog is None:
+            # importat la prima folosire, nu la pornirea aplicatiei
+            from event_dialog import EventEditDialog
+            self._editor_dialog = EventEditDialog(parent=self)
+        return self._editor_dialog
+
+    @staticmethod
+    def _end_when_shown(span):
+        """Incheie masuratoarea deschiderii dialogului la primul pas din bucla lui exec() (dialog afisat)."""
+        if span:
+            QTimer.singleShot(0, span.end)
+
+    # ===================== Drag & drop =====================
+
+    def dragEnterEvent(self, event):
+        """Accepta intrarea unui drag in tabel."""
+        self._clear_drop_preview()
+        event.acceptProposedAction()
+
+    def dragMoveEvent(self, event):
+        """
+        Calculeaza drop-ul pentru celula de sub cursor (doar cand se schimba celula)
+        si evidentiaza tinta si conflictele; un drop peste evenimente locked e refuzat.
+        """
+        previous = self._drop_plan_cache
+        plan = self._drop_plan(event)
+        if plan is None:
+            self._hide_drop_preview()
+            event.ignore()
+            return
+        if plan is not previous:
+            self._show_drop_preview(plan)
+        if plan.blocked:
+            event.ignore()
+        else:
+            event.acceptProposedAction()
+
+    def dragLeaveEvent(self, event):
+        """Sterge preview-ul cand drag-ul paraseste tabelul."""
+        self._clear_drop_preview()
+        event.accept()
+
+    def dropEvent(self, event):
+        """Gestioneaza logica de drop: mutare eveniment existent sau creare nou eveniment si rezolvarea conflictelor."""
+        pos = event.position().toPoint()
+        if not self._constraint_inside_window(self.rowAt(pos.y()), self.columnAt(pos.x())):
+            self._clear_drop_preview()
+            self._last_drop_target = None
+            event.ignore()
+            return
+
+        # planul calculat de dragMoveEvent pentru aceeasi celula (altfel se calculeaza acum)
+        plan = self._drop_plan(event)
+        self._clear_drop_preview()
+        if plan is None:
+            event.ignore()
+            return
+
+        original_ev = plan.original
+        if original_ev is not None and original_ev.locked:
+            QMessageBox.information(self, "Locked event", "This event is locked and cannot be moved.")
+            event.ignore()
+            return
+
+        if original_ev is not None and (plan.col, plan.start_row, plan.duration) == (
+            original_ev.day_col, original_ev.start_row, original_ev.duration
+        ):
+            # evenimentul e lasat inapoi pe locul lui: nicio comanda de undo, nimic de salvat
+            self._dragging_src = None
+            self._last_drop_target = (plan.start_row, plan.col)
+            event.acceptProposedAction()
+            return
+
+        if not self._confirm_conflicts(plan.title, plan.conflicts):
+            event.ignore()
+            return
+        new_start = plan.start_row
+        with self._edit_command("Drop"), self._batched_update():
+            self._resolve_conflicts(plan.conflicts, new_start, new_start + max(1, plan.duration) - 1)
+
+            if original_ev is not None:
+                # muta evenimentul existent; o mutare intreaga pastreaza minutele de pe ambele margini
+                offsets = None
+                if plan.duration == original_ev.duration:
+                    offsets = (original_ev.start_offset, original_ev.end_offset)
+                self._move_event(original_ev, new_start, plan.duration, offsets)
+                self._mark_changed(original_ev)
+                self._dragging_src = None
+            else:
+                # creeaza un eveniment nou
+                new_ev = CalendarEvent(
+                    title=plan.title,
+                    start_row=new_start,
+                    day_col=plan.col,
+                    duration=plan.duration,
+                    color=plan.color if plan.color else QColor(Qt.yellow)
+                )
+                self._place_event(new_ev)
+                self._mark_changed(new_ev)
+
+        self._last_drop_target = (new_start, plan.col)
+        event.acceptProposedAction()
+
+    def _drop_plan(self, event) -> Optional[_DropPlan]:
+        """
+        Drop-ul (tinta + conflicte) pentru pozitia si payload-ul unui eveniment de drag.
+        Rezultatul e pastrat pana se schimba celula, deci miscarile in aceeasi celula
+        si dropEvent nu mai cauta conflictele din nou.
+        """
+        pos = event.position().toPoint()
+        row = self.rowAt(pos.y())
+        col = self.columnAt(pos.x())
+        payload = EventDragPayload.from_mime(event.mimeData())
+        key = (row, col, payload, self._dragging_src)
+
+        plan = self._drop_plan_cache
+        if plan is not None and plan.key == key:
+            return plan
+
+        plan = None
+        if self._constraint_inside_window(row, col) and col not in self.disabled_cols:
+            plan = self._compute_drop_plan(key, row, col, payload)
+        self._drop_plan_cache = plan
+        return plan
+
+    def _compute_drop_plan(self, key: tuple, row: int, col: int, payload: EventDragPayload) -> _DropPlan:
+        original_ev = payload.source_event(self.events_by_pos)
+        if original_ev is None and payload.event_id is None and self._dragging_src is not None:
+            # payload text ("span|titlu"), fara identitate: sursa e drag-ul pornit din acest tabel
+            original_ev = self.events_by_pos.get(self._dragging_src)
+
+        if original_ev is not None:
+            # CONSTRaNGERE 1: nu schimbam ziua
+            col = self._constraint_same_day_column(original_ev, col)
+            # CONSTRaNGERE 2: evenimentul ramane in zi
+            row, duration = self._constraint_within_day(row, original_ev.duration)
+            if row + duration > self.rowCount():
+                row = max(0, self.rowCount() - duration)
+            conflicts = [
+                ev for ev in self.events_by_pos.overlapping(col, row, row + duration - 1)
+                if ev is not original_ev
+            ]
+            return _DropPlan(key, original_ev, col, row, duration, conflicts, original_ev.title, None)
+
+        row, duration = self._constraint_within_day(row, payload.duration)
+        conflicts = self._find_overlaps(row, duration, col)
+        return _DropPlan(key, None, col, row, duration, conflicts, payload.title, payload.color)
+
+    def _show_drop_preview(self, plan: _DropPlan):
+        if self._drop_preview is None:
+            self._drop_preview = _DropPreview(self.viewport())
+        self._drop_preview.show_plan(
+            self._rows_rect(plan.col, plan.start_row, plan.duration),
+            [(self._event_rect(ev), ev.locked) for ev in plan.conflicts],
+        )
+
+    def _hide_drop_preview(self):
+        if self._drop_preview is not None:
+            self._drop_preview.hide()
+
+    def _clear_drop_preview(self):
+        """Uita drop-ul calculat si ascunde preview-ul (drag incheiat sau iesit din tabel)."""
+        self._drop_plan_cache = None
+        self._hide_drop_preview()
+
+    def _confirm_conflicts(self, title: str, conflicts: list[CalendarEvent]) -> bool:
+        """
+        Verifica conflictele unui drop: refuza daca exista evenimente locked,
+        altfel cere confirmarea userului pentru ajustare. Intoarce True daca se poate continua.
+        """
+        locked_conflicts = [ev for ev in conflicts if getattr(ev, "locked", False)]
+        if locked_conflicts:
+            QMessageBox.warning(
+                self,
+                "Locked conflict",
+                "You cannot place an event over a locked event."
+            )
+            return False
+
+        if not conflicts:
+            return True
+
+        msg = QMessageBox(self)
+        msg.setIcon(QMessageBox.Warning)
+        msg.setWindowTitle("Conflict detected")
+        msg.setText(
+            f"Event '{title}' overlaps with {len(conflicts)} event(s).\nApply shrink adjustment?"
+        )
+        msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        msg.button(QMessageBox.Yes).setText("Yes, adjust")
+        msg.button(QMessageBox.No).setText("No, cancel")
+        return msg.exec() != QMessageBox.No
+
+    def _resolve_conflicts(self, conflicts: list[CalendarEvent], new_start: int, new_end: int):
+        """Ajusteaza (split / shrink / sterge) evenimentele care se suprapun cu [new_start, new_end]."""
+        with tracer.span("drop_conflicts", conflicts=len(conflicts)) as span:
+            ops = plan_conflicts([(ev.start_row, ev.duration) for ev in conflicts], new_start, new_end)
+            span.count(ops=len(ops))
+            if ops:
+                with self._batched_update():
+                    for op in ops:
+                        self._apply_conflict_op(conflicts[op.index], op)
+
+    def _apply_conflict_op(self, ev: CalendarEvent, op: ConflictOp):
+        """Aplica o operatie din planul de conflicte (vezi conflict_planner) pe model si in tabel."""
+        if op.kind == REMOVE:
+            self._remove_event(ev)
+            self._mark_removed(ev)
+            return
+
+        end_offset = ev.end_offset
+        self._move_event(ev, op.start, op.duration)
+        self._mark_changed(ev)
+        if op.kind == SPLIT:
+            # partea de jos pastreaza sfarsitul (si minutele lui) evenimentului original
+            ev_bottom = CalendarEvent(
+                title=ev.title,
+                start_row=op.tail_start,
+                day_col=ev.day_col,
+                duration=op.tail_duration,
+                color=ev.color,
+                description=ev.description,
+                end_offset=end_offset,
+            )
+            self._place_event(ev_bottom)
+            self._mark_changed(ev_bottom)
+
+    # ===================== Resize logic =====================
+
+    def _is_near_vertical_edge(self, ev: CalendarEvent, y: float):
+        """Verifica daca pozitia y este aproape de marginea verticala a unui eveniment (sus sau jos)."""
+        rect = self._event_rect(ev)
+        return (
+            abs(y - rect.top()) <= self._resize_margin_px,
+            abs(y - rect.bottom()) <= self._resize_margin_px
+        )
+
+    def _begin_resize(self, ev: CalendarEvent, edge: str):
+        """Porneste modul de resize pentru un eveniment, daca nu este locked."""
+        if ev.locked:
+            # evenimentul e locked -> nu permitem resize
+            return
+
+        if ev.day_col in self.disabled_cols:
+            return
+
+        self._resize_active = True
+        self._resize_edge = edge
+        span = max(1, ev.duration)
+        top_row = ev.start_row
+        bottom_row = top_row + span - 1
+        self._resize_anchor_row = top_row if edge == 'bottom' else bottom_row
+        self._resize_col = ev.day_col
+
+        self._span_top_row = top_row
+        self._span_len = span
+        self._resize_event = ev
+        self._resize_last_row = None
+        # tot resize-ul (si, fara preview, toate mutarile intermediare) e o singura comanda
+        self._begin_edit("Resize")
+
+    def _compute_span(self, anchor_row: int, target_row: int, edge: str):
+        """Calculeaza noul start si noua lungime de span in functie de anchor si pozitia target."""
+        if edge == 'bottom':
+            start_row = anchor_row
+            end_row = max(target_row, start_row)
+        else:
+            end_row = anchor_row
+            start_row = min(target_row, end_row)
+        new_span = max(1, end_row - start_row + 1)
+        return start_row, new_span
+
+    def _update_resize(self, target_row: int):
+        """Actualizeaza redimensionarea in timpul drag-ului (preview sau, fara preview, direct in model)."""
+        if target_row < 0:
+            return
+        with tracer.span("resize_update") as span:
+            self._apply_resize(target_row)
+            span.count(span_len=self._span_len)
+
+    def _apply_resize(self, target_row: int):
+        start_row, new_span = self._compute_span(
+            self._resize_anchor_row, target_row, self._resize_edge
+        )
+        if self._resize_edge == 'bottom':
+            limit = self._nearest_blocking_event(
+                self._span_top_row,
+                start_row + new_span - 1,
+                self._resize_col,
+                'bottom'
+            )
+            if limit is not None:
+                new_span = max(1, limit - self._span_top_row + 1)
+
+        else:
+            limit = self._nearest_blocking_event(
+                start_row,
+                self._span_top_row + self._span_len - 1,
+                self._resize_col,
+                'top'
+            )
+            if limit is not None:
+                start_row = limit
+                new_span = (self._span_top_row + self._span_len) - start_row
+
+        start_row, new_span = self._constraint_within_day(start_row, new_span)
+
+        if self.resize_preview:
+            self._show_resize_preview(start_row, new_span)
+        elif self._resize_event is not None:
+            self._move_event(self._resize_event, start_row, new_span)
+            self._mark_changed(self._resize_event)
+
+        self._span_top_row = start_row
+        self._span_len = new_span
+
+    def _show_resize_preview(self, start_row: int, span_len: int):
+        """Deseneaza dreptunghiul pe care l-ar ocupa evenimentul redimensionat."""
+        if self._rubber_band is None:
+            self._rubber_band = QRubberBand(QRubberBand.Shape.Rectangle, self.viewport())
+        self._rubber_band.setGeometry(self._rows_rect(self._resize_col, start_row, span_len))
+        self._rubber_band.show()
+
+    def _end_resize(self):
+        """Finalizeaza operatia de resize (aplica preview-ul) si reseteaza starea interna."""
+        self._resize_active = False
+        if self.resize_preview:
+            if self._rubber_band is not None:
+                self._rubber_band.hide()
+            ev = self._resize_event
+            if ev is not None and (ev.start_row, ev.duration) != (self._span_top_row, self._span_len):
+                # o singura mutare in model si in tabel; _mark_changed emite changed
+                self._move_event(ev, self._span_top_row, self._span_len)
+                self._mark_changed(ev)
+        elif self.is_dirty():
+            self.changed.emit()
+        self._end_edit()
+        self._resize_event = None
+        self._resize_last_row = None
+        self._resize_edge = None
+        self._resize_anchor_row = None
+        self._resize_col = None
+        self._span_top_row = None
+        self._span_len = 1
+        self.viewport().unsetCursor()
+
+    def _update_edge_cursor(self, ev: CalendarEvent, y: float):
+        """Actualizeaza cursorul pentru a indica posibilitatea de resize la marginea unui eveniment."""
+        near_top, near_bottom = self._is_near_vertical_edge(ev, y)
+        if near_top or near_bottom:
+            self.viewport().setCursor(Qt.CursorShape.SizeVerCursor)
+        else:
+            self.viewport().unsetCursor()
+
+    # ===================== Overlap & ajustare evenimente =====================
+
+    def _intervals_overlap(self, a_start: int, a_end: int, b_start: int, b_end: int) -> bool:
+        """Verifica daca doua intervale [a_start, a_end] si [b_start, b_end] se suprapun."""
+        return not (a_end < b_start or a_start > b_end)
+
+    def _overlap_info(self, start_row: int, span_len: int, col: int):
+        """Returneaza primul eveniment care se suprapune cu intervalul dat si informatii despre overlap."""
+        new_start = start_row
+        new_end = start_row + max(1, span_len) - 1
+        for ev in self.events_by_pos.overlapping(col, new_start, new_end):
+            ev_start = ev.start_row
+            ev_end = ev.start_row + ev.duration - 1
+            overlap_len = min(new_end, ev_end) - max(new_start, ev_start) + 1
+            top_is_new = new_start < ev_start
+            return ev, overlap_len, top_is_new
+        return None, 0, False
+
+    def _find_overlaps(self, start_row: int, span_len: int, col: int):
+        """Returneaza toate evenimentele care se suprapun cu intervalul dat pe o coloana, ordonate de sus in jos."""
+        new_start = start_row
+        new_end = start_row + max(1, span_len) - 1
+
+        # indexul intoarce deja evenimentele ordonate dupa start_row
+        return [
+            ev for ev in self.events_by_pos.overlapping(col, new_start, new_end)
+            if self._dragging_src is None or (ev.start_row, col) != self._dragging_src
+        ]
+
+    # ===================== Constrangeri ======================
+
+    def _nearest_blocking_event(self, start_row: int, end_row: int, col: int, edge: str):
+        """Gaseste cel mai apropiat eveniment care blocheaza extinderea resize-ului in sus sau in jos."""
+        index = self.events_by_pos.index
+
+        if edge == 'bottom':
+            # primul eveniment care incepe sub start_row, dar inainte de end_row
+            ev_start = index.first_start_after(col, start_row)
+            if ev_start is not None and ev_start <= end_row:
+                return ev_start - 1
+            return None
+
+        # cel mai de jos eveniment care se termina in [start_row, end_row)
+        limit = None
+        for ev_start, duration in index.overlapping(col, start_row, end_row - 1):
+            ev_end = ev_start + duration - 1
+            if ev_start == start_row and ev_end == end_row:
+                continue
+            if ev_end < end_row and (limit is None or ev_end + 1 > limit):
+                limit = ev_end + 1
+        return limit
+
+    def _constraint_same_day_column(self, original_ev: CalendarEvent, drop_col: int) -> int:
+        """
+        Constrangere: un eveniment nu poate fi mutat pe alta zi.
+        intoarce mereu coloana din ziua originala a evenimentului, ignorand coloana target.
+        """
+        if original_ev is None:
+            return drop_col
+        return original_ev.day_col
+
+    def _constraint_within_day(self, start_row: int, duration: int) -> Tuple[int, int]:
+        """
+        Constrangere: limiteaza start_row si durata astfel incat evenimentul sa ramana in intervalul [0, rowCount-1].
+        Ajusteaza start_row si duration daca ar iesi in afara zilei.
+        """
+        if self.rowCount() <= 0:
+            return 0, 0
+
+        # clamp start_row in [0, rowCount-1]
+        start_row = max(0, min(start_row, self.rowCount() - 1))
+
+        # daca start_row + duration depaseste ultima ora, scurtam durata
+        max_duration = self.rowCount() - start_row
+        duration = max(1, min(duration, max_duration))
+
+        return start_row, duration
+
+    def _constraint_inside_window(self, row: int, col: int) -> bool:
+        """Constrangere: verifica daca pozitia (row, col) este in interiorul tabelului."""
+        if row < 0 or col < 0:
+            return False
+        if row >= self.rowCount() or col >= self.columnCount():
+            return False
+        return True
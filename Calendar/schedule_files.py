@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import stat
+import tempfile
+import textwrap
+from typing import BinaryIO, Callable, Iterator, Optional, Sequence
+
+from binary_format import PROGRESS_EVERY, write_schedule_binary
+from core_event import CoreEvent
+from sqlite_store import SqliteEventStore
+
+# extensia fisierelor in formatul binar (vezi binary_format.py)
+BINARY_SUFFIX = ".calb"
+# extensiile bazelor de date SQLite (vezi sqlite_store.py); restul sunt JSON
+SQLITE_SUFFIXES = (".sqlite", ".db")
+
+
+def is_binary_schedule(path: str) -> bool:
+    return path.lower().endswith(BINARY_SUFFIX)
+
+
+def is_sqlite_schedule(path: str) -> bool:
+    return path.lower().endswith(SQLITE_SUFFIXES)
+
+
+@contextlib.contextmanager
+def atomic_path(path: str) -> Iterator[str]:
+    """
+    Da calea unui fisier temporar (gol) din acelasi director cu path; la iesirea
+    fara erori il muta atomic peste path (os.replace). Fisierul destinatie este
+    deci fie cel vechi, fie cel nou complet, niciodata unul trunchiat.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".orar-", suffix=".tmp", dir=directory)
+    os.close(fd)
+    try:
+        yield tmp_path
+
+        # mkstemp creeaza fisierul doar cu drepturi pentru proprietar
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+@contextlib.contextmanager
+def atomic_write(path: str) -> Iterator[BinaryIO]:
+    """Ca atomic_path, dar deschide fisierul temporar (binar) si face fsync inainte de mutare."""
+    with atomic_path(path) as tmp_path:
+        with open(tmp_path, "wb") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def write_schedule_json(
+    events: Sequence[CoreEvent],
+    f: BinaryIO,
+    progress: Optional[Callable[[int, int], None]] = None,
+):
+    """Scrie evenimentele in formatul export_all_events (ca json.dump(..., indent=4))."""
+    text = io.TextIOWrapper(f, encoding="utf-8")
+    total = len(events)
+    if not events:
+        text.write('{\n    "events": []\n}')
+    else:
+        text.write('{\n    "events": [\n')
+        for i, ev in enumerate(events, start=1):
+            text.write(textwrap.indent(json.dumps(ev.to_dict(), indent=4), " " * 8))
+            text.write(",\n" if i < total else "\n")
+            if progress is not None and i % PROGRESS_EVERY == 0:
+                progress(i, total)
+        text.write("    ]\n}")
+    text.flush()
+    text.detach()
+
+
+def write_schedule(
+    events: Sequence[CoreEvent],
+    path: str,
+    progress: Optional[Callable[[int, int], None]] = None,
+):
+    """Scrie atomic evenimentele in path, in formatul ales dupa extensie (.calb, SQLite sau JSON)."""
+    if is_sqlite_schedule(path):
+        with atomic_path(path) as tmp_path:
+            store = SqliteEventStore(tmp_path)
+            store.add_many(events)
+            store.close()
+    else:
+        with atomic_write(path) as f:
+            if is_binary_schedule(path):
+                write_schedule_binary(events, f, progress)
+            else:
+                write_schedule_json(events, f, progress)
+    if progress is not None:
+        progress(len(events), len(events))
@@ -0,0 +1,103 @@
+from typing import Dict, Tuple
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor
+
+from models import CalendarEvent
+from event_index import EventPositionMap
+from time_slots import DEFAULT_SLOT_MINUTES, slot_labels
+
+DAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+# culorile header-ului pentru zilele active / dezactivate (create o singura data)
+HEADER_ENABLED_COLOR = QColor("#f5f5f5")
+HEADER_DISABLED_COLOR = QColor("#777777")
+
+
+class ScheduleModel(QAbstractTableModel):
+    """
+    Model Qt pentru o saptamana din orar: randuri = slot-uri (de slot_minutes minute), coloane = zile.
+
+    Datele sunt citite direct din events_by_pos (layout-ul saptamanii curente),
+    fara item-uri per celula; o schimbare de saptamana este un singur modelReset.
+    """
+
+    def __init__(self, rows: int, cols: int, parent=None, slot_minutes: int = DEFAULT_SLOT_MINUTES):
+        super().__init__(parent)
+        self._rows = rows
+        self._cols = cols
+        self.events_by_pos: Dict[Tuple[int, int], CalendarEvent] = EventPositionMap()
+        self.disabled_cols: set[int] = set()
+        # False cand evenimentele sunt desenate de EventLayer, nu de celule
+        self.paint_cells = True
+        self._day_labels = list(DAY_NAMES[:cols])
+        self._hour_labels = slot_labels(slot_minutes)[:rows]
+
+    # ---------------- interfata QAbstractTableModel ----------------
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._rows
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._cols
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        ev = self.events_by_pos.get((index.row(), index.column()))
+        if ev is None:
+            return None
+        if role == Qt.ToolTipRole:
+            return ev.description or None
+        if not self.paint_cells:
+            return None
+
+        if role == Qt.DisplayRole:
+            return ev.title
+        if role == Qt.BackgroundRole:
+            return ev.color
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if orientation == Qt.Horizontal:
+            if role == Qt.DisplayRole and 0 <= section < len(self._day_labels):
+                return self._day_labels[section]
+            if role == Qt.ForegroundRole:
+                return HEADER_DISABLED_COLOR if section in self.disabled_cols else HEADER_ENABLED_COLOR
+            return None
+
+        if role == Qt.DisplayRole and 0 <= section < len(self._hour_labels):
+            return self._hour_labels[section]
+        return None
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    # ---------------- actualizari ----------------
+
+    def set_events(self, events: list[CalendarEvent]):
+        """Inlocuieste evenimentele saptamanii curente (un singur modelReset)."""
+        self.beginResetModel()
+        self.events_by_pos.clear()
+        for ev in events:
+            self.events_by_pos[(ev.start_row, ev.day_col)] = ev
+        self.endResetModel()
+
+    def cell_changed(self, row: int, col: int):
+        """Anunta view-ul ca celula (row, col) trebuie redesenata."""
+        index = self.index(row, col)
+        self.dataChanged.emit(index, index)
+
+    def set_day_labels(self, labels: list[str]):
+        """Seteaza textul header-ului pentru zile."""
+        self._day_labels = list(labels)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, self._cols - 1)
+
+    def set_disabled_columns(self, cols: list[int]):
+        """Seteaza zilele dezactivate (afisate cu gri in header)."""
+        self.disabled_cols = set(cols)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, self._cols - 1)
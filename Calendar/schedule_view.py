@@ -0,0 +1,129 @@
+from PySide6.QtWidgets import QTableView
+from PySide6.QtCore import Signal
+from PySide6.QtGui import QPainter
+
+from models import CalendarEvent
+from event_layer import EventLayer
+from schedule_model import ScheduleModel
+from schedule_editing import ScheduleEditingMixin
+from time_slots import DEFAULT_SLOT_MINUTES, row_height
+
+
+class ScheduleView(ScheduleEditingMixin, QTableView):
+    """
+    Varianta model/view a ScheduleTable: un QTableView peste ScheduleModel.
+
+    Nu exista QTableWidgetItem-uri; celulele sunt citite din model, iar la schimbarea
+    saptamanii se face un singur modelReset + span-urile evenimentelor.
+
+    Cu painted=True nu se mai folosesc span-uri deloc: blocurile evenimentelor sunt
+    desenate de un EventLayer peste grila, iar o mutare / un resize redeseneaza
+    doar dreptunghiul vechi si cel nou.
+    """
+
+    # emis dupa fiecare modificare facuta de user (vezi ScheduleEditingMixin)
+    changed = Signal()
+
+    def __init__(self, rows: int, cols: int, painted: bool = False, slot_minutes: int = DEFAULT_SLOT_MINUTES):
+        super().__init__()
+        self.slot_minutes = slot_minutes
+        self._model = ScheduleModel(rows, cols, self, slot_minutes)
+        self._model.paint_cells = not painted
+        self.setModel(self._model)
+        self._init_editing_state()
+
+        self._event_layer = EventLayer(self) if painted else None
+
+        self.verticalHeader().setDefaultSectionSize(row_height(slot_minutes))
+        self.horizontalHeader().setDefaultSectionSize(120)
+
+    @property
+    def events_by_pos(self):
+        """Evenimentele saptamanii curente, citite direct din model."""
+        return self._model.events_by_pos
+
+    @property
+    def disabled_cols(self) -> set[int]:
+        return self._model.disabled_cols
+
+    @disabled_cols.setter
+    def disabled_cols(self, cols: set[int]):
+        self._model.disabled_cols = set(cols)
+
+    def rowCount(self) -> int:
+        return self._model.rowCount()
+
+    def columnCount(self) -> int:
+        return self._model.columnCount()
+
+    # ===================== Desen evenimente (span-uri + dataChanged) =====================
+
+    def _show_event(self, ev: CalendarEvent):
+        """Intinde celula de start pe durata evenimentului si o redeseneaza."""
+        if self._event_layer is not None:
+            self.viewport().update(self._event_layer.event_rect(ev))
+            return
+        if ev.duration > 1:
+            self.setSpan(ev.start_row, ev.day_col, ev.duration, 1)
+        self._model.cell_changed(ev.start_row, ev.day_col)
+
+    def _hide_event(self, row: int, col: int):
+        """Scoate span-ul de la (row, col) si redeseneaza celula."""
+        if self._event_layer is not None:
+            ev = self.events_by_pos.get((row, col))
+            if ev is not None:
+                self.viewport().update(self._event_layer.event_rect(ev))
+            return
+        if self.rowSpan(row, col) != 1 or self.columnSpan(row, col) != 1:
+            self.setSpan(row, col, 1, 1)
+        self._model.cell_changed(row, col)
+
+    def _refresh_event(self, ev: CalendarEvent):
+        """Redeseneaza evenimentul dupa editare."""
+        if self._event_layer is not None:
+            self.viewport().update(self._event_layer.event_rect(ev))
+            return
+        self._model.cell_changed(ev.start_row, ev.day_col)
+
+    def paintEvent(self, event):
+        """Deseneaza grila, apoi (in modul painted) blocurile evenimentelor peste ea."""
+        super().paintEvent(event)
+        if self._event_layer is None:
+            return
+        painter = QPainter(self.viewport())
+        self._event_layer.paint(painter, event.rect())
+        painter.end()
+
+    # ===================== HELPERS =====================
+
+    def load_events(self, events: list[CalendarEvent]):
+        """Inlocuieste evenimentele afisate (layout-ul unei saptamani) printr-un singur modelReset."""
+        self.clearSpans()
+        self._model.set_events(events)
+        if self._event_layer is not None:
+            return
+        for ev in events:
+            if ev.duration > 1:
+                self.setSpan(ev.start_row, ev.day_col, ev.duration, 1)
+
+    def apply_week_layout(self, events: list[CalendarEvent]) -> int:
+        """
+        In varianta model/view un modelReset costa deja o singura actualizare,
+        mai putin decat diferentele aplicate celula cu celula.
+        """
+        self.load_events(events)
+        return len(events)
+
+    def reset_table(self):
+        """Sterge toate evenimentele si span-urile."""
+        self.load_events([])
+
+    def set_day_labels(self, labels: list[str]):
+        """Seteaza label-urile pentru header-ul orizontal (zilele)."""
+        if len(labels) == self.columnCount():
+            self._model.set_day_labels(labels)
+
+    def set_disabled_columns(self, cols: list[int]):
+        """Marcheaza anumite coloane (zile) ca fiind 'disabled' (nu se pot edita)."""
+        self._model.set_disabled_columns(cols)
+        self.viewport().update()
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import contextlib
+import sqlite3
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from core_event import CoreEvent
+from event_store import ObservableStore
+from occurrences import Occurrence, iter_occurrences
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    day INTEGER NOT NULL,           -- date.toordinal()
+    weekday INTEGER NOT NULL,       -- 0 = luni
+    start_minute INTEGER NOT NULL,  -- minute de la miezul noptii
+    duration_minutes INTEGER NOT NULL,
+    rgb INTEGER NOT NULL,
+    flags INTEGER NOT NULL,
+    repeat_count INTEGER NOT NULL,
+    series INTEGER NOT NULL,        -- 1 pentru serii (finite sau repeat forever)
+    last_day INTEGER,               -- ziua ultimei aparitii, NULL pentru repeat forever
+    title TEXT NOT NULL,
+    description TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_by_day ON events(series, day);
+CREATE INDEX IF NOT EXISTS events_by_span ON events(last_day, day) WHERE series = 1;
+"""
+
+_INSERT = (
+    "INSERT INTO events (day, weekday, start_minute, duration_minutes, rgb, flags, repeat_count,"
+    " series, last_day, title, description) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# coloanele citite, in ordinea argumentelor din CoreEvent(...)
+_COLUMNS = "title, day, start_minute, duration_minutes, rgb, description, repeat_count, flags"
+
+# seriile active intre doua zile (parametri: last, first, last); cele repeat forever
+# si cele finite sunt cautate separat, fiecare pe un interval din events_by_span
+_SERIES_BETWEEN = (
+    f"SELECT {_COLUMNS} FROM events INDEXED BY events_by_span"
+    " WHERE series = 1 AND last_day IS NULL AND day <= ?"
+    f" UNION ALL SELECT {_COLUMNS} FROM events INDEXED BY events_by_span"
+    " WHERE series = 1 AND last_day >= ? AND day <= ?"
+)
+
+
+def _row_values(ev: CoreEvent) -> tuple:
+    repeat_count = max(1, ev.repeat_count)
+    return (
+        ev.day, (ev.day - 1) % 7, ev.start_minute, ev.duration_minutes, ev.rgb, ev.flags, ev.repeat_count,
+        1 if ev.is_repeating else 0,
+        None if ev.repeat_forever else ev.day + 7 * (repeat_count - 1),
+        ev.title, ev.description,
+    )
+
+
+def _event(row: tuple) -> CoreEvent:
+    title, day, start_minute, duration_minutes, rgb, description, repeat_count, flags = row
+    return CoreEvent(title, day, start_minute, duration_minutes, rgb, description, repeat_count, flags)
+
+
+class SqliteEventStore(ObservableStore):
+    """
+    Store de evenimente pastrat intr-o baza de date SQLite locala, cu aceeasi
+    interfata ca EventStore.
+
+    In memorie nu se tine nimic: fiecare saptamana este citita din baza de date
+    (index pe zi pentru evenimentele simple, pe ultima zi + prima zi pentru serii),
+    deci deschiderea unui calendar de mai multi ani este instantanee. Modificarile
+    facute intr-un batch() sunt scrise intr-o singura tranzactie.
+
+    Evenimentele returnate sunt copii: remove() cauta randul dupa valori, nu dupa identitate.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        super().__init__()
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        self._batch_depth = 0
+
+    def close(self):
+        self._conn.close()
+
+    # ---------------- tranzactii ----------------
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Grupeaza modificarile intr-o singura tranzactie (commit la final, rollback la eroare)."""
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._conn.rollback()
+            raise
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self._conn.commit()
+
+    def _commit(self):
+        if self._batch_depth == 0:
+            self._conn.commit()
+
+    # ---------------- modificari ----------------
+
+    def add(self, ev: CoreEvent):
+        """Adauga un eveniment de baza (la data lui, ev.day)."""
+        self._conn.execute(_INSERT, _row_values(ev))
+        self._commit()
+        self._notify(ev)
+
+    def add_many(self, events: Iterable[CoreEvent]):
+        """Adauga multe evenimente intr-o singura tranzactie; anunta o singura modificare (None)."""
+        with self.batch():
+            self._conn.executemany(_INSERT, (_row_values(ev) for ev in events))
+        self._notify(None)
+
+    def remove(self, ev: CoreEvent):
+        """Scoate primul eveniment de baza egal cu ev."""
+        cursor = self._conn.execute(
+            "DELETE FROM events WHERE id = (SELECT id FROM events WHERE series = ? AND day = ?"
+            " AND start_minute = ? AND duration_minutes = ? AND rgb = ? AND flags = ? AND repeat_count = ?"
+            " AND title = ? AND description = ? LIMIT 1)",
+            (
+                1 if ev.is_repeating else 0, ev.day, ev.start_minute, ev.duration_minutes, ev.rgb, ev.flags,
+                ev.repeat_count, ev.title, ev.description,
+            ),
+        )
+        self._commit()
+        if cursor.rowcount:
+            self._notify(ev)
+
+    def pop_date(self, dstr: str) -> List[CoreEvent]:
+        """Scoate si returneaza toate evenimentele de baza de la data dstr."""
+        events = self.events_on(dstr)
+        self._conn.execute("DELETE FROM events WHERE day = ?", (date.fromisoformat(dstr).toordinal(),))
+        self._commit()
+        for ev in events:
+            self._notify(ev)
+        return events
+
+    def clear(self):
+        """Sterge toate evenimentele."""
+        self._conn.execute("DELETE FROM events")
+        self._commit()
+        self._notify(None)
+
+    # ---------------- interogari ----------------
+
+    def events_on(self, dstr: str) -> List[CoreEvent]:
+        """Evenimentele de baza de la data dstr."""
+        day = date.fromisoformat(dstr).toordinal()
+        rows = self._conn.execute(f"SELECT {_COLUMNS} FROM events WHERE day = ? ORDER BY id", (day,))
+        return [_event(row) for row in rows]
+
+    def week_occurrences(self, monday: date) -> List[Tuple[int, CoreEvent, int]]:
+        """Aparitiile (coloana, eveniment, k) din saptamana care incepe cu monday."""
+        first = monday.toordinal()
+        last = first + 6
+
+        result: List[Tuple[int, CoreEvent, int]] = []
+        for row in self._conn.execute(
+            f"SELECT {_COLUMNS} FROM events WHERE series = 0 AND day BETWEEN ? AND ?", (first, last)
+        ):
+            ev = _event(row)
+            result.append((ev.day - first, ev, 0))
+
+        # seriile active in saptamana; aparitia e in aceeasi zi a saptamanii ca data de baza
+        series: List[Tuple[int, CoreEvent, int]] = []
+        for row in self._conn.execute(_SERIES_BETWEEN, (last, first, last)):
+            ev = _event(row)
+            col = (ev.day - 1) % 7
+            k = (first + col - ev.day) // 7
+            if not ev.repeat_forever and k >= ev.repeat_count:
+                continue
+            series.append((col, ev, k))
+        series.sort(key=lambda occ: (occ[0], occ[1].start_minute))
+        result.extend(series)
+        return result
+
+    def _events_between(self, first_day: int, last_day: int) -> Iterator[CoreEvent]:
+        """Evenimentele de baza care pot avea aparitii intre first_day si last_day."""
+        rows = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM events WHERE series = 0 AND day BETWEEN ? AND ?"
+            f" UNION ALL {_SERIES_BETWEEN}",
+            (first_day, last_day, last_day, first_day, last_day),
+        )
+        return (_event(row) for row in rows)
+
+    @property
+    def events_by_date(self) -> Dict[str, List[CoreEvent]]:
+        """Vederea dict ("YYYY-MM-DD" -> evenimente), construita la cerere (costisitor)."""
+        result: Dict[str, List[CoreEvent]] = {}
+        for ev in self:
+            result.setdefault(ev.dstr, []).append(ev)
+        return result
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+    def __iter__(self) -> Iterator[CoreEvent]:
+        """Itereaza toate evenimentele de baza, in ordinea datelor."""
+        rows = self._conn.execute(f"SELECT {_COLUMNS} FROM events ORDER BY day, id")
+        return (_event(row) for row in rows)
+
+    def iter_occurrences(self, start_date: date, end_date: date) -> Iterator[Occurrence]:
+        """Aparitiile dintre start_date si end_date, lazy si in ordine cronologica."""
+        events = self._events_between(start_date.toordinal(), end_date.toordinal())
+        return iter_occurrences(events, start_date, end_date)
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import contextlib
+import mmap
+import os
+import threading
+from itertools import islice
+
+from PySide6.QtCore import QCoreApplication, QObject, QThreadPool, Signal
+
+from background_io import FunctionTask
+from binary_format import BinaryScheduleFile
+from core_event import CoreEvent
+from event_stream import JsonEventReader
+from instrumentation import tracer
+from schedule_files import is_binary_schedule
+
+
+class StreamingLoader(QObject):
+    """
+    Incarca un fisier de orar (JSON sau .calb) in store bucata cu bucata.
+
+    Citirea si decodarea (JsonEventReader / BinaryScheduleFile) ruleaza pe un thread
+    din QThreadPool; bucatile de cel mult chunk_size evenimente sunt trimise in UI,
+    unde sunt adaugate in store cu add_many(). Thread-ul de citire asteapta daca UI-ul
+    are deja MAX_PENDING_CHUNKS bucati neprocesate, deci in memorie sunt doar cateva
+    bucati, nu tot documentul JSON. Un .calb este deschis cu mmap (ca in MappedEventStore),
+    deci nici el nu este citit in memorie dintr-o data.
+    """
+
+    MAX_PENDING_CHUNKS = 2
+
+    # progres (facut, total): octeti pentru JSON, evenimente pentru .calb
+    progress = Signal(int, int)
+    # CoreEvent-urile adaugate la pasul curent
+    chunk_loaded = Signal(list)
+    # numarul total de evenimente incarcate
+    finished = Signal(int)
+    failed = Signal(str)
+
+    # intern: bucata decodata pe thread-ul de citire (evenimente, facut, total, ultima)
+    _chunk_ready = Signal(list, int, int, bool)
+
+    def __init__(self, path: str, store, chunk_size: int = 5000, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.store = store
+        self.chunk_size = chunk_size
+        self.loaded = 0
+
+        self._running = False
+        self._cancelled = False
+        self._slots = threading.Semaphore(self.MAX_PENDING_CHUNKS)
+        self._chunk_ready.connect(self._on_chunk_ready)
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            # thread-ul de citire nu trebuie sa ramana blocat la inchiderea aplicatiei
+            app.aboutToQuit.connect(self.cancel)
+
+    def start(self, pool: QThreadPool | None = None):
+        """Porneste citirea pe pool (implicit QThreadPool.globalInstance())."""
+        self._running = True
+        # de la pornire pana la ultima bucata adaugata in store
+        self._span = tracer.span("load", "io")
+        self._task = FunctionTask(self._read_file)
+        (pool or QThreadPool.globalInstance()).start(self._task)
+
+    def cancel(self):
+        """Opreste incarcarea (evenimentele deja adaugate raman in store)."""
+        self._cancelled = True
+        self._running = False
+        self._slots.release()
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def _read_file(self):
+        # ruleaza pe thread-ul din pool
+        try:
+            with open(self.path, "rb") as f, contextlib.ExitStack() as stack:
+                if is_binary_schedule(self.path):
+                    data = b""
+                    # un fisier gol nu poate fi mapat; BinaryScheduleFile il respinge cu mesajul lui
+                    if os.fstat(f.fileno()).st_size:
+                        data = stack.enter_context(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+                    schedule = BinaryScheduleFile(data)
+                    events = schedule.events()
+                    # generatorul tine un view peste mmap: se inchide inaintea lui (si la cancel)
+                    stack.callback(events.close)
+                    total = len(schedule)
+                    reader = None
+                else:
+                    reader = JsonEventReader(f)
+                    events = (CoreEvent.from_dict(ev) for ev in reader if ev.get("date"))
+                    total = os.fstat(f.fileno()).st_size
+
+                done = 0
+                while not self._cancelled:
+                    chunk: list[CoreEvent] = list(islice(events, self.chunk_size))
+                    done += len(chunk)
+                    last = len(chunk) < self.chunk_size
+
+                    self._slots.acquire()
+                    if self._cancelled:
+                        return
+                    self._chunk_ready.emit(chunk, reader.bytes_read if reader else done, total, last)
+                    if last:
+                        return
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            if not self._cancelled:
+                self.failed.emit(str(e))
+
+    def _on_chunk_ready(self, chunk: list, done_bytes: int, total_bytes: int, last: bool):
+        # ruleaza in UI
+        self._slots.release()
+        if self._cancelled:
+            return
+        if chunk:
+            self.store.add_many(chunk)
+            self.loaded += len(chunk)
+            self.chunk_loaded.emit(chunk)
+        self.progress.emit(done_bytes, total_bytes)
+        if last:
+            self._running = False
+            self._span.count(events=self.loaded)
+            self._span.end()
+            self.finished.emit(self.loaded)
@@ -0,0 +1,21 @@
+import json
+
+
+def _wait_for_saves(app, widget):
+    widget._io_pool.waitForDone()
+    app.processEvents()
+
+
+def test_autosave_on_another_file_during_compaction(app, make_widget, tmp_path):
+    w = make_widget([{"title": "A", "hour": 8, "duration": 1, "color": [1, 2, 3]}])
+    first, second = str(tmp_path / "a.json"), str(tmp_path / "b.json")
+
+    assert w.enable_autosave(first) is not None
+    # compactarea lui a.json inca ruleaza: b.json are propria salvare initiala
+    assert w.enable_autosave(second) is not None
+    _wait_for_saves(app, w)
+
+    for path in (first, second):
+        with open(path) as f:
+            assert [ev["title"] for ev in json.load(f)["events"]] == ["A"]
+    assert not w._compacting
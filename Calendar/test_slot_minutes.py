@@ -0,0 +1,70 @@
+import pytest
+from PySide6.QtCore import QPoint, Qt
+from PySide6.QtTest import QTest
+from PySide6.QtWidgets import QDialog
+
+
+@pytest.fixture
+def widget(make_widget):
+    # 09:15 - 09:45, intr-o grila de o ora
+    return make_widget([{
+        "title": "Curs", "hour": 9, "duration": 1, "start_minute": 555, "duration_minutes": 30,
+        "color": [10, 20, 30],
+    }])
+
+
+class _AcceptingDialog:
+    """Inlocuieste EventEditDialog: accepta imediat cu valorile date."""
+
+    def __init__(self, title):
+        self.title = title
+
+    def reset(self, **kwargs):
+        self.values = kwargs
+
+    def exec(self):
+        return QDialog.Accepted
+
+    def get_values(self):
+        v = self.values
+        return self.title, v["description"], v["locked"], v["repeat_count"], v["repeat_forever"]
+
+
+def _stored_minutes(w):
+    w._store_current_week()
+    return [
+        (e["title"], e.get("start_minute", e["hour"] * 60), e.get("duration_minutes", e["duration"] * 60))
+        for e in w.export_all_events()["events"]
+    ]
+
+
+def test_title_edit_keeps_minutes(widget):
+    table = widget.table
+    table._event_dialog = lambda: _AcceptingDialog("Seminar")
+    cell = QPoint(table.columnViewportPosition(0) + 10, table.rowViewportPosition(9) + 5)
+    QTest.mouseDClick(table.viewport(), Qt.LeftButton, Qt.NoModifier, cell)
+
+    assert _stored_minutes(widget) == [("Seminar", 555, 30)]
+
+
+def test_resize_requantizes_only_moved_edge(widget):
+    table = widget.table
+    ev = table.events_by_pos[(9, 0)]
+    with table._edit_command("Resize"):
+        table._move_event(ev, 9, 2)
+    table._mark_changed(ev)
+
+    assert _stored_minutes(widget) == [("Curs", 555, 105)]
+
+    table.undo()
+    assert _stored_minutes(widget) == [("Curs", 555, 30)]
+
+
+def test_drag_keeps_minutes(widget, drop):
+    table = widget.table
+    assert drop(table, table.events_by_pos[(9, 0)], 12, 0)
+
+    assert _stored_minutes(widget) == [("Curs", 735, 30)]
+
+    widget.undo()
+    assert _stored_minutes(widget) == [("Curs", 555, 30)]
@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from columnar_store import ColumnarEventStore
+from conftest import MONDAY
+from core_event import CoreEvent
+from event_store import EventStore
+from sqlite_store import SqliteEventStore
+
+
+@pytest.fixture
+def database(tmp_path):
+    path = str(tmp_path / "orar.sqlite")
+    store = SqliteEventStore(path)
+    store.add(CoreEvent("keep", MONDAY.toordinal(), 540))
+    store.close()
+    return path
+
+
+def _titles(store):
+    return sorted(ev.title for ev in store)
+
+
+def test_load_all_events_keeps_open_database(make_widget, database):
+    w = make_widget()
+    w.open_database(database)
+    w.load_all_events({"events": [{"title": "j", "hour": 10, "duration": 1, "date": MONDAY.isoformat()}]})
+
+    assert isinstance(w.store, EventStore) and _titles(w.store) == ["j"]
+    assert _titles(SqliteEventStore(database)) == ["keep"]
+
+
+def test_load_file_incrementally_keeps_open_database(app, make_widget, database, tmp_path):
+    other = tmp_path / "other.json"
+    other.write_text(json.dumps({"events": [{"title": "j", "hour": 10, "duration": 1, "date": MONDAY.isoformat()}]}))
+    w = make_widget()
+    w.open_database(database)
+
+    done = []
+    loader = w.load_file_incrementally(str(other))
+    loader.finished.connect(done.append)
+    loader.failed.connect(done.append)
+    while not done:
+        app.processEvents()
+
+    assert _titles(w.store) == ["j"]
+    assert _titles(SqliteEventStore(database)) == ["keep"]
+
+
+def test_save_to_open_database_keeps_connection(app, make_widget, database):
+    w = make_widget()
+    w.open_database(database)
+    w.save_file_in_background(database)
+    w._io_pool.waitForDone()
+    app.processEvents()
+
+    # editarile de dupa Save ajung tot in fisierul de pe disc
+    w.store.add(CoreEvent("after", MONDAY.toordinal(), 600))
+    assert _titles(SqliteEventStore(database)) == ["after", "keep"]
+
+
+def test_columnar_store_keeps_long_events_and_rejects_overflow():
+    store = ColumnarEventStore()
+    # 40 de zile in minute: depaseste 16 biti
+    store.add(CoreEvent("lung", MONDAY.toordinal(), 540, 40 * 24 * 60))
+
+    with pytest.raises(ValueError, match="duration_minutes"):
+        store.add(CoreEvent("prea lung", MONDAY.toordinal(), 540, 2 ** 40))
+
+    assert [(ev.title, ev.duration_minutes) for ev in store] == [("lung", 40 * 24 * 60)]
@@ -0,0 +1,42 @@
+import pytest
+
+
+@pytest.fixture
+def widget(make_widget):
+    return make_widget([
+        {"title": "A", "hour": 8, "duration": 1, "color": [1, 2, 3]},
+        {"title": "B", "hour": 14, "duration": 2, "color": [4, 5, 6]},
+    ])
+
+
+def _layout(table):
+    return sorted((key, ev.title, ev.duration) for key, ev in table.events_by_pos.items())
+
+
+def test_failed_undo_leaves_table_untouched(widget):
+    table = widget.table
+    a = table.events_by_pos[(8, 0)]
+    b = table.events_by_pos[(14, 0)]
+    with table._edit_command("Move"):
+        table._move_event(b, 16, 2)
+        table._move_event(a, 10, 1)
+
+    # B e mutat din afara istoricului: a doua delta a undo-ului nu se mai potriveste
+    table._move_event(b, 18, 2)
+    before = _layout(table)
+
+    assert not table.undo()
+    assert _layout(table) == before
+    assert not table.history.can_undo() and not table.history.can_redo()
+
+
+def test_drop_on_own_position_records_nothing(widget, drop):
+    table = widget.table
+    emitted = []
+    table.changed.connect(lambda: emitted.append(True))
+
+    assert drop(table, table.events_by_pos[(14, 0)], 14, 0)
+
+    assert _layout(table) == [((8, 0), "A", 1), ((14, 0), "B", 2)]
+    assert not table.history.can_undo()
+    assert not table.is_dirty() and not emitted
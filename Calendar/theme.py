@@ -24,6 +24,30 @@ APP_DARK_STYLE = """
             margin-top: 8px;
             font-size: 13px;
         }
+        /* DIALOGUL DE EDITARE (EventEditDialog); butoanele folosesc stilul QPushButton */
+        EventEditDialog QLineEdit, EventEditDialog QTextEdit {
+            background-color: #393e46;
+            border: 1px solid #4b4f57;
+            border-radius: 6px;
+            padding: 6px;
+            font-size: 13px;
+            color: #f5f5f5;
+        }
+        EventEditDialog QLineEdit:focus, EventEditDialog QTextEdit:focus {
+            border: 1px solid #00adb5;
+        }
+        EventEditDialog QCheckBox {
+            font-size: 12px;
+            margin-top: 6px;
+        }
+        EventEditDialog QFrame {
+            background-color: #393e46;
+            color: #393e46;
+        }
+        EventEditDialog QFrame[frameShape="4"] {  /* 4 = HLine */
+            background-color: #393e46;
+            max-height: 1px;
+        }
         QLabel#WeekLabel {
             color: #f5f5f5;
             font-size: 13px;
@@ -65,8 +89,8 @@ APP_DARK_STYLE = """
             background-color: #444;
         }
 
-        /* TABELUL DE ORAR (ScheduleTable) */
-        QTableWidget {
+        /* TABELUL DE ORAR (ScheduleTable / ScheduleView) */
+        QTableView {
             background-color: #222831;
             alternate-background-color: #1f252d;
             color: #f5f5f5;
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from core_event import MINUTES_PER_DAY, MINUTES_PER_HOUR
+
+# marimile de slot (randuri din tabel) permise, in minute
+SLOT_SIZES = (5, 15, 30, 60)
+DEFAULT_SLOT_MINUTES = 60
+
+# inaltimea unui rand: 40 px pentru o ora, dar cel putin cat un rand de text
+HOUR_ROW_HEIGHT = 40
+MIN_ROW_HEIGHT = 16
+
+
+def check_slot_minutes(slot_minutes: int) -> int:
+    if slot_minutes not in SLOT_SIZES:
+        raise ValueError(f"Slot de {slot_minutes} minute nesuportat (permise: {SLOT_SIZES})")
+    return slot_minutes
+
+
+def slot_rows(slot_minutes: int) -> int:
+    """Numarul de randuri ale unei zile (24 pentru ore, 288 pentru slot-uri de 5 minute)."""
+    return MINUTES_PER_DAY // slot_minutes
+
+
+def row_height(slot_minutes: int) -> int:
+    return max(MIN_ROW_HEIGHT, HOUR_ROW_HEIGHT * slot_minutes // MINUTES_PER_HOUR)
+
+
+def slot_time(row: int, slot_minutes: int) -> str:
+    """Ora la care incepe randul row, ca "HH:MM" (randul de dupa ultimul = "24:00")."""
+    minute = row * slot_minutes
+    return f"{minute // MINUTES_PER_HOUR:02d}:{minute % MINUTES_PER_HOUR:02d}"
+
+
+def slot_labels(slot_minutes: int) -> list[str]:
+    """Textele header-ului vertical: "9:00", "9:15", ..."""
+    labels = []
+    for row in range(slot_rows(slot_minutes)):
+        minute = row * slot_minutes
+        labels.append(f"{minute // MINUTES_PER_HOUR}:{minute % MINUTES_PER_HOUR:02d}")
+    return labels
@@ -1,34 +1,118 @@
 from __future__ import annotations
 
+import os
+import time
 from datetime import date, timedelta
+from typing import TYPE_CHECKING
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QTableWidgetItem
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor, QBrush
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel
+from PySide6.QtCore import Qt, QThreadPool, QTimer
 
 from schedule_table import ScheduleTable
 from models import CalendarEvent
+from core_event import CoreEvent
+from event_store import EventStore
+from week_layout_cache import WeekLayoutCache, WeekLayout
+from instrumentation import tracer
+from time_slots import DEFAULT_SLOT_MINUTES, check_slot_minutes, slot_rows
+
+# store-urile alternative si I/O-ul pe fisiere sunt importate la prima folosire
+# (nu sunt necesare pentru primul frame al aplicatiei)
+if TYPE_CHECKING:
+    from background_io import BackgroundSaver
+    from change_journal import ChangeJournal
+    from streaming_loader import StreamingLoader
 
 
 class WeekCalendarWidget(QWidget):
     """
     Widget care afiseaza un ScheduleTable pentru o saptamana si pastreaza
     evenimentele pentru toate saptamanile (events_by_date).
+
+    view_mode alege widget-ul pentru saptamana:
+      - "table": ScheduleTable (QTableWidget, implicit)
+      - "model": ScheduleView (QTableView + ScheduleModel, cu span-uri)
+      - "painted": ScheduleView cu evenimentele desenate de EventLayer
+
+    store_backend alege store-ul global:
+      - "dict": EventStore (dict de liste de CoreEvent, implicit)
+      - "columnar": ColumnarEventStore (array-uri pe coloane, pentru arhive foarte mari)
+      - "sqlite": SqliteEventStore (baza de date db_path, citita saptamana cu saptamana)
+
+    slot_minutes = cate minute are un rand al tabelului (5, 15, 30 sau 60); store-ul
+    si fisierele tin timpul in minute, deci marimea slot-ului tine doar de afisare.
     """
 
-    def __init__(self, parent=None, start_monday: date | None = None):
+    def __init__(
+        self,
+        parent=None,
+        start_monday: date | None = None,
+        view_mode: str = "table",
+        store_backend: str = "dict",
+        db_path: str = ":memory:",
+        slot_minutes: int = DEFAULT_SLOT_MINUTES,
+    ):
         super().__init__(parent)
+        self.slot_minutes = check_slot_minutes(slot_minutes)
 
         self.current_monday: date = self._ensure_monday(start_monday or date.today())
 
-        # Store global: cheie = "YYYY-MM-DD", valoare = lista de dict-uri de event
-        # dict-urile au schema: {
+        # Store global: cheie = "YYYY-MM-DD", valoare = lista de CoreEvent
+        # (compacte, fara QColor); la Save/Load se convertesc in dict-uri cu schema: {
         #     "title", "hour", "duration", "color": (r,g,b),
-        #     "description", "locked"
-        # }
-        self.events_by_date: dict[str, list[dict]] = {}
-
-        self.table = ScheduleTable(rows=24, cols=7)
+        #     "description", "locked", "repeat_count", "repeat_forever", "date"
+        # } (+ "start_minute", "duration_minutes" pentru evenimentele care nu sunt la ora fixa)
+        # Modificarile trec prin self.store, care tine si indexul de recurente.
+        if store_backend == "sqlite":
+            from sqlite_store import SqliteEventStore
+            self.store = SqliteEventStore(db_path)
+        elif store_backend == "columnar":
+            from columnar_store import ColumnarEventStore
+            self.store = ColumnarEventStore()
+        else:
+            self.store = EventStore()
+
+        # True -> la schimbarea saptamanii se aplica doar diferentele fata de layout-ul afisat;
+        # False -> tabelul e reconstruit complet (util pentru comparatii de performanta)
+        self.incremental_layout = True
+        # durata ultimei schimbari de saptamana, in milisecunde
+        self.last_week_switch_ms = 0.0
+
+        # layout-urile saptamanilor deja calculate (LRU), invalidate la orice modificare din store
+        self._layout_cache = WeekLayoutCache()
+        self.store.subscribe(self._layout_cache.invalidate)
+
+        # saptamanile vecine sunt pre-calculate cand aplicatia e libera (timer cu timeout 0)
+        self._prefetch_timer = QTimer(self)
+        self._prefetch_timer.setSingleShot(True)
+        self._prefetch_timer.setInterval(0)
+        self._prefetch_timer.timeout.connect(self._prefetch_adjacent_weeks)
+
+        # incarcarea incrementala in curs (vezi load_file_incrementally)
+        self._loader: StreamingLoader | None = None
+        # Save/Load ruleaza pe un singur thread separat, deci in ordinea cererilor
+        self._io_pool = QThreadPool(self)
+        self._io_pool.setMaxThreadCount(1)
+
+        # autosave: jurnalul de modificari (vezi enable_autosave) si pragul de compactare
+        self._journal: ChangeJournal | None = None
+        # fisierele principale ale caror compactari ruleaza in fundal (una per jurnal)
+        self._compacting: set[str] = set()
+        self.autosave_compact_bytes = 256 * 1024
+        # modificarile unei operatii sunt scrise o data, dupa ce operatia s-a terminat
+        self._autosave_timer = QTimer(self)
+        self._autosave_timer.setSingleShot(True)
+        self._autosave_timer.setInterval(0)
+        self._autosave_timer.timeout.connect(self._autosave)
+
+        if view_mode in ("model", "painted"):
+            from schedule_view import ScheduleView
+            self.table = ScheduleView(
+                rows=slot_rows(slot_minutes), cols=7, painted=(view_mode == "painted"), slot_minutes=slot_minutes
+            )
+        else:
+            self.table = ScheduleTable(rows=slot_rows(slot_minutes), cols=7, slot_minutes=slot_minutes)
+        self.table.changed.connect(self._autosave_timer.start)
 
         # -------- header navigare --------
         nav_layout = QHBoxLayout()
@@ -57,6 +141,11 @@ class WeekCalendarWidget(QWidget):
         self._update_headers_and_label()
         self._load_current_week()
 
+    @property
+    def events_by_date(self) -> dict[str, list[CoreEvent]]:
+        """Evenimentele de baza, grupate pe data (doar pentru citire; modificarile trec prin store)."""
+        return self.store.events_by_date
+
     # ---------------- helpers interne ----------------
 
     def _ensure_monday(self, any_day: date) -> date:
@@ -82,120 +171,193 @@ class WeekCalendarWidget(QWidget):
             f"Week: {self.current_monday.strftime('%d %b %Y')} - {week_end.strftime('%d %b %Y')}"
         )
         self._update_disabled_columns()
+        # comenzile de undo retin saptamana in care au fost facute
+        self.table.history_key = self.current_monday
 
     # ---------------- store <-> tabel ----------------
 
     def _store_current_week(self):
         """
-        Copiaza evenimentele din tabel in store-ul global (events_by_date)
-        pentru cele 7 zile ale saptamanii curente.
+        Scrie in store-ul global (events_by_date) doar modificarile facute in tabel
+        de la ultima sincronizare (evenimente create, mutate, redimensionate, impartite,
+        editate sau sterse). O saptamana nemodificata nu costa nimic.
         Salveaza DOAR evenimentele de baza (nu si aparitiile generate).
+        Returneaza datele ("YYYY-MM-DD") ale caror evenimente s-au schimbat.
         """
-        # stergem evenimentele baza pentru zilele acestei saptamani
-        for d in self._week_dates():
-            self.events_by_date.pop(d.isoformat(), None)
-
-        # re-adaugam evenimentele de baza din tabel
-        for (row, col), ev in self.table.events_by_pos.items():
-            # Sarim peste aparitiile generate de recurenta
-            if ev.is_generated:
-                continue
-
-            ev_date = self.current_monday + timedelta(days=ev.day_col)
-            dstr = ev_date.isoformat()
-            color_tuple = (ev.color.red(), ev.color.green(), ev.color.blue())
-
-            day_events = self.events_by_date.setdefault(dstr, [])
-            day_events.append({
-                "title": ev.title,
-                "hour": ev.start_row,
-                "duration": ev.duration,
-                "color": color_tuple,
-                "description": ev.description,
-                "locked": ev.locked,
-                "repeat_count": ev.repeat_count,
-                "repeat_forever": ev.repeat_forever,
-            })
+        touched: set[str] = set()
+        if not self.table.is_dirty():
+            return touched
+        changed, removed = self.table.take_changes()
+
+        # toate modificarile intr-un batch (o singura tranzactie pentru SqliteEventStore)
+        with self.store.batch():
+            for ev in removed:
+                # aparitiile generate nu sunt in store; nici evenimentele noi inca
+                if ev.is_generated or ev.source is None:
+                    continue
+                self.store.remove(ev.source)
+                touched.add(ev.source.dstr)
+
+            for ev in changed:
+                if ev.is_generated:
+                    continue
+                # un eveniment modificat si apoi sters e tratat deja la "removed"
+                if self.table.events_by_pos.get((ev.start_row, ev.day_col)) is not ev:
+                    continue
+
+                if ev.source is not None:
+                    self.store.remove(ev.source)
+                    touched.add(ev.source.dstr)
+                ev.source = ev.to_core(self._event_day(ev), self.slot_minutes)
+                self.store.add(ev.source)
+                touched.add(ev.source.dstr)
+        return touched
+
+    def flush(self):
+        """Scrie in store (si in jurnal) modificarile din tabel (ex. inainte de inchiderea aplicatiei)."""
+        self._autosave_timer.stop()
+        self._autosave()
+
+    def _event_day(self, ev: CalendarEvent) -> int:
+        """Ziua (ordinalul datei) unui eveniment din saptamana curenta."""
+        return self.current_monday.toordinal() + ev.day_col
+
+    def _week_layout(self, monday: date) -> WeekLayout:
+        """Aparitiile din saptamana monday, luate din cache daca exista."""
+        layout = self._layout_cache.get(monday)
+        if layout is None:
+            layout = self.store.week_occurrences(monday)
+            self._layout_cache.put(monday, layout)
+        return layout
+
+    def _prefetch_adjacent_weeks(self):
+        """Pre-calculeaza layout-urile saptamanii anterioare si urmatoare."""
+        for delta in (7, -7):
+            monday = self.current_monday + timedelta(days=delta)
+            if monday not in self._layout_cache:
+                self._layout_cache.put(monday, self.store.week_occurrences(monday))
 
     def _load_current_week(self):
         """
         Reincarca in tabel evenimentele pentru saptamana curenta, inclusiv recurentele.
         """
-        self.table.reset_table()
-        week_days = self._week_dates()  # list[date]
-
-        for base_date_str, events in self.events_by_date.items():
-            base_date = date.fromisoformat(base_date_str)
-
-            for ev_dict in events:
-                title = ev_dict.get("title", "")
-                hour = ev_dict.get("hour", 0)
-                duration = ev_dict.get("duration", 1)
-                color_tuple = ev_dict.get("color", (255, 255, 0))
-                description = ev_dict.get("description", "")
-                locked = ev_dict.get("locked", False)
-                repeat_count = max(1, ev_dict.get("repeat_count", 1))
-                repeat_forever = ev_dict.get("repeat_forever", False)
-
-                color = QColor(*color_tuple)
-                brush = QBrush(color)
-
-                for col_idx, current_date in enumerate(week_days):
-                    diff_days = (current_date - base_date).days
-                    if diff_days < 0:
-                        continue
-                    if diff_days % 7 != 0:
-                        continue
-
-                    k = diff_days // 7  # a cata aparitie (0 = event de baza in saptamana sa)
-                    if k == 0:
-                        if repeat_count < 1 and not repeat_forever:
-                            continue
-                    else:
-                        if not repeat_forever and k >= repeat_count:
-                            continue  # in afara numarului de repetari
-
-                    is_generated = (k > 0)
-
-                    item = QTableWidgetItem(title)
-                    item.setTextAlignment(Qt.AlignCenter)
-                    item.setBackground(brush)
-                    item.setData(Qt.BackgroundRole, brush)
-
-                    self.table.setItem(hour, col_idx, item)
-                    self.table.setSpan(hour, col_idx, duration, 1)
-
-                    ev = CalendarEvent(
-                        title=title,
-                        start_row=hour,
-                        day_col=col_idx,
-                        duration=duration,
-                        color=color,
-                        description=description,
-                        locked=locked,
-                        repeat_count=repeat_count,
-                        repeat_forever=repeat_forever,
-                        is_generated=is_generated,
-                    )
-                    self.table.events_by_pos[(hour, col_idx)] = ev
-
-        self.table.viewport().update()
+        with tracer.span("load_week") as span:
+            events: list[CalendarEvent] = []
+
+            # layout-ul vine din cache (de obicei pre-calculat) sau din indexul de recurente
+            span.count(cached=self.current_monday in self._layout_cache)
+            for col_idx, core, k in self._week_layout(self.current_monday):
+                events.append(CalendarEvent.from_core(core, col_idx, k > 0, self.slot_minutes))
+
+            if self.incremental_layout:
+                touched = self.table.apply_week_layout(events)
+            else:
+                self.table.load_events(events)
+                touched = len(events)
+            self.table.viewport().update()
+            span.count(events=len(events), blocks_touched=touched)
+
+        self._prefetch_timer.start()
+
+    # ---------------- autosave (jurnal de modificari) ----------------
+
+    def _autosave(self):
+        """Scrie in store modificarile ultimei operatii si, cu autosave activ, le adauga in jurnal."""
+        touched = self._store_current_week()
+        if self._journal is None or not touched:
+            return
+        self._journal.append({dstr: self.store.events_on(dstr) for dstr in touched})
+        if self._journal.size >= self.autosave_compact_bytes:
+            self.compact_journal()
+
+    def enable_autosave(self, path: str) -> BackgroundSaver | None:
+        """
+        Porneste autosave pentru fisierul principal path (JSON sau .calb): fiecare
+        operatie este adaugata in <path>.journal, compactat periodic in fundal in path.
+        Returneaza salvarea initiala a fisierului principal (starea curenta a store-ului),
+        sau None daca o compactare a aceluiasi fisier ruleaza deja.
+        """
+        from change_journal import ChangeJournal
+
+        self.disable_autosave()
+        self._journal = ChangeJournal(path)
+        return self.compact_journal()
+
+    def disable_autosave(self):
+        """Opreste autosave-ul (dupa ce modificarile in curs sunt scrise in jurnal)."""
+        if self._journal is None:
+            return
+        self.flush()
+        self._journal.close()
+        self._journal = None
+
+    def autosave_path(self) -> str | None:
+        return self._journal.schedule_path if self._journal is not None else None
+
+    def compact_journal(self) -> BackgroundSaver | None:
+        """Scrie in fundal snapshot-ul store-ului in fisierul principal si goleste jurnalul."""
+        if self._journal is None or self._journal.schedule_path in self._compacting:
+            return None
+        from background_io import BackgroundSaver
+
+        self.flush()
+        snapshot = self.snapshot_events()
+        journal = self._journal
+        journal.start_compaction()
+        self._compacting.add(journal.schedule_path)
+
+        saver = BackgroundSaver(snapshot, journal.schedule_path, self)
+        saver.finished.connect(lambda _path: self._on_compacted(journal))
+        saver.failed.connect(lambda _error: self._on_compaction_failed(journal))
+        saver.finished.connect(saver.deleteLater)
+        saver.failed.connect(saver.deleteLater)
+        saver.start(self._io_pool)
+        return saver
+
+    def _on_compacted(self, journal: ChangeJournal):
+        journal.finish_compaction()
+        self._compacting.discard(journal.schedule_path)
+
+    def _on_compaction_failed(self, journal: ChangeJournal):
+        # inregistrarile raman in <orar>.journal.compacting si intra in compactarea urmatoare
+        self._compacting.discard(journal.schedule_path)
 
     # ---------------- navigare saptamani ----------------
 
     def _go_prev_week(self):
         """Navigheaza la saptamana anterioara, pastrand evenimentele in store."""
-        self._store_current_week()
-        self.current_monday -= timedelta(days=7)
-        self._update_headers_and_label()
-        self._load_current_week()
+        self._switch_week(-7)
 
     def _go_next_week(self):
         """Navigheaza la saptamana urmatoare, pastrand evenimentele in store."""
-        self._store_current_week()
-        self.current_monday += timedelta(days=7)
-        self._update_headers_and_label()
-        self._load_current_week()
+        self._switch_week(7)
+
+    def _switch_week(self, delta_days: int):
+        """Salveaza saptamana curenta, se muta cu delta_days si incarca noua saptamana (masurand durata)."""
+        started = time.perf_counter()
+        with tracer.span("week_switch") as span:
+            span.count(dates_stored=len(self._store_current_week()))
+            self.current_monday += timedelta(days=delta_days)
+            self._update_headers_and_label()
+            self._load_current_week()
+        self.last_week_switch_ms = (time.perf_counter() - started) * 1000.0
+
+    # ---------------- undo / redo ----------------
+
+    def undo(self) -> bool:
+        """Anuleaza ultima modificare din tabel, trecand intai la saptamana in care a fost facuta."""
+        return self._replay_history(self.table.history.next_undo(), self.table.undo)
+
+    def redo(self) -> bool:
+        """Reface ultima modificare anulata, trecand intai la saptamana in care a fost facuta."""
+        return self._replay_history(self.table.history.next_redo(), self.table.redo)
+
+    def _replay_history(self, command, apply) -> bool:
+        if command is None:
+            return False
+        if command.key is not None and command.key != self.current_monday:
+            self._switch_week((command.key - self.current_monday).days)
+        return apply()
 
     # ---------------- serializare globala pentru Save/Load ----------------
 
@@ -204,46 +366,175 @@ class WeekCalendarWidget(QWidget):
         Returneaza un dict serializabil JSON cu toate evenimentele
         (pentru toate saptamanile/lunile).
         """
-        # mai intai salvam ce e in saptamana curenta in store
-        self._store_current_week()
+        return {"events": [ev.to_dict() for ev in self.snapshot_events()]}
 
-        all_events: list[dict] = []
-        for dstr, events in self.events_by_date.items():
-            for ev in events:
-                ev_copy = ev.copy()
-                ev_copy["date"] = dstr  # adaugam cheia de data
-                all_events.append(ev_copy)
+    def snapshot_events(self) -> tuple[CoreEvent, ...]:
+        """
+        Snapshot imutabil al tuturor evenimentelor de baza (dupa ce saptamana curenta
+        a fost scrisa in store). CoreEvent-urile nu se modifica pe loc, deci
+        snapshot-ul poate fi folosit in alt thread cat timp utilizatorul editeaza.
+        """
+        self._store_current_week()
+        return tuple(self.store)
 
-        return {"events": all_events}
+    def save_file_in_background(self, path: str) -> BackgroundSaver | None:
+        """
+        Scrie toate evenimentele in path pe un thread separat (fisier temporar + os.replace).
+        Daca path este baza de date deschisa, modificarile sunt scrise direct in ea si
+        se returneaza None.
+        """
+        from background_io import BackgroundSaver
+        from change_journal import ChangeJournal
+
+        if self._is_open_database(path):
+            # un fisier nou mutat peste baza deschisa ar lasa conexiunea sa scrie intr-un fisier sters
+            self.flush()
+            return None
+        if self._journal is not None and path == self._journal.schedule_path:
+            # cu autosave activ pe acelasi fisier, Save este o compactare a jurnalului
+            saver = self.compact_journal()
+            if saver is not None:
+                return saver
+            # o compactare e deja in curs; jurnalul ramane valid (inregistrarile sunt idempotente)
+        else:
+            # un jurnal vechi al fisierului suprascris nu mai corespunde continutului nou
+            ChangeJournal.discard(path)
+        saver = BackgroundSaver(self.snapshot_events(), path, self)
+        saver.finished.connect(saver.deleteLater)
+        saver.failed.connect(saver.deleteLater)
+        saver.start(self._io_pool)
+        return saver
+
+    def _is_open_database(self, path: str) -> bool:
+        """True daca path este fisierul bazei de date SQLite folosite ca store."""
+        from sqlite_store import SqliteEventStore
+
+        if not isinstance(self.store, SqliteEventStore) or self.store.path == ":memory:":
+            return False
+        try:
+            return os.path.samefile(self.store.path, path)
+        except OSError:
+            return False
+
+    def iter_occurrences(self, start_date: date, end_date: date):
+        """
+        Itereaza lazy toate aparitiile (inclusiv recurentele) dintre start_date si
+        end_date, fara sa treaca prin tabel saptamana cu saptamana.
+        """
+        self._store_current_week()
+        return self.store.iter_occurrences(start_date, end_date)
 
     def load_all_events(self, data: dict):
         """
         Reincarca toate evenimentele dintr-un dict JSON (formatul export_all_events)
         si afiseaza doar saptamana curenta.
         """
-        self.events_by_date.clear()
-
-        for ev in data.get("events", []):
-            dstr = ev.get("date")
-            if not dstr:
-                continue
-            ev_copy = {
-                "title": ev.get("title", ""),
-                "hour": ev.get("hour", 0),
-                "duration": ev.get("duration", 1),
-                "color": tuple(ev.get("color", (255, 255, 0))),
-                "description": ev.get("description", ""),
-                "locked": ev.get("locked", False),
-                "repeat_count": max(1, ev.get("repeat_count", 1)),
-                "repeat_forever": ev.get("repeat_forever", False),
-            }
-            day_events = self.events_by_date.setdefault(dstr, [])
-            day_events.append(ev_copy)
+        # modificarile nesalvate din tabel apartin calendarului vechi
+        self.disable_autosave()
+        self.table.take_changes()
+        self.table.history.clear()
+        self._clear_store()
+
+        self.store.add_many(
+            CoreEvent.from_dict(ev) for ev in data.get("events", []) if ev.get("date")
+        )
 
         # re-desenam saptamana curenta
         self._update_headers_and_label()
         self._load_current_week()
 
+    def _clear_store(self):
+        """
+        Goleste store-ul inainte de incarcarea unui alt fisier. Un store care tine fisierul
+        userului (baza SQLite, .calb mapat) nu este golit: e inchis si inlocuit cu un EventStore nou.
+        """
+        if getattr(self.store, "path", ":memory:") == ":memory:":
+            self.store.clear()
+        else:
+            self._use_store(EventStore)
+
+    def open_database(self, path: str):
+        """
+        Foloseste ca store baza de date SQLite din path (creata daca nu exista).
+        Nu se citeste nimic in avans: se interogheaza doar saptamana afisata.
+        """
+        from sqlite_store import SqliteEventStore
+
+        self._use_store(lambda: SqliteEventStore(path))
+
+    def open_mapped(self, path: str):
+        """
+        Deschide fisierul .calb din path cu mmap, fara sa-l incarce: se decodeaza
+        doar saptamanile afisate (vezi MappedEventStore). Fisierul nu este modificat;
+        la final se aplica jurnalul de autosave ramas langa fisier, daca exista.
+        """
+        from mapped_store import MappedEventStore
+
+        self._use_store(lambda: MappedEventStore(path))
+        self._recover_journal(path)
+
+    def _use_store(self, make_store):
+        """Inlocuieste store-ul global cu cel creat de make_store() si redeseneaza saptamana."""
+        if self._loader is not None:
+            self._loader.cancel()
+        self.disable_autosave()
+        self.table.take_changes()
+        self.table.history.clear()
+
+        old_store = self.store
+        with tracer.span("open_store", "io"):
+            self.store = make_store()
+        self.store.subscribe(self._layout_cache.invalidate)
+        self._layout_cache.clear()
+        # store-urile pe fisiere (SqliteEventStore, MappedEventStore) elibereaza fisierul
+        if hasattr(old_store, "close"):
+            old_store.close()
+
+        self._update_headers_and_label()
+        self._load_current_week()
+
+    def load_file_incrementally(self, path: str, chunk_size: int = 5000) -> StreamingLoader:
+        """
+        Incarca un fisier de orar (JSON sau .calb) bucata cu bucata;
+        fisierul este citit si decodat pe un thread separat.
+
+        Saptamana curenta este redesenata de indata ce apare in fisier un eveniment
+        care o afecteaza; semnalele loader-ului returnat raporteaza progresul.
+        La final se aplica jurnalul de autosave ramas langa fisier, daca exista.
+        """
+        from streaming_loader import StreamingLoader
+
+        if self._loader is not None:
+            self._loader.cancel()
+
+        self.disable_autosave()
+        self.table.take_changes()
+        self.table.history.clear()
+        self._clear_store()
+        self._update_headers_and_label()
+        self._load_current_week()
+
+        self._loader = StreamingLoader(path, self.store, chunk_size, self)
+        self._loader.chunk_loaded.connect(self._on_chunk_loaded)
+        self._loader.finished.connect(lambda _count: self._recover_journal(path))
+        self._loader.start(self._io_pool)
+        return self._loader
+
+    def _recover_journal(self, path: str):
+        """Aplica modificarile din jurnalul ramas langa path (autosave inainte de o oprire)."""
+        from change_journal import ChangeJournal
+
+        if ChangeJournal.replay(path, self.store):
+            self._store_current_week()
+            self._load_current_week()
+
+    def _on_chunk_loaded(self, events: list[CoreEvent]):
+        """Redeseneaza saptamana curenta daca bucata incarcata o afecteaza."""
+        first_day = self.current_monday.toordinal()
+        if any(ev.active_between(first_day, first_day + 6) for ev in events):
+            self._store_current_week()
+            self._load_current_week()
+
     def _update_disabled_columns(self):
         """Calculeaza ce zile din saptamana curenta sunt in trecut si le dezactiveaza in tabel."""
         today = date.today()
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from datetime import date
+from typing import List, Optional, Tuple
+
+from core_event import CoreEvent
+from recurrence_index import week_number
+
+# un layout = lista de aparitii pozitionate (coloana zilei, eveniment, k)
+WeekLayout = List[Tuple[int, CoreEvent, int]]
+
+
+class WeekLayoutCache:
+    """
+    Cache LRU (marginit) pentru layout-urile calculate ale saptamanilor, cu cheie = data de luni.
+
+    invalidate() este apelat la fiecare modificare din EventStore si scoate doar
+    saptamanile in care evenimentul modificat poate aparea.
+    """
+
+    def __init__(self, max_weeks: int = 32):
+        self.max_weeks = max_weeks
+        self._layouts: OrderedDict[date, WeekLayout] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, monday: date) -> bool:
+        return monday in self._layouts
+
+    def get(self, monday: date) -> Optional[WeekLayout]:
+        """Layout-ul din cache pentru saptamana monday (sau None) si il marcheaza ca recent."""
+        layout = self._layouts.get(monday)
+        if layout is None:
+            self.misses += 1
+            return None
+        self._layouts.move_to_end(monday)
+        self.hits += 1
+        return layout
+
+    def put(self, monday: date, layout: WeekLayout):
+        """Adauga un layout, eliminand cel mai vechi folosit daca se depaseste max_weeks."""
+        self._layouts[monday] = layout
+        self._layouts.move_to_end(monday)
+        while len(self._layouts) > self.max_weeks:
+            self._layouts.popitem(last=False)
+
+    def clear(self):
+        self._layouts.clear()
+
+    def invalidate(self, ev: Optional[CoreEvent]):
+        """
+        Scoate din cache saptamanile afectate de evenimentul ev.
+        Cu ev = None (store golit) goleste tot cache-ul.
+        """
+        if ev is None:
+            self.clear()
+            return
+
+        start_week = (ev.day - 1) // 7
+        if ev.repeat_forever:
+            end_week = None
+        else:
+            end_week = start_week + max(1, ev.repeat_count) - 1
+
+        for monday in list(self._layouts):
+            week = week_number(monday)
+            if week >= start_week and (end_week is None or week <= end_week):
+                del self._layouts[monday]